@@ -0,0 +1,412 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import GasAttributesCache
+import GasAttributesCore
+
+# Manifest keys passed straight through to generate_code
+GENERATOR_OPTIONS = tuple(GasAttributesCore.DEFAULT_OPTIONS)
+
+SHARDING_KEYS = ("shards", "max_shard_size", "shard_by")
+
+
+def split_lines(value):
+    # Manifest entries accept either a list or the raw text stored by settings.json
+    if isinstance(value, str):
+        value = value.splitlines()
+    return [line.strip() for line in value if line and line.strip()]
+
+
+def normalize_entry(entry, defaults):
+    merged = dict(defaults)
+    merged.update(entry)
+
+    replicated = split_lines(merged.get("replicated", []))
+    nonreplicated = split_lines(merged.get("nonreplicated", []))
+
+    # Remove duplicates while preserving order
+    seen = set()
+    all_attrs = []
+    for attr in replicated + nonreplicated:
+        if attr not in seen:
+            seen.add(attr)
+            all_attrs.append(attr)
+
+    replicated_set = set(replicated)
+    replicated = [a for a in all_attrs if a in replicated_set]
+
+    class_name = (merged.get("class_name") or "").strip()
+    base = (merged.get("base_class") or "").strip()
+
+    if not class_name:
+        raise ValueError("Missing class_name.")
+    if any(not (c.isalnum() or c == "_") for c in class_name):
+        raise ValueError(f"{class_name}: class name must be letters, digits, or underscore only.")
+    if not base:
+        raise ValueError(f"{class_name}: missing base_class.")
+    if not all_attrs:
+        raise ValueError(f"{class_name}: no attributes.")
+
+    _, attribute_errors = GasAttributesCore.parse_attribute_lines(all_attrs)
+    if attribute_errors:
+        raise ValueError(f"{class_name}: " + "; ".join(attribute_errors))
+
+    job = {
+        "class_name": class_name,
+        "base_class": base,
+        "api_macro": (merged.get("api_macro") or "").strip(),
+        "attributes": all_attrs,
+        "replicated": replicated,
+    }
+    options = {name: merged[name] for name in GENERATOR_OPTIONS if name in merged}
+    GasAttributesCore.resolve_options(options)
+    if options:
+        job["options"] = options
+
+    # The tags ini is only produced for entries that ask for it
+    if "tag_prefix" in merged:
+        job["tag_prefix"] = (merged.get("tag_prefix") or "").strip()
+    if "stages" in merged:
+        job["stages"] = list(GasAttributesCore.resolve_stages(merged["stages"], job.get("tag_prefix")))
+    if merged.get("template_dir"):
+        job["template_dir"] = merged["template_dir"]
+    # An empty output_dir (e.g. from settings.json) keeps the default directory
+    output_dir = entry.get("output_dir") or defaults.get("output_dir")
+    if output_dir:
+        job["output_dir"] = output_dir
+
+    # Entries with any sharding key are split into several classes over a shared enum header
+    sharding = {name: merged[name] for name in SHARDING_KEYS if name in merged}
+    if sharding:
+        GasAttributesCore.resolve_sharding(**sharding)
+        job["sharding"] = sharding
+    elif len(all_attrs) > GasAttributesCore.MAX_ENUM_ATTRIBUTES:
+        raise ValueError(
+            f"{class_name}: {len(all_attrs)} attributes don't fit in one uint8 enum (at most "
+            f"{GasAttributesCore.MAX_ENUM_ATTRIBUTES}); set shards or max_shard_size"
+        )
+    return job
+
+
+def load_manifest(path, defaults=None):
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if isinstance(manifest, list):
+        manifest_defaults, entries = {}, manifest
+    elif "class_name" in manifest:
+        # A settings.json saved by the UI describes a single class
+        manifest_defaults, entries = {}, [manifest]
+    else:
+        manifest_defaults, entries = manifest.get("defaults", {}), manifest.get("classes", [])
+    defaults = dict(defaults or {}, **manifest_defaults)
+
+    jobs = []
+    errors = []
+    for index, entry in enumerate(entries):
+        try:
+            job = normalize_entry(entry, defaults)
+        except ValueError as e:
+            errors.append(f"entry {index}: {e}")
+            continue
+        # Template and output directories are relative to the manifest, not to the working directory
+        for key in ("template_dir", "output_dir"):
+            if key in job:
+                job[key] = os.path.join(os.path.dirname(path), job[key])
+        jobs.append(job)
+    return jobs, errors
+
+
+def run_job(job, use_cache=True, profile=False):
+    # Changed files are only staged here; run_batch publishes the whole batch in one commit
+    start = time.perf_counter()
+    generate = GasAttributesCore.generate_sharded if "sharding" in job else GasAttributesCore.generate_code
+    writer = GasAttributesCache.OutputWriter()
+    profiler = None
+    if profile:
+        import GasAttributesTrace
+        profiler = GasAttributesTrace.Profiler()
+    try:
+        result = generate(
+            job["attributes"], job["replicated"], job["api_macro"],
+            job["class_name"], job["base_class"], job.get("tag_prefix"),
+            use_cache=use_cache, stages=job.get("stages"), template_dir=job.get("template_dir"),
+            output_dir=job.get("output_dir"), writer=writer, profiler=profiler,
+            **job.get("sharding", {}), **job.get("options", {})
+        )
+    except BaseException:
+        writer.discard()
+        raise
+    result["staged"] = writer.staged
+    if profiler:
+        result["profile"] = profiler.events
+    return time.perf_counter() - start, result
+
+
+def without_tags_ini(job):
+    # With every tag merged into one ini the per-class ini is redundant, unless the entry lists its stages
+    if "tag_prefix" not in job or "stages" in job:
+        return job
+    stages = [name for name in GasAttributesCore.resolve_stages(None, job["tag_prefix"]) if name != "tags_ini"]
+    return dict(job, stages=stages)
+
+
+def check_conflicts(jobs, index, report=print, fail=False):
+    # Runs before anything is written: names the batch would declare twice, within itself or
+    # against the sets already in the index (a GasAttributesIndex.AttributeIndex).
+    # Returns the index entries and the jobs that could be described; the rest are skipped.
+    import GasAttributesIndex
+    entries = {}
+    valid = []
+    skipped = []
+    conflicts = []
+    for job in jobs:
+        try:
+            entry = GasAttributesIndex.describe_job(job)
+        except ValueError as e:
+            message = str(e)
+            if not message.startswith(f"{job['class_name']}:"):
+                message = f"{job['class_name']}: {message}"
+            report(f"[skip] {message}")
+            skipped.append(_result(job, message))
+            continue
+        if job["class_name"] in entries:
+            conflicts.append(("classes", f"U{job['class_name']}", [job["class_name"]] * 2))
+        entries[job["class_name"]] = entry
+        valid.append(job)
+    conflicts.extend(index.preview(entries))
+    for conflict in conflicts:
+        report(f"[conflict] {GasAttributesIndex.format_conflict(*conflict)}")
+    if conflicts and fail:
+        raise ValueError(f"{len(conflicts)} naming conflicts; nothing was written")
+    return entries, valid, skipped
+
+
+def run_batch(jobs, workers=None, use_cache=True, report=print, durable=True, profiler=None, merge_tags=None,
+              index=None, fail_on_conflict=False):
+    # With a profiler (GasAttributesTrace.Profiler), every worker's phases are collected into it.
+    # With merge_tags, the tags of every entry with a tag_prefix are merged into that ini file.
+    # With an index, conflicts are checked first and the generated sets recorded in it afterwards.
+    # Entries that can't be described are reported as failed without stopping the others
+    entries, results = {}, []
+    if index is not None:
+        entries, jobs, results = check_conflicts(jobs, index, report, fail_on_conflict)
+    if merge_tags:
+        jobs = [without_tags_ini(job) for job in jobs]
+    start = time.perf_counter()
+    writer = GasAttributesCache.OutputWriter(durable)
+    profile = profiler is not None
+
+    def collect(job, run):
+        result = _collect(job, run, report, writer)
+        if profile:
+            profiler.extend(result.pop("profile", []))
+        return result
+
+    try:
+        if workers == 1 or len(jobs) <= 1:
+            for job in jobs:
+                results.append(collect(job, lambda job: run_job(job, use_cache, profile)))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(run_job, job, use_cache, profile): job for job in jobs}
+                for future in as_completed(futures):
+                    results.append(collect(futures[future], lambda _job: future.result()))
+
+        if merge_tags:
+            if profile:
+                with profiler.phase("merge_tags", file=merge_tags):
+                    merged = _merge_tags(jobs, results, merge_tags, writer)
+            else:
+                merged = _merge_tags(jobs, results, merge_tags, writer)
+            report(f"[tags] {merged['added']} new tags merged into {merge_tags} ({merged['tags']} in total"
+                   f", {merged['duplicates']} duplicates dropped)")
+
+        # One fsync pass and one rename pass for every file the batch changed
+        staged = len(writer.staged)
+        removed = len(writer.removed)
+        if staged or removed:
+            commit_start = time.perf_counter()
+            if profile:
+                with profiler.phase("commit", files=staged):
+                    writer.commit()
+            else:
+                writer.commit()
+            report(f"[sync] {staged} files published, {removed} removed in "
+                   f"{(time.perf_counter() - commit_start) * 1000:.2f} ms")
+    except BaseException:
+        writer.discard()
+        raise
+
+    if index is not None:
+        for result in results:
+            if result["error"] is None:
+                index.update(result["class_name"], entries[result["class_name"]])
+        if index.path:
+            index.save()
+
+    total = time.perf_counter() - start
+    return results, total
+
+
+def _merge_tags(jobs, results, path, writer):
+    import GasAttributesTags
+    failed = {result["class_name"] for result in results if result["error"] is not None}
+    tags = []
+    for job in jobs:
+        if "tag_prefix" in job and job["class_name"] not in failed:
+            tags.extend(GasAttributesTags.attribute_tags(job["attributes"], job["tag_prefix"]))
+    return GasAttributesTags.merge_gameplay_tags(path, tags, writer=writer)
+
+
+def _result(job, error=None):
+    return {
+        "class_name": job["class_name"],
+        "attributes": len(job["attributes"]),
+        "seconds": None,
+        "skipped": False,
+        "written": [],
+        "replication": None,
+        "error": error,
+    }
+
+
+def _collect(job, run, report, writer):
+    result = _result(job)
+    try:
+        seconds, generated = run(job)
+        writer.extend(generated.pop("staged", []), generated.get("removed", []))
+        if "profile" in generated:
+            result["profile"] = generated.pop("profile")
+        result["seconds"] = seconds
+        result["skipped"] = generated["skipped"]
+        result["written"] = generated["written"]
+        result["replication"] = generated["replication"]
+        status = "[same]" if generated["skipped"] else "[ok]  "
+        # Sharded sets also report the files of shards that no longer exist
+        removed = f", {len(generated['removed'])} removed" if generated.get("removed") else ""
+        report(
+            f"{status} {job['class_name']:<40} {result['attributes']:>6} attrs {seconds * 1000:9.2f} ms"
+            f"  {len(generated['written'])} written{removed}"
+            f"  ~{generated['replication']['update_bytes']} rep bytes"
+        )
+    except Exception as e:
+        result["error"] = str(e)
+        report(f"[fail] {job['class_name']:<40} {e}")
+    return result
+
+
+def summarize(results, total):
+    done = [r for r in results if r["error"] is None]
+    attrs = sum(r["attributes"] for r in done)
+    return {
+        "classes": len(done),
+        "failed": len(results) - len(done),
+        "up_to_date": sum(1 for r in done if r["skipped"]),
+        "files_written": sum(len(r["written"]) for r in done),
+        "attributes": attrs,
+        "replicated_update_bytes": sum(r["replication"]["update_bytes"] for r in done),
+        "wall_seconds": total,
+        "classes_per_second": len(done) / total if total > 0 else 0.0,
+        "attributes_per_second": attrs / total if total > 0 else 0.0,
+        "results": sorted(results, key=lambda r: r["class_name"]),
+    }
+
+
+# --- Index flags, shared with GasAttributesImport and GasAttributesWatch ---
+def add_index_arguments(parser):
+    parser.add_argument("--index", metavar="PATH",
+                        help="Project-wide attribute index to check against and keep up to date")
+    parser.add_argument("--fail-on-conflict", action="store_true",
+                        help="Write nothing if two sets would declare the same class, enum, delegate or tag")
+
+
+def make_index(args):
+    # Without --index, conflicts are still checked within the run itself
+    import GasAttributesIndex
+    return GasAttributesIndex.AttributeIndex(os.path.abspath(args.index) if args.index else None)
+
+
+# --- Profiling flags, shared with GasAttributesImport ---
+def add_profile_arguments(parser):
+    parser.add_argument("--profile", metavar="PATH", help="Time every generation phase and write the results here")
+    parser.add_argument("--profile-format", choices=("json", "chrome"), default="json",
+                        help="json: summary plus raw events; chrome: a trace for chrome://tracing or Perfetto")
+
+
+def make_profiler(args):
+    if not args.profile:
+        return None
+    import GasAttributesTrace
+    # Resolved up front: the profile is written after the run
+    args.profile = os.path.abspath(args.profile)
+    return GasAttributesTrace.Profiler()
+
+
+def save_profile(profiler, args):
+    if profiler is None:
+        return
+    for line in profiler.format_summary():
+        print(line)
+    profiler.save(args.profile, args.profile_format)
+    print(f"Profile written to {args.profile}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate many AttributeSets from a JSON manifest.")
+    parser.add_argument("manifest", help="JSON list of class entries, {\"defaults\": {...}, \"classes\": [...]}, or a settings.json")
+    parser.add_argument("-o", "--output-dir", default=".", help="Directory the generated files are written to")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--report", help="Write per-class timing and throughput as JSON to this path")
+    parser.add_argument("--force", action="store_true", help="Ignore the generation cache and regenerate every class")
+    parser.add_argument("--template-dir", help="Directory of .tmpl files overriding the built-in output")
+    parser.add_argument("--no-fsync", action="store_true",
+                        help="Skip flushing files to disk before publishing them (faster, not crash-safe)")
+    parser.add_argument("--merge-tags", metavar="INI",
+                        help="Merge every entry's tags into this ini (e.g. Config/DefaultGameplayTags.ini) "
+                             "instead of writing one _GameplayTags.ini per class")
+    add_index_arguments(parser)
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    manifest = os.path.abspath(args.manifest)
+    report_path = os.path.abspath(args.report) if args.report else None
+    # Entries with their own output_dir (relative to the manifest) override this one
+    defaults = {"output_dir": os.path.abspath(args.output_dir)}
+    if args.template_dir:
+        defaults["template_dir"] = os.path.abspath(args.template_dir)
+
+    jobs, errors = load_manifest(manifest, defaults)
+    for error in errors:
+        print(f"[skip] {error}", file=sys.stderr)
+
+    profiler = make_profiler(args)
+    try:
+        results, total = run_batch(
+            jobs, workers=args.jobs, use_cache=not args.force, durable=not args.no_fsync, profiler=profiler,
+            merge_tags=args.merge_tags, index=make_index(args), fail_on_conflict=args.fail_on_conflict
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    summary = summarize(results, total)
+    print(
+        f"Generated {summary['classes']} classes ({summary['attributes']} attributes) in {total:.3f} s: "
+        f"{summary['classes_per_second']:.1f} classes/s, {summary['attributes_per_second']:.0f} attributes/s"
+    )
+    print(f"{summary['up_to_date']} classes up to date, {summary['files_written']} files written")
+
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=4)
+    save_profile(profiler, args)
+
+    return 1 if errors or summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
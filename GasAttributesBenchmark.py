@@ -0,0 +1,427 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import GasAttributesCache
+import GasAttributesCore
+
+
+def make_attributes(count):
+    attributes = [f"Stat{i}" for i in range(count)]
+    replicated = attributes[::2]
+    return attributes, replicated
+
+
+def best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+# --- Emission scaling: generation time must grow linearly with attribute count ---
+def emit_class(attributes, replicated):
+    # Always one class, so it's the per-class emitters that have to scale. Sets past the enum limit
+    # are modelled the way generate_sharded models a whole set, which skips that check; their
+    # output wouldn't compile, but emitting it costs the same as a set that fits.
+    model = GasAttributesCore.build_model(
+        attributes, replicated, "MYGAME_API", "BenchSet", "AttributeSet", sharded=True
+    )
+    return "".join(GasAttributesCore.emit_header(model)), "".join(GasAttributesCore.emit_cpp(model))
+
+
+def bench_scaling(args):
+    rows = []
+    for count in args.sizes:
+        attributes, replicated = make_attributes(count)
+        repeat = max(1, args.repeat if count < 10000 else args.repeat // 2)
+        seconds = best_of(repeat, emit_class, attributes, replicated)
+        rows.append((count, seconds))
+        print(f"{count:>7} attrs {seconds * 1000:10.2f} ms {seconds / count * 1e6:8.2f} us/attr")
+
+    # Small sets are dominated by fixed costs, and sets that stay in the CPU caches run faster per
+    # attribute, so compare per-attribute cost from 1,000 up; a quadratic step would still cost 10x
+    measured = [(count, seconds / count) for count, seconds in rows if count >= 1000]
+    if len(measured) < 2:
+        return 0
+    baseline = measured[0][1]
+    worst_count, worst = max(measured, key=lambda row: row[1])
+    ratio = worst / baseline
+    print(f"Worst per-attribute cost is {ratio:.2f}x the {measured[0][0]}-attribute cost (at {worst_count} attrs)")
+    if ratio > args.max_ratio:
+        print(f"FAIL: emission is not linear (allowed {args.max_ratio:.2f}x)")
+        return 1
+    print("OK: emission scales linearly")
+    return 0
+
+
+# --- Attribute parsing: one validation sweep over spreadsheet-sized inputs ---
+def make_attribute_lines(count):
+    conditions = ("", " cond=OwnerOnly", " notify=OnChanged", " min=0 max=Stat0")
+    return [f"Stat{i} {i % 250}.5{conditions[i % len(conditions)]}" for i in range(count)]
+
+
+def bench_parse(args):
+    lines = make_attribute_lines(args.lines)
+    records = errors = None
+
+    def parse():
+        nonlocal records, errors
+        records, errors = GasAttributesCore.parse_attribute_lines(lines)
+
+    seconds = best_of(args.repeat, parse)
+    print(f"{len(lines)} lines parsed and validated in {seconds * 1000:.1f} ms ({len(lines) / seconds:,.0f} lines/s)")
+    if errors:
+        print(f"FAIL: {len(errors)} unexpected validation errors, first: {errors[0]}")
+        return 1
+    return 0
+
+
+# --- Cold start: a fresh interpreter importing the core and generating one class ---
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import GasAttributesCore
+attributes = [f"Stat{i} {i}" for i in range(50)]
+GasAttributesCore.generate_code(attributes, attributes[::2], "MYGAME_API", "StartupSet", "AttributeSet", use_cache=False)
+elapsed = time.perf_counter() - start
+print(elapsed, "tkinter" in sys.modules)
+"""
+
+
+def bench_startup(args):
+    repo = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=repo)
+    inner = []
+    outer = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, "-c", STARTUP_SCRIPT], cwd=workdir, env=env,
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            outer.append(time.perf_counter() - start)
+            inner.append(float(output[0]))
+            if output[1] == "True":
+                print("FAIL: importing the generator core pulled in tkinter")
+                return 1
+
+    median = statistics.median(inner)
+    print(f"import + generate (50 attributes): median {median * 1000:.1f} ms, max {max(inner) * 1000:.1f} ms")
+    print(f"whole process including interpreter start: median {statistics.median(outer) * 1000:.1f} ms")
+    if median * 1000 > args.max_ms:
+        print(f"FAIL: above the {args.max_ms:.0f} ms budget")
+        return 1
+    print("OK: within budget")
+    return 0
+
+
+# --- Templates: user-overridable templates against the built-in f-string emitters ---
+def bench_templates(args):
+    import GasAttributesTemplates
+
+    template_dir = args.template_dir or os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+    stages = tuple(GasAttributesTemplates.TEMPLATE_FILES)
+    texts = {}
+    for stage in stages:
+        with open(os.path.join(template_dir, GasAttributesTemplates.TEMPLATE_FILES[stage]), 'r', encoding='utf-8') as f:
+            texts[stage] = f.read()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        start = time.perf_counter()
+        for stage in stages:
+            GasAttributesTemplates.load_compiled(texts[stage], stage, cache_dir)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        templates = {stage: GasAttributesTemplates.load_compiled(texts[stage], stage, cache_dir) for stage in stages}
+        warm = time.perf_counter() - start
+    print(f"template load: {cold * 1000:.2f} ms compiling, {warm * 1000:.2f} ms from the compiled cache")
+
+    attributes, replicated = make_attributes(args.attributes)
+    models = [
+        GasAttributesCore.build_model(attributes, replicated, "MYGAME_API", f"BenchSet{i}", "AttributeSet", "Stat.")
+        for i in range(args.classes)
+    ]
+    contexts = [GasAttributesCore.template_context(model) for model in models]
+
+    def builtin():
+        return [[
+            "".join(GasAttributesCore.OUTPUT_STAGES[stage][1](model)) for stage in stages
+        ] for model in models]
+
+    def templated():
+        return [[templates[stage].render(context) for stage in stages] for context in contexts]
+
+    if builtin() != templated():
+        print(f"FAIL: templates in {template_dir} do not reproduce the built-in output")
+        if not args.template_dir:
+            return 1
+
+    builtin_seconds = best_of(args.repeat, builtin)
+    templated_seconds = best_of(args.repeat, templated)
+    ratio = templated_seconds / builtin_seconds
+    for label, seconds in (("built-in", builtin_seconds), ("templated", templated_seconds)):
+        print(f"{label:>9}: {args.classes} classes x {args.attributes} attrs in {seconds * 1000:8.1f} ms "
+              f"({args.classes / seconds:,.0f} classes/s)")
+    print(f"templated emission costs {ratio:.2f}x the built-in emitters")
+    if ratio > args.max_ratio:
+        print(f"FAIL: above the allowed {args.max_ratio:.2f}x")
+        return 1
+    return 0
+
+
+# --- Sharding: adding one attribute to a sharded set must only rewrite one shard ---
+def bench_sharding(args):
+    attributes, replicated = make_attributes(args.attributes)
+    with tempfile.TemporaryDirectory() as workdir:
+        start = time.perf_counter()
+        first = GasAttributesCore.generate_sharded(
+            attributes, replicated, "MYGAME_API", "BenchSet", "AttributeSet", shards=args.shards, output_dir=workdir
+        )
+        full = time.perf_counter() - start
+        start = time.perf_counter()
+        second = GasAttributesCore.generate_sharded(
+            attributes + ["AddedStat 1"], replicated, "MYGAME_API", "BenchSet", "AttributeSet", shards=args.shards,
+            output_dir=workdir
+        )
+        incremental = time.perf_counter() - start
+
+    sizes = [len(ids) for ids in first["shards"].values()]
+    print(f"{args.attributes} attributes in {len(sizes)} shards of {min(sizes)}-{max(sizes)} "
+          f"({full * 1000:.1f} ms, {len(first['written'])} files)")
+    rewritten = ", ".join(os.path.basename(path) for path in second["written"])
+    print(f"after adding one attribute: {rewritten} rewritten in {incremental * 1000:.1f} ms")
+    # The .h and .cpp of a single shard; the shared header doesn't depend on the attributes
+    if len(second["written"]) > 2:
+        print("FAIL: adding an attribute touched more than one shard")
+        return 1
+    print("OK: one shard touched")
+    return 0
+
+
+# --- Event surface: per-instance size and reflection data for each events mode ---
+def bench_events(args):
+    print(f"{'attrs':>6} {'events':>14} {'delegates':>9} {'instance B':>10} {'delegate B':>10} "
+          f"{'props':>6} {'funcs':>6} {'.h+.cpp B':>10}")
+    for count in args.sizes:
+        attributes, replicated = make_attributes(count)
+        # The first --own attributes keep their own delegate in single mode
+        attributes = [f"{attr} event=own" if i < args.own else attr for i, attr in enumerate(attributes)]
+        replicated = attributes[::2]
+        for events in GasAttributesCore.EVENT_MODES:
+            model = GasAttributesCore.build_model(
+                attributes, replicated, "MYGAME_API", "BenchSet", "AttributeSet",
+                options={"events": events, "native_delegates": args.native_delegates, "bp_events": args.bp_events}
+            )
+            surface = GasAttributesCore.event_surface(model)
+            source = sum(len(chunk) for emit in (GasAttributesCore.emit_header, GasAttributesCore.emit_cpp)
+                         for chunk in emit(model))
+            print(f"{count:>6} {events:>14} {surface['delegates']:>9} {surface['instance_bytes']:>10} "
+                  f"{surface['delegate_bytes']:>10} {surface['reflected_properties']:>6} "
+                  f"{surface['reflected_functions']:>6} {source:>10}")
+    return 0
+
+
+# --- Output: a batch published with one concurrent fsync pass versus one fsync per file ---
+def bench_output(args):
+    models = [
+        GasAttributesCore.build_model(*make_attributes(args.attributes), "MYGAME_API", f"BenchSet{i}", "AttributeSet")
+        for i in range(args.classes)
+    ]
+
+    def per_file(directory):
+        for model in models:
+            for stage in GasAttributesCore.DEFAULT_STAGES:
+                filename, emit = GasAttributesCore.OUTPUT_STAGES[stage]
+                path = os.path.join(directory, filename.format(class_name=model["class_name"]))
+                writer = GasAttributesCache.OutputWriter(workers=1)
+                writer.write(path, emit(model))
+                writer.commit()
+
+    def batched(directory):
+        writer = GasAttributesCache.OutputWriter(workers=args.io_workers)
+        for model in models:
+            GasAttributesCore.run_stages(model, GasAttributesCore.DEFAULT_STAGES, output_dir=directory, writer=writer)
+        writer.commit()
+
+    files = args.classes * len(GasAttributesCore.DEFAULT_STAGES)
+    timings = {}
+    for label, publish in (("per-file", per_file), ("batched", batched)):
+        best = None
+        for _ in range(args.repeat):
+            # A fresh directory every time, so every file is new and really written
+            with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+                start = time.perf_counter()
+                publish(directory)
+                elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[label] = best
+        print(f"{label:>8}: {files} files in {best * 1000:8.1f} ms ({files / best:,.0f} files/s)")
+    print(f"batched publishing takes {timings['batched'] / timings['per-file']:.2f}x the per-file time")
+    return 0
+
+
+# --- Tags: merging generated sets into a large DefaultGameplayTags.ini ---
+def bench_tags(args):
+    import GasAttributesTags
+
+    existing = [f"Existing.Group{i % 100}.Tag{i}" for i in range(args.existing)]
+    # Every set repeats a shared block, so merging also has to deduplicate across sets
+    sets = [
+        [f"Set{i}Stat{j}" for j in range(args.attributes)] + [f"Common{j}" for j in range(10)]
+        for i in range(args.sets)
+    ]
+    tags = [tag for attributes in sets for tag in GasAttributesTags.attribute_tags(attributes, "Stat.")]
+    expected = args.existing + args.sets * args.attributes + 10
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "DefaultGameplayTags.ini")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"{GasAttributesTags.SETTINGS_SECTION}\nImportTagsFromConfig=True\n")
+            f.writelines(GasAttributesTags.tag_line(tag, "") + "\n" for tag in sorted(existing, key=str.lower))
+
+        start = time.perf_counter()
+        first = GasAttributesTags.merge_gameplay_tags(path, tags)
+        merge = time.perf_counter() - start
+        start = time.perf_counter()
+        second = GasAttributesTags.merge_gameplay_tags(path, tags)
+        again = time.perf_counter() - start
+
+    print(f"{len(tags)} tags from {args.sets} sets merged into {args.existing} existing in {merge * 1000:.1f} ms "
+          f"({first['added']} added, {first['tags']} in total)")
+    print(f"merging the same sets again: {again * 1000:.1f} ms, {'rewritten' if second['written'] else 'unchanged'}")
+    if first["tags"] != expected or second["written"] or second["added"]:
+        print("FAIL: tags were duplicated or a repeated merge changed the file")
+        return 1
+    print("OK: deduplicated, and a repeated merge is a no-op")
+    return 0
+
+
+# --- Header scan: rescanning a large Source tree after a small change only reads the changed files ---
+def bench_headers(args):
+    import GasAttributesHeaders
+
+    with tempfile.TemporaryDirectory() as workdir:
+        root = os.path.join(workdir, "Source")
+        plain = "#pragma once\n\nstruct FPlain{index}\n{{\n    int32 Value = {index};\n}};\n"
+        sets = []
+        for index in range(args.files):
+            directory = os.path.join(root, f"Module{index % 50}", "Public")
+            if index < 50:
+                os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"File{index}.h")
+            if index % args.set_every == 0:
+                model = GasAttributesCore.build_model(
+                    *make_attributes(args.attributes), "MYGAME_API", f"Set{index}", "AttributeSet"
+                )
+                text = "".join(GasAttributesCore.emit_header(model))
+                sets.append(path)
+            else:
+                text = plain.format(index=index)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+        cache = GasAttributesHeaders.HeaderScanCache(os.path.join(workdir, "scan.json"))
+        found, cold = GasAttributesHeaders.scan_tree([root], cache, args.jobs)
+        cache.save()
+
+        cache = GasAttributesHeaders.HeaderScanCache(cache.path)
+        _, warm = GasAttributesHeaders.scan_tree([root], cache, args.jobs)
+
+        # One edited set and one touched (unchanged) set
+        with open(sets[0], 'a', encoding='utf-8') as f:
+            f.write("// edited\n")
+        os.utime(sets[-1], ns=(time.time_ns(), time.time_ns()))
+        cache = GasAttributesHeaders.HeaderScanCache(cache.path)
+        _, changed = GasAttributesHeaders.scan_tree([root], cache, args.jobs)
+
+    print(f"{args.files} headers, {len(found)} attribute sets of {args.attributes} attributes")
+    for label, stats in (("cold scan", cold), ("no changes", warm), ("1 edited, 1 touched", changed)):
+        print(f"{label:<20} {stats['seconds'] * 1000:9.1f} ms  {stats['read']:>6} read  {stats['parsed']:>5} parsed")
+    if len(found) != len(sets) or changed["parsed"] != 1 or changed["seconds"] > args.max_seconds:
+        print(f"FAIL: expected {len(sets)} sets, one parse and a rescan under {args.max_seconds} s")
+        return 1
+    print("OK")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Performance benchmarks for the AttributeSet generator.")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    scaling = sub.add_parser("scaling", help="Generation time versus attribute count")
+    scaling.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    scaling.add_argument("--repeat", type=int, default=5)
+    scaling.add_argument("--max-ratio", type=float, default=3.0,
+                         help="Allowed growth of per-attribute cost before the run fails")
+    scaling.set_defaults(func=bench_scaling)
+
+    parse = sub.add_parser("parse", help="Attribute line parsing and validation throughput")
+    parse.add_argument("--lines", type=int, default=100000)
+    parse.add_argument("--repeat", type=int, default=3)
+    parse.set_defaults(func=bench_parse)
+
+    startup = sub.add_parser("startup", help="Cold-interpreter import + generate time")
+    startup.add_argument("--runs", type=int, default=10)
+    startup.add_argument("--max-ms", type=float, default=100.0,
+                         help="Budget for import + generate in a fresh interpreter")
+    startup.set_defaults(func=bench_startup)
+
+    templates = sub.add_parser("templates", help="Templated versus built-in emission throughput")
+    templates.add_argument("--template-dir", help="Templates to measure (default: the bundled templates/)")
+    templates.add_argument("--classes", type=int, default=200)
+    templates.add_argument("--attributes", type=int, default=50)
+    templates.add_argument("--repeat", type=int, default=3)
+    templates.add_argument("--max-ratio", type=float, default=2.0,
+                           help="Allowed templated/built-in time ratio before the run fails")
+    templates.set_defaults(func=bench_templates)
+
+    sharding = sub.add_parser("sharding", help="Files rewritten when a sharded set gains an attribute")
+    sharding.add_argument("--attributes", type=int, default=2000)
+    sharding.add_argument("--shards", type=int, default=16)
+    sharding.set_defaults(func=bench_sharding)
+
+    events = sub.add_parser("events", help="Per-instance bytes and reflection data for each events mode")
+    events.add_argument("--sizes", type=int, nargs="+", default=[10, 100, GasAttributesCore.MAX_ENUM_ATTRIBUTES])
+    events.add_argument("--own", type=int, default=0, help="Attributes keeping their own delegate in single mode")
+    events.add_argument("--native-delegates", action="store_true", help="Also count the native C++ delegates")
+    events.add_argument("--bp-events", choices=GasAttributesCore.BP_EVENT_MODES, default="always")
+    events.set_defaults(func=bench_events)
+
+    headers = sub.add_parser("headers", help="Rescanning a Source tree for AttributeSet headers after a small change")
+    headers.add_argument("--files", type=int, default=20000)
+    headers.add_argument("--set-every", type=int, default=100, help="Every Nth header declares an AttributeSet")
+    headers.add_argument("--attributes", type=int, default=50)
+    headers.add_argument("--jobs", type=int, default=None)
+    headers.add_argument("--max-seconds", type=float, default=2.0, help="Allowed time for the rescan after the change")
+    headers.set_defaults(func=bench_headers)
+
+    output = sub.add_parser("output", help="Durable batch publishing versus an fsync per file")
+    output.add_argument("--dir", help="Directory to write into, e.g. on networked storage (default: system temp)")
+    output.add_argument("--classes", type=int, default=100)
+    output.add_argument("--attributes", type=int, default=50)
+    output.add_argument("--io-workers", type=int, default=16, help="Concurrent fsyncs and renames in a batch")
+    output.add_argument("--repeat", type=int, default=3)
+    output.set_defaults(func=bench_output)
+
+    tags = sub.add_parser("tags", help="Merging generated tags into a large DefaultGameplayTags.ini")
+    tags.add_argument("--existing", type=int, default=50000, help="Tags already in the ini")
+    tags.add_argument("--sets", type=int, default=100)
+    tags.add_argument("--attributes", type=int, default=50)
+    tags.set_defaults(func=bench_tags)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Bump whenever the emitted code changes so existing caches are invalidated
+GENERATOR_VERSION = "9"
+
+CACHE_DIR = ".attribute_cache"
+
+
+def inputs_key(**inputs):
+    payload = json.dumps(
+        {"generator_version": GENERATOR_VERSION, **inputs},
+        sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _open_replacement(tmp_path, old, matched):
+    out = open(tmp_path, 'wb')
+    # The prefix matched so far is copied over from the old file
+    if matched:
+        old.seek(0)
+        out.write(old.read(matched))
+    return out
+
+
+def write_stream_if_changed(path, chunks, writer=None):
+    # Chunks are compared against the existing file as they arrive; nothing is
+    # written until the first difference, and memory stays flat either way.
+    # The new contents go to a temp file next to the target, which is renamed over it
+    # straight away, or handed to writer (an OutputWriter) to publish with its batch.
+    try:
+        old = open(path, 'rb')
+    except OSError:
+        old = None
+
+    # Unique per process and thread, so concurrent runs never share a temp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    out = None
+    matched = 0
+    try:
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            if out is None:
+                if old is not None and old.read(len(data)) == data:
+                    matched += len(data)
+                    continue
+                out = _open_replacement(tmp_path, old, matched)
+            out.write(data)
+
+        if out is None:
+            if old is not None and not old.read(1):
+                return False
+            out = _open_replacement(tmp_path, old, matched)
+    except BaseException:
+        if out is not None:
+            out.close()
+            os.remove(tmp_path)
+        raise
+    finally:
+        if old is not None:
+            old.close()
+
+    out.close()
+    if writer is not None:
+        writer.stage(tmp_path, path)
+    else:
+        os.replace(tmp_path, path)
+    return True
+
+
+def _fsync_file(path):
+    # Windows can only flush handles opened for writing
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _fsync_directory(path):
+    # Makes the renames themselves durable; directories can't be opened for this on Windows
+    if os.name == "nt":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class OutputWriter:
+    # Publishes a set of generated files together. Files are staged as temp files next to
+    # their targets; commit() fsyncs all of them concurrently, renames them into place and
+    # fsyncs each directory once, so a crash never leaves a half-written header behind.
+    # Outputs that are no longer generated are removed in the same commit.
+    def __init__(self, durable=True, workers=16):
+        self.durable = durable
+        self.workers = workers
+        self.staged = []
+        self.removed = []
+        self._lock = threading.Lock()
+
+    def write(self, path, chunks):
+        return write_stream_if_changed(path, chunks, self)
+
+    def stage(self, tmp_path, path):
+        with self._lock:
+            self.staged.append((tmp_path, path))
+
+    def remove(self, path):
+        with self._lock:
+            self.removed.append(path)
+
+    def extend(self, staged, removed=()):
+        # Temp files staged (and paths removed) by another writer, e.g. one in a batch worker process
+        with self._lock:
+            self.staged.extend(tuple(pair) for pair in staged)
+            self.removed.extend(removed)
+
+    def sources(self):
+        # Where each staged file's contents currently live; a rename keeps size and mtime
+        with self._lock:
+            return {path: tmp_path for tmp_path, path in self.staged}
+
+    def _each(self, func, items):
+        # Network filesystems answer each fsync/rename with a round trip, so overlap them
+        if len(items) < 2 or self.workers <= 1:
+            for item in items:
+                func(item)
+            return
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items))) as pool:
+            list(pool.map(func, items))
+
+    def commit(self):
+        with self._lock:
+            staged, self.staged = self.staged, []
+            removed, self.removed = self.removed, []
+        if self.durable:
+            self._each(_fsync_file, [tmp_path for tmp_path, _ in staged])
+        self._each(lambda pair: os.replace(*pair), staged)
+        self._each(_remove_file, removed)
+        if self.durable:
+            paths = [path for _, path in staged] + removed
+            self._each(_fsync_directory, sorted({os.path.dirname(path) or "." for path in paths}))
+        return [path for _, path in staged]
+
+    def discard(self):
+        with self._lock:
+            staged, self.staged = self.staged, []
+            self.removed = []
+        for tmp_path, _ in staged:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+class GenerationCache:
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+
+    def _entry_path(self, class_name):
+        return os.path.join(self.directory, f"{class_name}.json")
+
+    def _stamp(self, path):
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def entry(self, class_name):
+        # The stored entry whatever its inputs were, or an empty one
+        try:
+            with open(self._entry_path(class_name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def fresh_entry(self, class_name, key):
+        # The stored entry when the inputs and outputs are unchanged, else None
+        entry = self.entry(class_name)
+        if not entry or entry.get("key") != key:
+            return None
+
+        # Outputs that were deleted or edited by hand must be regenerated
+        try:
+            if all(self._stamp(path) == stamp for path, stamp in entry.get("files", {}).items()):
+                return entry
+        except OSError:
+            pass
+        return None
+
+    def is_fresh(self, class_name, key):
+        return self.fresh_entry(class_name, key) is not None
+
+    def store(self, class_name, key, paths, sources=None, **data):
+        # sources maps outputs that are still staged to the temp file holding their contents;
+        # data (e.g. the replication summary) is kept in the entry for runs that skip generation
+        sources = sources or {}
+        os.makedirs(self.directory, exist_ok=True)
+        entry = {
+            "key": key,
+            "files": {path: self._stamp(sources.get(path, path)) for path in paths},
+            **data,
+        }
+        write_stream_if_changed(self._entry_path(class_name), [json.dumps(entry, indent=4)])
@@ -0,0 +1,1411 @@
+# Generator core with no GUI imports; the GasAttributesGenerator*.py scripts are Tk front ends over it
+import hashlib
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import GasAttributesCache
+
+
+def to_identifier(name):
+    return ''.join(c if c.isalnum() else '_' for c in name)
+
+
+REPLICATION_CONDITIONS = (
+    "None", "InitialOnly", "OwnerOnly", "SkipOwner", "SimulatedOnly", "AutonomousOnly",
+    "SimulatedOrPhysics", "InitialOrOwner", "Custom", "ReplayOrOwner", "ReplayOnly",
+    "SimulatedOnlyNoReplay", "SimulatedOrPhysicsNoReplay", "SkipReplay", "Never",
+)
+
+REP_NOTIFY_CONDITIONS = ("Always", "OnChanged")
+
+# With events="single", "own" keeps an attribute's dedicated delegate next to the shared one
+EVENT_SCOPES = ("shared", "own")
+
+# FGameplayAttributeData replicates BaseValue + CurrentValue, plus a property handle
+REPLICATED_BYTES_PER_ATTRIBUTE = 9
+
+
+NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?$")
+IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*$")
+# Most lines are just "Name" or "Name 100"; those skip the token-by-token parse
+SIMPLE_LINE = re.compile(r"\s*([A-Za-z_][A-Za-z0-9_]*)(?:\s+([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?))?\s*$")
+
+
+def parse_attribute_line(line):
+    # "Health 100 cond=OwnerOnly min=0 max=MaxHealth": name, optional default, then key=value settings
+    match = SIMPLE_LINE.match(line)
+    if match and match.group(1) != "None":
+        name, default = match.groups()
+        return {
+            "line": line, "name": name, "id": name, "default": float(default) if default else None,
+            "condition": None, "notify": None, "min": None, "max": None, "event": None,
+        }
+
+    record = {
+        "line": line, "name": None, "id": None, "default": None,
+        "condition": None, "notify": None, "min": None, "max": None, "event": None,
+    }
+    name_parts = []
+    for token in line.split():
+        key, sep, value = token.partition("=")
+        if not sep:
+            if record["default"] is not None:
+                raise ValueError(f"{line}: unexpected '{token}' after the default value")
+            if name_parts and NUMBER.match(token):
+                record["default"] = float(token)
+            else:
+                name_parts.append(token)
+        elif key == "cond":
+            value = value[len("COND_"):] if value.startswith("COND_") else value
+            if value not in REPLICATION_CONDITIONS:
+                raise ValueError(f"{line}: unknown replication condition '{value}'")
+            record["condition"] = value
+        elif key == "notify":
+            value = value[len("REPNOTIFY_"):] if value.startswith("REPNOTIFY_") else value
+            if value not in REP_NOTIFY_CONDITIONS:
+                raise ValueError(f"{line}: notify must be one of {', '.join(REP_NOTIFY_CONDITIONS)}")
+            record["notify"] = value
+        elif key == "event":
+            if value not in EVENT_SCOPES:
+                raise ValueError(f"{line}: event must be one of {', '.join(EVENT_SCOPES)}")
+            record["event"] = value
+        elif key in ("min", "max"):
+            # A bound is either a constant or the name of another attribute
+            if NUMBER.match(value):
+                record[key] = float(value)
+            elif IDENTIFIER.match(value):
+                record[key] = value
+            else:
+                raise ValueError(f"{line}: {key} must be a number or an attribute name")
+        else:
+            raise ValueError(f"{line}: unknown attribute setting '{key}'")
+
+    record["name"] = " ".join(name_parts)
+    record["id"] = to_identifier(record["name"])
+    if not IDENTIFIER.match(record["id"]) or record["id"] == "None":
+        raise ValueError(f"{line}: '{record['name']}' is not a valid attribute name")
+    return record
+
+
+def parse_attribute_lines(lines):
+    # One sweep over the whole list: every problem is reported, not just the first
+    records = []
+    errors = []
+    seen = {}
+    for line in lines:
+        try:
+            record = line if isinstance(line, dict) else parse_attribute_line(line)
+        except ValueError as e:
+            errors.append(str(e))
+            continue
+        if record["id"] in seen:
+            errors.append(f"{record['line']}: duplicates '{seen[record['id']]}'")
+            continue
+        seen[record["id"]] = record["line"]
+        records.append(record)
+
+    for record in records:
+        for key in ("min", "max"):
+            bound = record[key]
+            if isinstance(bound, str) and bound not in seen:
+                errors.append(f"{record['line']}: {key} refers to unknown attribute '{bound}'")
+            elif bound == record["id"]:
+                errors.append(f"{record['line']}: {key} can't refer to the attribute itself")
+        if isinstance(record["min"], float) and isinstance(record["max"], float) and record["min"] > record["max"]:
+            errors.append(f"{record['line']}: min is greater than max")
+
+    return records, errors
+
+
+def as_records(attributes):
+    # Emitters accept raw attribute lines or records that were already parsed
+    return [attr if isinstance(attr, dict) else parse_attribute_line(attr) for attr in attributes]
+
+
+def format_float(value):
+    text = repr(float(value))
+    return f"{text}f" if ("." in text or "e" in text) else f"{text}.f"
+
+
+# Per-instance member sizes on 64-bit targets
+ATTRIBUTE_DATA_BYTES = 16  # FGameplayAttributeData: vtable pointer, BaseValue, CurrentValue
+MULTICAST_DELEGATE_BYTES = 16  # FMulticastScriptDelegate: a TArray invocation list
+NATIVE_DELEGATE_BYTES = 24  # TMulticastDelegate: a TArray invocation list plus two int32 counters
+
+
+def event_surface(model):
+    # What the change events add to every instance and to the reflection data, for comparing modes
+    options = model["options"]
+    delegates = len(model["event_ids"]) + (1 if options["events"] == "single" else 0)
+    attributes = len(model["ids"])
+    # Native delegates sit next to the dynamic ones but aren't reflected
+    delegate_bytes = delegates * (MULTICAST_DELEGATE_BYTES + (NATIVE_DELEGATE_BYTES if options["native_delegates"] else 0))
+    bp_events = 0 if options["bp_events"] == "none" else delegates
+    return {
+        "attributes": attributes,
+        "delegates": delegates,
+        "delegate_bytes": delegate_bytes,
+        "instance_bytes": attributes * ATTRIBUTE_DATA_BYTES + delegate_bytes,
+        # Properties: attributes, delegates and the bp_events="flag" switch. Functions: one signature
+        # per delegate, the BP events, OnRep per replicated attribute, AttributeToEnum
+        "reflected_properties": attributes + delegates + (options["bp_events"] == "flag"),
+        "reflected_functions": delegates + bp_events + len(model["replicated_ids"]) + 1,
+    }
+
+
+def replication_summary(attributes, replicated):
+    by_condition = {}
+    for record in as_records(replicated):
+        condition = record["condition"] or "None"
+        by_condition[condition] = by_condition.get(condition, 0) + 1
+
+    count = sum(by_condition.values())
+    # InitialOnly properties are sent once; Never properties are not sent at all
+    steady = count - by_condition.get("InitialOnly", 0) - by_condition.get("Never", 0)
+    return {
+        "attributes": len(attributes),
+        "replicated": count,
+        "initial_bytes": (count - by_condition.get("Never", 0)) * REPLICATED_BYTES_PER_ATTRIBUTE,
+        "update_bytes": steady * REPLICATED_BYTES_PER_ATTRIBUTE,
+        "by_condition": by_condition,
+    }
+
+
+def tag_root(tag_prefix):
+    prefix = (tag_prefix or "").strip()
+    if prefix and not prefix.endswith("."):
+        prefix += "."
+    return prefix
+
+
+def iter_gameplay_tags_ini(attributes, tag_prefix, dev_comment):
+    prefix = tag_root(tag_prefix)
+
+    yield '[/Script/GameplayTags.GameplayTagsList]\n'
+
+    for record in as_records(attributes):
+        tag = f"{prefix}{record['id']}"
+        yield f'+GameplayTagList=(Tag="{tag}",DevComment="{dev_comment}")\n'
+
+
+def generate_gameplay_tags_ini(attributes, tag_prefix, dev_comment):
+    return "".join(iter_gameplay_tags_ini(attributes, tag_prefix, dev_comment))
+
+
+# --- Emission options shared by every output (see README for what each one does) ---
+DEFAULT_OPTIONS = {
+    "legacy_enum_lookup": False,
+    "dispatch": "switch",
+    # No longer emits anything: Broadcast already returns early when nothing is bound, and the
+    # BP_ event is governed by bp_events. Still accepted so existing manifests keep loading.
+    "skip_unbound_events": False,
+    "rep_notify": "Always",
+    "push_model": False,
+    "events": "per_attribute",
+    "native_delegates": False,
+    "bp_events": "always",
+}
+
+DISPATCH_MODES = ("switch", "chain")
+
+EVENT_MODES = ("per_attribute", "single")
+
+# When the BP_On...Changed events run: always, not on dedicated servers, behind a per-class flag, or never
+BP_EVENT_MODES = ("always", "client", "flag", "none")
+
+
+def resolve_options(options=None):
+    resolved = dict(DEFAULT_OPTIONS)
+    for name, value in (options or {}).items():
+        if name not in DEFAULT_OPTIONS:
+            raise ValueError(f"Unknown generator option: {name}")
+        resolved[name] = value
+    if resolved["dispatch"] not in DISPATCH_MODES:
+        raise ValueError(f"dispatch must be one of {', '.join(DISPATCH_MODES)}")
+    if resolved["rep_notify"] not in REP_NOTIFY_CONDITIONS:
+        raise ValueError(f"rep_notify must be one of {', '.join(REP_NOTIFY_CONDITIONS)}")
+    if resolved["events"] not in EVENT_MODES:
+        raise ValueError(f"events must be one of {', '.join(EVENT_MODES)}")
+    if resolved["bp_events"] not in BP_EVENT_MODES:
+        raise ValueError(f"bp_events must be one of {', '.join(BP_EVENT_MODES)}")
+    return resolved
+
+
+def blueprint_call(call, indent, bp_events):
+    if bp_events == "none":
+        return ""
+    if bp_events == "client":
+        # Dedicated servers have no Blueprint listeners worth a ProcessEvent per change
+        return f"#if !UE_SERVER\n{indent}{call};\n#endif\n"
+    if bp_events == "flag":
+        return f"{indent}if (bFireBlueprintEvents)\n{indent}{{\n{indent}    {call};\n{indent}}}\n"
+    return f"{indent}{call};\n"
+
+
+def iter_event_calls(delegate, args, indent, options):
+    # The native delegate, then the dynamic delegate and its BP_ event as configured
+    if options["native_delegates"]:
+        yield f"{indent}{delegate}Native.Broadcast({args});\n"
+    yield (
+        f"{indent}{delegate}.Broadcast({args});\n"
+        + blueprint_call(f"BP_{delegate}({args})", indent, options["bp_events"])
+    )
+
+
+def iter_shared_broadcast(attribute, indent, options):
+    # events="single": one delegate and one BP event carry the attribute as an enum value
+    return iter_event_calls("OnAttributeChanged", f"{attribute}, OldValue, NewValue", indent, options)
+
+
+def iter_broadcast(aid, indent, options):
+    return iter_event_calls(f"On{aid}Changed", "OldValue, NewValue", indent, options)
+
+
+# --- Intermediate model: attributes are parsed, de-duplicated and validated once, then shared by every stage ---
+class _NoPhase:
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+def _phase(profiler, name, **args):
+    # Profiling is opt-in: without a profiler (see GasAttributesTrace) phases cost nothing
+    return profiler.phase(name, **args) if profiler else _NO_PHASE
+
+
+# The attribute enum is a uint8 UENUM, the only kind Blueprint accepts, and None takes one value
+MAX_ENUM_ATTRIBUTES = 255
+
+
+def enum_names(class_name, shard=False):
+    # (enum, events="single" delegate type) a class declares. Every shard declares its own, so the
+    # shards of a set can share a module and each enum only has to hold its shard's attributes
+    if shard:
+        return f"E{class_name}Attribute", f"FOn{class_name}AttributeChanged"
+    return "AllAttributesEnum", "FOnAttributeChanged"
+
+
+def build_model(attributes, replicated, api_macro, class_name, base_class, tag_prefix=None, options=None,
+                shared_header=None, profiler=None, sharded=False):
+    # sharded: the whole set of a sharded generation, which declares no enum of its own
+    options = resolve_options(options)
+
+    # Identical lines (e.g. an attribute typed in both panes) collapse; other clashes are errors
+    with _phase(profiler, "parse"):
+        unique = {}
+        for attr in attributes:
+            unique.setdefault(attr["line"] if isinstance(attr, dict) else attr, attr)
+        records, errors = parse_attribute_lines(list(unique.values()))
+    if errors:
+        raise ValueError("\n".join(errors))
+    if len(records) > MAX_ENUM_ATTRIBUTES and not sharded:
+        enum_name = enum_names(class_name, bool(shared_header))[0]
+        raise ValueError(
+            f"{class_name}: {len(records)} attributes don't fit in {enum_name}, a uint8 enum holding at most "
+            f"{MAX_ENUM_ATTRIBUTES}; shard the set, or use more shards"
+        )
+
+    with _phase(profiler, "model"):
+        return _assemble_model(records, replicated, api_macro, class_name, base_class, tag_prefix, options,
+                               shared_header)
+
+
+def _assemble_model(records, replicated, api_macro, class_name, base_class, tag_prefix, options, shared_header):
+    replicated_lines = {attr["line"] if isinstance(attr, dict) else attr for attr in replicated}
+    replicated_records = [record for record in records if record["line"] in replicated_lines]
+    replicated_ids = [record["id"] for record in replicated_records]
+    if options["events"] == "single":
+        event_ids = [record["id"] for record in records if record["event"] == "own"]
+    else:
+        event_ids = [record["id"] for record in records]
+
+    clamped_records = [record for record in records if record["min"] is not None or record["max"] is not None]
+    # Bound attribute -> attributes to re-clamp when it changes, e.g. MaxHealth -> [Health]
+    clamp_dependents = {}
+    for record in clamped_records:
+        for key in ("min", "max"):
+            if isinstance(record[key], str):
+                dependents = clamp_dependents.setdefault(record[key], [])
+                if record["id"] not in dependents:
+                    dependents.append(record["id"])
+
+    enum_name, event_type = enum_names(class_name, bool(shared_header))
+    return {
+        "class_name": class_name,
+        "class_name_u": f"U{class_name}",
+        "base_class_u": base_class if base_class.startswith('U') else f"U{base_class}",
+        "include_name": base_class[1:] if base_class.startswith('U') else base_class,
+        "api_macro": api_macro,
+        "tag_prefix": tag_prefix,
+        # Set for shards: the accessor macros come from this header instead
+        "shared_header": shared_header,
+        "enum_name": enum_name,
+        # The delegate type of the events="single" change event
+        "event_type": event_type,
+        "options": options,
+        "records": records,
+        "ids": [record["id"] for record in records],
+        "replicated_records": replicated_records,
+        "replicated_ids": replicated_ids,
+        # The set keeps replicated lookups O(1)
+        "replicated_set": set(replicated_ids),
+        # Attributes with their own FOn...Changed delegate and BP_On...Changed event
+        "event_ids": event_ids,
+        "replication": replication_summary(records, replicated_records),
+        # Attributes declared with min=/max=, clamped through one table indexed by the enum
+        "clamped_records": clamped_records,
+        "clamp_dependents": clamp_dependents,
+    }
+
+
+# --- Output stages: each takes the model and yields its file in per-section fragments ---
+def iter_enum(ids, enum_name):
+    yield f"UENUM(BlueprintType)\nenum class {enum_name} : uint8\n{{\n"
+    for aid in ids:
+        yield f"    {aid} UMETA(DisplayName = \"{aid}\"),\n"
+    yield "    None UMETA(Hidden)\n};\n\n"
+
+
+def iter_accessor_macros(push_model):
+    yield (
+        "#define ATTRIBUTE_ACCESSORS(ClassName, PropertyName) \\\n"
+        "    GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName) \\\n"
+        "    GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName) \\\n"
+        "    GAMEPLAYATTRIBUTE_VALUE_SETTER(PropertyName) \\\n"
+        "    GAMEPLAYATTRIBUTE_VALUE_INITTER(PropertyName)\n\n"
+    )
+    if push_model:
+        # Push-model properties are only compared by the net driver once marked dirty
+        yield (
+            "#define ATTRIBUTE_ACCESSORS_PUSH(ClassName, PropertyName) \\\n"
+            "    GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName) \\\n"
+            "    GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName) \\\n"
+            "    FORCEINLINE void Set##PropertyName(float NewVal) \\\n"
+            "    { \\\n"
+            "        UAbilitySystemComponent* AbilityComp = GetOwningAbilitySystemComponent(); \\\n"
+            "        if (ensure(AbilityComp)) \\\n"
+            "        { \\\n"
+            "            AbilityComp->SetNumericAttributeBase(Get##PropertyName##Attribute(), NewVal); \\\n"
+            "        } \\\n"
+            "        MARK_PROPERTY_DIRTY_FROM_NAME(ClassName, PropertyName, this); \\\n"
+            "    } \\\n"
+            "    FORCEINLINE void Init##PropertyName(float NewVal) \\\n"
+            "    { \\\n"
+            "        PropertyName.SetBaseValue(NewVal); \\\n"
+            "        PropertyName.SetCurrentValue(NewVal); \\\n"
+            "        MARK_PROPERTY_DIRTY_FROM_NAME(ClassName, PropertyName, this); \\\n"
+            "    }\n\n"
+        )
+
+
+def iter_shared_event_types(enum_name, event_type, native_delegates):
+    # events="single": the delegate types carrying the changed attribute as an enum value
+    yield (
+        "DECLARE_DYNAMIC_MULTICAST_DELEGATE_ThreeParams("
+        f"{event_type}, {enum_name}, Attribute, float, OldValue, float, NewValue);\n\n"
+    )
+    if native_delegates:
+        yield f"DECLARE_MULTICAST_DELEGATE_ThreeParams({event_type}Native, {enum_name}, float, float);\n\n"
+
+
+def emit_header(model):
+    options = model["options"]
+    class_name = model["class_name"]
+    class_name_u = model["class_name_u"]
+    base_class_u = model["base_class_u"]
+    include_name = model["include_name"]
+    api_macro = model["api_macro"]
+    ids = model["ids"]
+    replicated_set = model["replicated_set"]
+    event_ids = model["event_ids"]
+    enum_name = model["enum_name"]
+    event_type = model["event_type"]
+    push_model = options["push_model"]
+
+    yield (
+        "#pragma once\n\n"
+        "#include \"CoreMinimal.h\"\n"
+        f"#include \"{include_name}.h\"\n"
+        "#include \"AbilitySystemComponent.h\"\n"
+        "#include \"GameplayEffectExtension.h\"\n"
+    )
+    if push_model:
+        yield "#include \"Net/Core/PushModel/PushModel.h\"\n"
+    if model["shared_header"]:
+        yield f"#include \"{model['shared_header']}\"\n"
+    yield f"#include \"{class_name}.generated.h\"\n\n"
+    yield from iter_enum(ids, enum_name)
+    if not model["shared_header"]:
+        yield from iter_accessor_macros(push_model)
+    if options["events"] == "single":
+        yield from iter_shared_event_types(enum_name, event_type, options["native_delegates"])
+
+    # --- Delegate declarations (one per attribute with its own events) ---
+    for aid in event_ids:
+        yield (
+            "DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams("
+            f"FOn{aid}Changed, float, OldValue, float, NewValue);\n"
+        )
+    if options["native_delegates"] and event_ids:
+        yield "\n"
+        for aid in event_ids:
+            yield f"DECLARE_MULTICAST_DELEGATE_TwoParams(FOn{aid}ChangedNative, float, float);\n"
+    yield "\n"
+
+    if replicated_set:
+        summary = model["replication"]
+        yield (
+            f"// Replication estimate: {summary['replicated']} attributes, ~{summary['initial_bytes']} bytes initial, "
+            f"~{summary['update_bytes']} bytes per full update\n"
+        )
+
+    yield (
+        "UCLASS()\n"
+        f"class {api_macro} {class_name_u} : public {base_class_u}\n"
+        "{\n"
+        "    GENERATED_BODY()\n\n"
+        "public:\n"
+        f"    {class_name_u}();\n\n"
+        "    UFUNCTION(BlueprintPure, Category=\"Attributes\")\n"
+        f"    static {enum_name} AttributeToEnum(const FGameplayAttribute& Attribute);\n\n"
+    )
+    if options["legacy_enum_lookup"]:
+        yield (
+            "    // Previous string-comparing lookup, kept to benchmark against AttributeToEnum\n"
+            f"    static {enum_name} AttributeToEnumByName(const FGameplayAttribute& Attribute);\n\n"
+        )
+    yield (
+        "    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;\n\n"
+        "    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)\n"
+        "    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;\n\n"
+    )
+    if model["clamped_records"]:
+        yield (
+            "    // Clamp to the ranges declared with min=/max=\n"
+            "    virtual void PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue) override;\n"
+            "    virtual void PostGameplayEffectExecute(const FGameplayEffectModCallbackData& Data) override;\n\n"
+            f"    // Looks the range up in a table indexed by {enum_name}, so clamping is O(1)\n"
+            f"    void ClampAttribute({enum_name} Attribute, float& NewValue) const;\n\n"
+        )
+    if model["clamp_dependents"]:
+        yield (
+            "    // Re-clamps the attributes bounded by Bound after it changed, e.g. Health when MaxHealth drops\n"
+            f"    void ReclampDependents({enum_name} Bound);\n\n"
+        )
+    if push_model and replicated_set:
+        yield (
+            "    virtual void PostAttributeBaseChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) const override;\n\n"
+            "    // Marks a replicated attribute dirty for the push-model replication system\n"
+            "    void MarkAttributeDirty(const FGameplayAttribute& Attribute) const;\n\n"
+        )
+    yield "public:\n\n"
+
+    # --- Attributes + Accessors ---
+    for aid in ids:
+        if aid in replicated_set:
+            yield (
+                "    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_"
+                f"{aid}, Category = \"Attributes\")\n"
+            )
+        else:
+            yield "    UPROPERTY(BlueprintReadOnly, Category = \"Attributes\")\n"
+        accessors = "ATTRIBUTE_ACCESSORS_PUSH" if push_model and aid in replicated_set else "ATTRIBUTE_ACCESSORS"
+        yield (
+            f"    FGameplayAttributeData {aid};\n"
+            f"    {accessors}({class_name_u}, {aid})\n\n"
+        )
+
+    # --- Events: one shared delegate + BP event, and/or a delegate + BP event per attribute ---
+    native = options["native_delegates"]
+    bp_events = options["bp_events"] != "none"
+    if options["bp_events"] == "flag" and (event_ids or options["events"] == "single"):
+        yield (
+            "    // Clear (e.g. in a subclass constructor) to skip the BP_On...Changed events\n"
+            "    UPROPERTY(EditDefaultsOnly, Category=\"Attributes|Events\")\n"
+            "    bool bFireBlueprintEvents = true;\n\n"
+        )
+    if options["events"] == "single":
+        yield (
+            f"    // Change events for every attribute, identified by {enum_name}\n"
+            "    UPROPERTY(BlueprintAssignable, Category=\"Attributes|Events\")\n"
+            f"    {event_type} OnAttributeChanged;\n\n"
+        )
+        if native:
+            yield (
+                "    // For C++ listeners (AddUObject, AddLambda, ...); broadcasting it involves no reflection\n"
+                f"    {event_type}Native OnAttributeChangedNative;\n\n"
+            )
+        if bp_events:
+            yield (
+                "    UFUNCTION(BlueprintImplementableEvent, Category=\"Attributes|Events\")\n"
+                f"    void BP_OnAttributeChanged({enum_name} Attribute, float OldValue, float NewValue);\n\n"
+            )
+    if event_ids:
+        yield "    // Per-attribute change events\n"
+        if native:
+            yield "    // On...ChangedNative are for C++ listeners; broadcasting them involves no reflection\n"
+    for aid in event_ids:
+        yield (
+            f"    UPROPERTY(BlueprintAssignable, Category=\"Attributes|Events\")\n"
+            f"    FOn{aid}Changed On{aid}Changed;\n\n"
+        )
+        if native:
+            yield f"    FOn{aid}ChangedNative On{aid}ChangedNative;\n\n"
+        if bp_events:
+            yield (
+                f"    UFUNCTION(BlueprintImplementableEvent, Category=\"Attributes|Events\")\n"
+                f"    void BP_On{aid}Changed(float OldValue, float NewValue);\n\n"
+            )
+
+    # --- OnRep for replicated attributes ---
+    for aid in (aid for aid in ids if aid in replicated_set):
+        yield (
+            "    UFUNCTION()\n"
+            f"    void OnRep_{aid}(const FGameplayAttributeData& Old{aid});\n\n"
+        )
+
+    yield "};\n"
+
+
+def clamp_bound(class_name_u, bound, limit):
+    # (constant, member pointer) for one side of a range; attribute bounds are read at clamp time
+    if bound is None:
+        return f"TNumericLimits<float>::{limit}()", "nullptr"
+    if isinstance(bound, str):
+        return f"TNumericLimits<float>::{limit}()", f"&{class_name_u}::{bound}"
+    return format_float(bound), "nullptr"
+
+
+def iter_clamping(model):
+    class_name_u = model["class_name_u"]
+    enum_name = model["enum_name"]
+
+    # --- Clamping: PreAttributeChange for current values, PostGameplayEffectExecute for base values ---
+    yield (
+        f"void {class_name_u}::PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue)\n"
+        "{\n"
+        "    Super::PreAttributeChange(Attribute, NewValue);\n"
+        "    ClampAttribute(AttributeToEnum(Attribute), NewValue);\n"
+        "}\n\n"
+        f"void {class_name_u}::PostGameplayEffectExecute(const FGameplayEffectModCallbackData& Data)\n"
+        "{\n"
+        "    Super::PostGameplayEffectExecute(Data);\n\n"
+        "    const FGameplayAttribute& Attribute = Data.EvaluatedData.Attribute;\n"
+        "    const float OldValue = Data.Target.GetNumericAttributeBase(Attribute);\n"
+        "    float NewValue = OldValue;\n"
+        "    ClampAttribute(AttributeToEnum(Attribute), NewValue);\n"
+        "    if (NewValue != OldValue)\n"
+        "    {\n"
+        "        Data.Target.SetNumericAttributeBase(Attribute, NewValue);\n"
+        "    }\n"
+        "}\n\n"
+        f"void {class_name_u}::ClampAttribute({enum_name} Attribute, float& NewValue) const\n"
+        "{\n"
+        "    struct FRange\n"
+        "    {\n"
+        "        float Min = TNumericLimits<float>::Lowest();\n"
+        "        float Max = TNumericLimits<float>::Max();\n"
+        f"        FGameplayAttributeData {class_name_u}::* MinAttribute = nullptr;\n"
+        f"        FGameplayAttributeData {class_name_u}::* MaxAttribute = nullptr;\n"
+        "    };\n\n"
+        f"    // One slot per {enum_name} value, built once; unbounded slots clamp to the float limits\n"
+        "    static const TArray<FRange> Ranges = []()\n"
+        "    {\n"
+        "        TArray<FRange> Table;\n"
+        f"        Table.SetNum(static_cast<int32>({enum_name}::None));\n"
+    )
+    for record in model["clamped_records"]:
+        low, low_attribute = clamp_bound(class_name_u, record["min"], "Lowest")
+        high, high_attribute = clamp_bound(class_name_u, record["max"], "Max")
+        yield (
+            f"        Table[static_cast<int32>({enum_name}::{record['id']})] = "
+            f"{{ {low}, {high}, {low_attribute}, {high_attribute} }};\n"
+        )
+    yield (
+        "        return Table;\n"
+        "    }();\n\n"
+        "    const int32 Index = static_cast<int32>(Attribute);\n"
+        "    if (!Ranges.IsValidIndex(Index))\n"
+        "    {\n"
+        "        return;\n"
+        "    }\n"
+        "    const FRange& Range = Ranges[Index];\n"
+        "    const float Min = Range.MinAttribute ? (this->*Range.MinAttribute).GetCurrentValue() : Range.Min;\n"
+        "    const float Max = Range.MaxAttribute ? (this->*Range.MaxAttribute).GetCurrentValue() : Range.Max;\n"
+        "    NewValue = FMath::Clamp(NewValue, Min, Max);\n"
+        "}\n\n"
+    )
+
+    dependents = model["clamp_dependents"]
+    if not dependents:
+        return
+    yield (
+        f"void {class_name_u}::ReclampDependents({enum_name} Bound)\n"
+        "{\n"
+        "    float Value = 0.f;\n"
+        "    switch (Bound)\n"
+        "    {\n"
+    )
+    for bound, ids in dependents.items():
+        yield f"    case {enum_name}::{bound}:\n"
+        for aid in ids:
+            yield (
+                f"        Value = Get{aid}();\n"
+                f"        ClampAttribute({enum_name}::{aid}, Value);\n"
+                f"        if (Value != Get{aid}())\n"
+                "        {\n"
+                f"            Set{aid}(Value);\n"
+                "        }\n"
+            )
+        yield "        break;\n"
+    yield (
+        "    default:\n"
+        "        break;\n"
+        "    }\n"
+        "}\n\n"
+    )
+
+
+def emit_cpp(model):
+    options = model["options"]
+    class_name_u = model["class_name_u"]
+    header_file = f"{model['class_name']}.h"
+
+    records = model["records"]
+    ids = model["ids"]
+    enum_name = model["enum_name"]
+    event_ids = model["event_ids"]
+    own_events = set(event_ids)
+    single = options["events"] == "single"
+    replicated_records = model["replicated_records"]
+    replicated_ids = model["replicated_ids"]
+    push_model = options["push_model"] and bool(replicated_ids)
+
+    yield (
+        f"#include \"{header_file}\"\n"
+        "#include \"Net/UnrealNetwork.h\"\n"
+        "#include \"GameplayEffectExtension.h\"\n\n"
+        f"{class_name_u}::{class_name_u}()\n"
+        "{\n"
+    )
+    for record in records:
+        if record["default"] is not None:
+            yield f"    Init{record['id']}({format_float(record['default'])});\n"
+    yield (
+        "}\n\n"
+        f"void {class_name_u}::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const\n"
+        "{\n"
+        "    Super::GetLifetimeReplicatedProps(OutLifetimeProps);\n"
+    )
+
+    if push_model:
+        yield (
+            "\n"
+            "    FDoRepLifetimeParams Params;\n"
+            "    Params.bIsPushBased = true;\n"
+        )
+    for record in replicated_records:
+        aid = record["id"]
+        condition = record["condition"] or "None"
+        notify = record["notify"] or options["rep_notify"]
+        if push_model:
+            yield (
+                "\n"
+                f"    Params.Condition = COND_{condition};\n"
+                f"    Params.RepNotifyCondition = REPNOTIFY_{notify};\n"
+                f"    DOREPLIFETIME_WITH_PARAMS_FAST({class_name_u}, {aid}, Params);\n"
+            )
+        else:
+            yield f"    DOREPLIFETIME_CONDITION_NOTIFY({class_name_u}, {aid}, COND_{condition}, REPNOTIFY_{notify});\n"
+
+    yield "}\n\n"
+
+    if push_model:
+        yield (
+            f"void {class_name_u}::PostAttributeBaseChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) const\n"
+            "{\n"
+            "    Super::PostAttributeBaseChange(Attribute, OldValue, NewValue);\n"
+            "    if (OldValue != NewValue)\n"
+            "    {\n"
+            "        MarkAttributeDirty(Attribute);\n"
+            "    }\n"
+            "}\n\n"
+            f"void {class_name_u}::MarkAttributeDirty(const FGameplayAttribute& Attribute) const\n"
+            "{\n"
+            "    switch (AttributeToEnum(Attribute))\n"
+            "    {\n"
+        )
+        for aid in replicated_ids:
+            yield (
+                f"    case {enum_name}::{aid}:\n"
+                f"        MARK_PROPERTY_DIRTY_FROM_NAME({class_name_u}, {aid}, this);\n"
+                "        break;\n"
+            )
+        yield (
+            "    default:\n"
+            "        break;\n"
+            "    }\n"
+            "}\n\n"
+        )
+
+    # --- PostAttributeChange: fire per-attribute events on server/local changes ---
+    yield (
+        f"void {class_name_u}::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)\n"
+        "{\n"
+        "    Super::PostAttributeChange(Attribute, OldValue, NewValue);\n\n"
+        "    if (OldValue == NewValue)\n"
+        "    {\n"
+        "        return;\n"
+        "    }\n\n"
+    )
+    if push_model:
+        yield "    MarkAttributeDirty(Attribute);\n\n"
+
+    lookup = "AttributeToEnum(Attribute)"
+    if single:
+        yield (
+            f"    const {enum_name} Changed = AttributeToEnum(Attribute);\n"
+            f"    if (Changed == {enum_name}::None)\n"
+            "    {\n"
+            "        return;\n"
+            "    }\n\n"
+        )
+        if model["clamp_dependents"]:
+            yield "    ReclampDependents(Changed);\n\n"
+    elif model["clamp_dependents"]:
+        yield (
+            f"    const {enum_name} Changed = AttributeToEnum(Attribute);\n"
+            "    ReclampDependents(Changed);\n\n"
+        )
+        lookup = "Changed"
+    if single:
+        yield from iter_shared_broadcast("Changed", "    ", options)
+        if event_ids:
+            yield "\n"
+        lookup = "Changed"
+
+    if event_ids and options["dispatch"] == "switch":
+        # One enum lookup, then a jump table instead of comparing against every attribute
+        yield f"    switch ({lookup})\n    {{\n"
+        for aid in event_ids:
+            yield f"    case {enum_name}::{aid}:\n"
+            yield from iter_broadcast(aid, "        ", options)
+            yield "        break;\n"
+        yield (
+            "    default:\n"
+            "        break;\n"
+            "    }\n"
+        )
+    elif event_ids:
+        for aid in event_ids:
+            yield (
+                f"    if (Attribute == Get{aid}Attribute())\n"
+                "    {\n"
+            )
+            yield from iter_broadcast(aid, "        ", options)
+            yield (
+                "        return;\n"
+                "    }\n\n"
+            )
+
+    yield "}\n\n"
+
+    if model["clamped_records"]:
+        yield from iter_clamping(model)
+
+    # --- OnRep: replicated attributes fire events on clients ---
+    for aid in replicated_ids:
+        yield (
+            f"void {class_name_u}::OnRep_{aid}(const FGameplayAttributeData& Old{aid})\n"
+            "{\n"
+            f"    GAMEPLAYATTRIBUTE_REPNOTIFY({class_name_u}, {aid}, Old{aid});\n"
+            f"    const float OldValue = Old{aid}.GetCurrentValue();\n"
+            f"    const float NewValue = {aid}.GetCurrentValue();\n"
+            "    if (OldValue != NewValue)\n"
+            "    {\n"
+        )
+        if single:
+            yield from iter_shared_broadcast(f"{enum_name}::{aid}", "        ", options)
+        if aid in own_events:
+            yield from iter_broadcast(aid, "        ", options)
+        yield (
+            "    }\n"
+            "}\n\n"
+        )
+
+    # --- AttributeToEnum: property-pointer map built once, no per-call string work ---
+    yield (
+        f"{enum_name} {class_name_u}::AttributeToEnum(const FGameplayAttribute& Attribute)\n"
+        "{\n"
+        f"    static const TMap<const FProperty*, {enum_name}> Lookup = []()\n"
+        "    {\n"
+        f"        TMap<const FProperty*, {enum_name}> Map;\n"
+        f"        Map.Reserve({len(ids)});\n"
+    )
+    for aid in ids:
+        yield f"        Map.Add(Get{aid}Attribute().GetUProperty(), {enum_name}::{aid});\n"
+    yield (
+        "        return Map;\n"
+        "    }();\n\n"
+        f"    const {enum_name}* Found = Lookup.Find(Attribute.GetUProperty());\n"
+        f"    return Found ? *Found : {enum_name}::None;\n"
+        "}\n"
+    )
+
+    if options["legacy_enum_lookup"]:
+        yield (
+            "\n"
+            f"{enum_name} {class_name_u}::AttributeToEnumByName(const FGameplayAttribute& Attribute)\n"
+            "{\n"
+            "    const FString AttributeName = Attribute.GetName();\n"
+        )
+        for aid in ids:
+            yield f"    if (AttributeName == TEXT(\"{aid}\")) return {enum_name}::{aid};\n"
+        yield (
+            f"    return {enum_name}::None;\n"
+            "}\n"
+        )
+
+
+TAG_DEV_COMMENT = "Auto-generated by AttributeSet Generator"
+
+
+def emit_gameplay_tags_ini(model):
+    return iter_gameplay_tags_ini(model["records"], model["tag_prefix"], TAG_DEV_COMMENT)
+
+
+def emit_dispatch_benchmark(model):
+    # An actor timing one change through each dispatch path; results go to the log on BeginPlay
+    options = model["options"]
+    class_name = model["class_name"]
+    class_name_u = model["class_name_u"]
+    actor = f"A{class_name}DispatchBenchmark"
+    ids = model["ids"]
+    enum_name = model["enum_name"]
+    single = options["events"] == "single"
+    # Changing a bound attribute re-clamps its dependents through the ASC, which this set doesn't have
+    changed = next((aid for aid in ids if aid not in model["clamp_dependents"]), ids[0] if ids else None)
+    if single:
+        delegate, params, args = "OnAttributeChanged", f"{enum_name} Attribute, float OldValue, float NewValue", (
+            f"{enum_name}::{changed}, Value, Value + 1.f"
+        )
+    elif changed:
+        # Per-attribute events: every attribute has its own delegate
+        delegate, params, args = f"On{changed}Changed", "float OldValue, float NewValue", "Value, Value + 1.f"
+    else:
+        delegate = None
+
+    yield (
+        "#pragma once\n\n"
+        "#include \"CoreMinimal.h\"\n"
+        "#include \"GameFramework/Actor.h\"\n"
+        "#include \"HAL/PlatformTime.h\"\n"
+        f"#include \"{class_name}.h\"\n"
+        f"#include \"{class_name}DispatchBenchmark.generated.h\"\n\n"
+        f"// Times one attribute change through each dispatch path of {class_name_u} and logs the cost per change.\n"
+        "// Place it in a level and compare a client or editor run with a dedicated server build.\n"
+        "UCLASS()\n"
+        f"class {model['api_macro']} {actor} : public AActor\n"
+        "{\n"
+        "    GENERATED_BODY()\n\n"
+        "public:\n"
+        "    UPROPERTY(EditAnywhere, Category=\"Benchmark\")\n"
+        "    int32 Iterations = 100000;\n\n"
+        "    virtual void BeginPlay() override\n"
+        "    {\n"
+        "        Super::BeginPlay();\n\n"
+        f"        Set = NewObject<{class_name_u}>(this);\n"
+    )
+    if delegate:
+        # One listener of each kind, as a game would have
+        yield f"        Set->{delegate}.AddDynamic(this, &{actor}::OnDynamicChanged);\n"
+        if options["native_delegates"]:
+            yield f"        Set->{delegate}Native.AddUObject(this, &{actor}::OnNativeChanged);\n"
+        yield "\n"
+    if changed:
+        yield (
+            f"        Measure(TEXT(\"PostAttributeChange\"), [this](float Value) "
+            f"{{ Set->PostAttributeChange({class_name_u}::Get{changed}Attribute(), Value, Value + 1.f); }});\n"
+        )
+    if delegate:
+        yield f"        Measure(TEXT(\"Dynamic delegate\"), [this](float Value) {{ Set->{delegate}.Broadcast({args}); }});\n"
+        if options["native_delegates"]:
+            yield f"        Measure(TEXT(\"Native delegate\"), [this](float Value) {{ Set->{delegate}Native.Broadcast({args}); }});\n"
+        if options["bp_events"] != "none":
+            yield f"        Measure(TEXT(\"Blueprint event\"), [this](float Value) {{ Set->BP_{delegate}({args}); }});\n"
+    yield (
+        "        UE_LOG(LogTemp, Display, TEXT(\"%s: %d listener calls\"), *GetName(), Calls);\n"
+        "    }\n\n"
+    )
+    if delegate:
+        yield (
+            "    UFUNCTION()\n"
+            f"    void OnDynamicChanged({params})\n"
+            "    {\n"
+            "        ++Calls;\n"
+            "    }\n\n"
+        )
+    yield "private:\n"
+    if delegate and options["native_delegates"]:
+        yield (
+            f"    void OnNativeChanged({params})\n"
+            "    {\n"
+            "        ++Calls;\n"
+            "    }\n\n"
+        )
+    yield (
+        "    template <typename FunctionType>\n"
+        "    void Measure(const TCHAR* Name, FunctionType&& Change)\n"
+        "    {\n"
+        "        const double Start = FPlatformTime::Seconds();\n"
+        "        for (int32 Index = 0; Index < Iterations; ++Index)\n"
+        "        {\n"
+        "            Change(static_cast<float>(Index));\n"
+        "        }\n"
+        "        const double Nanoseconds = (FPlatformTime::Seconds() - Start) * 1e9 / FMath::Max(Iterations, 1);\n"
+        "        UE_LOG(LogTemp, Display, TEXT(\"%s: %-20s %8.1f ns per change\"), *GetName(), Name, Nanoseconds);\n"
+        "    }\n\n"
+        "    UPROPERTY(Transient)\n"
+        f"    {class_name_u}* Set = nullptr;\n\n"
+        "    int32 Calls = 0;\n"
+        "};\n"
+    )
+
+
+OUTPUT_STAGES = {}
+
+
+def register_stage(name, filename, emit):
+    # filename is formatted with the class name; emit(model) yields the file's fragments
+    OUTPUT_STAGES[name] = (filename, emit)
+
+
+register_stage("header", "{class_name}.h", emit_header)
+register_stage("cpp", "{class_name}.cpp", emit_cpp)
+register_stage("tags_ini", "{class_name}_GameplayTags.ini", emit_gameplay_tags_ini)
+register_stage("dispatch_benchmark", "{class_name}DispatchBenchmark.h", emit_dispatch_benchmark)
+
+DEFAULT_STAGES = ("header", "cpp")
+
+
+def resolve_stages(stages, tag_prefix):
+    if stages is None:
+        # The GameplayTags ini is only produced when a tag prefix is given
+        stages = DEFAULT_STAGES if tag_prefix is None else DEFAULT_STAGES + ("tags_ini",)
+    stages = tuple(dict.fromkeys(stages))
+    for name in stages:
+        if name not in OUTPUT_STAGES:
+            raise ValueError(f"Unknown output stage: {name}")
+    return stages
+
+
+# --- Per-file entry points over the model, for callers that want a single output ---
+def iter_header(attributes, replicated, api_macro, class_name, base_class, options=None):
+    return emit_header(build_model(attributes, replicated, api_macro, class_name, base_class, options=options))
+
+
+def iter_cpp(attributes, replicated, api_macro, class_name, base_class, options=None):
+    return emit_cpp(build_model(attributes, replicated, api_macro, class_name, base_class, options=options))
+
+
+def emit_code(attributes, replicated, api_macro, class_name, base_class, **options):
+    model = build_model(attributes, replicated, api_macro, class_name, base_class, options=options)
+    return "".join(emit_header(model)), "".join(emit_cpp(model))
+
+
+# --- User templates (see GasAttributesTemplates.py) replace the built-in emitter of their stage ---
+def template_context(model):
+    context = dict(model)
+    context["format_float"] = format_float
+    context["clamp_bound"] = clamp_bound
+    # Change-event calls as configured by the options, as text without the final newline
+    options = model["options"]
+    context["broadcast"] = lambda aid, indent: "".join(iter_broadcast(aid, indent, options))[:-1]
+    context["shared_broadcast"] = lambda attribute, indent: "".join(iter_shared_broadcast(attribute, indent, options))[:-1]
+    context["tag_root"] = tag_root(model["tag_prefix"])
+    context["dev_comment"] = TAG_DEV_COMMENT
+    return context
+
+
+def load_templates(template_dir, stages, output_dir=""):
+    if not template_dir:
+        return {}
+    # Only imported when templates are in use, so plain runs don't pay for it at startup
+    import GasAttributesTemplates
+    # Compiled templates are cached next to the generation cache, wherever the tool is run from
+    cache_dir = os.path.join(output_dir, GasAttributesTemplates.TEMPLATE_CACHE_DIR)
+    return GasAttributesTemplates.load_stage_templates(template_dir, stages, cache_dir)
+
+
+def run_stages(model, stages, parallel=False, progress=None, templates=None, output_dir="", writer=None,
+               profiler=None):
+    # Returns {path: written?} in stage order. progress(done, total) runs on the calling
+    # thread between files; raising from it stops generation there. With a writer, changed
+    # files are staged for it to publish instead of being renamed into place one by one.
+    templates = templates or {}
+    context = template_context(model) if templates else None
+
+    def emitter(name):
+        if name in templates:
+            return lambda model: templates[name].iter_render(context)
+        return OUTPUT_STAGES[name][1]
+
+    def write(path, name, emit):
+        chunks = emit(model)
+        if profiler:
+            chunks = profiler.stream(f"emit:{name}", chunks)
+        with _phase(profiler, "write", file=path):
+            return GasAttributesCache.write_stream_if_changed(path, chunks, writer)
+
+    outputs = [
+        (os.path.join(output_dir, OUTPUT_STAGES[name][0].format(class_name=model["class_name"])), name, emitter(name))
+        for name in stages
+    ]
+    changed = {}
+    if progress:
+        progress(0, len(outputs))
+
+    if not parallel or len(outputs) < 2:
+        for path, name, emit in outputs:
+            changed[path] = write(path, name, emit)
+            if progress:
+                progress(len(changed), len(outputs))
+    else:
+        pool = ThreadPoolExecutor(max_workers=len(outputs))
+        try:
+            futures = {pool.submit(write, path, name, emit): path for path, name, emit in outputs}
+            for future in as_completed(futures):
+                changed[futures[future]] = future.result()
+                if progress:
+                    progress(len(changed), len(outputs))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    return {path: changed[path] for path, _, _ in outputs}
+
+
+def generate_code(attributes, replicated, api_macro, class_name, base_class, tag_prefix=None,
+                  use_cache=True, progress=None, stages=None, parallel=False, template_dir=None,
+                  shared_header=None, output_dir=None, writer=None, profiler=None, **options):
+    # Files are written into output_dir (default: the working directory). Without a writer
+    # they are published together when generation succeeds; with one, the caller commits.
+    with _phase(profiler, "generate", class_name=class_name):
+        return _generate(
+            attributes, replicated, api_macro, class_name, base_class, tag_prefix, use_cache, progress, stages,
+            parallel, template_dir, shared_header, output_dir, writer, profiler, options
+        )
+
+
+def _generate(attributes, replicated, api_macro, class_name, base_class, tag_prefix, use_cache, progress, stages,
+              parallel, template_dir, shared_header, output_dir, writer, profiler, options):
+    options = resolve_options(options)
+    stages = resolve_stages(stages, tag_prefix)
+    output_dir = output_dir or ""
+    outputs = [os.path.join(output_dir, OUTPUT_STAGES[name][0].format(class_name=class_name)) for name in stages]
+
+    # Unchanged inputs with untouched outputs: skip generation and leave mtimes alone
+    with _phase(profiler, "cache_check"):
+        templates = load_templates(template_dir, stages, output_dir)
+        cache = GasAttributesCache.GenerationCache(os.path.join(output_dir, GasAttributesCache.CACHE_DIR))
+        extra = {"templates": {name: template.digest for name, template in templates.items()}} if templates else {}
+        if shared_header:
+            extra["shared_header"] = shared_header
+        key = GasAttributesCache.inputs_key(
+            outputs=outputs, attributes=list(attributes), replicated=list(replicated),
+            api_macro=api_macro, class_name=class_name, base_class=base_class,
+            options=options, tag_prefix=tag_prefix, **extra
+        )
+        entry = cache.fresh_entry(class_name, key) if use_cache else None
+        # A set that was sharded before leaves its shard classes behind, redeclaring this one's names
+        removed = [] if shared_header else stale_layout_files(cache, class_name, output_dir, False, outputs)
+    # The summary is the one stored with the outputs, so a skipped run reports the de-duplicated counts too
+    if entry and "replication" in entry and not removed:
+        return {
+            "skipped": True,
+            "written": [],
+            "unchanged": outputs,
+            "removed": [],
+            "replication": entry["replication"],
+        }
+
+    own_writer = writer is None
+    if own_writer:
+        writer = GasAttributesCache.OutputWriter()
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    try:
+        model = build_model(
+            attributes, replicated, api_macro, class_name, base_class, tag_prefix, options, shared_header, profiler
+        )
+        changed = run_stages(model, stages, parallel, progress, templates, output_dir, writer, profiler)
+        for path in removed:
+            writer.remove(path)
+        # Stamped from the staged files, which keep their size and mtime when renamed
+        with _phase(profiler, "cache_store"):
+            cache.store(class_name, key, outputs, writer.sources(), replication=model["replication"])
+        if own_writer:
+            with _phase(profiler, "commit"):
+                writer.commit()
+    except BaseException:
+        if own_writer:
+            writer.discard()
+        raise
+    return {
+        "skipped": False,
+        "written": [path for path, written in changed.items() if written],
+        "unchanged": [path for path, written in changed.items() if not written],
+        "removed": removed,
+        "replication": model["replication"],
+    }
+
+
+def sharded_entry(class_name):
+    # The cache entry of a sharded set; "." can't appear in a class name, so it never clashes
+    # with the entry of the same set generated as one class, or with one of its shards
+    return f"{class_name}.shards"
+
+
+def stale_layout_files(cache, class_name, output_dir, sharded, keep):
+    # Outputs left by the set's other layout (one class vs shards) that still exist, minus keep
+    if sharded:
+        names = [os.path.basename(path) for path in cache.entry(class_name).get("files", {})]
+    else:
+        entry = cache.entry(sharded_entry(class_name))
+        names = [os.path.basename(path) for path in entry.get("files", {})]
+        names += [name for filenames in entry.get("shard_files", {}).values() for name in filenames]
+    keep = {os.path.normcase(os.path.abspath(path)) for path in keep}
+    paths = [os.path.join(output_dir, name) for name in dict.fromkeys(names)]
+    return [path for path in paths if os.path.normcase(os.path.abspath(path)) not in keep and os.path.exists(path)]
+
+
+# --- Sharding: one large set split into several AttributeSet classes over a shared accessor header ---
+SHARD_MODES = ("hash", "prefix")
+
+# Prefix sharding puts attributes without a "Category_" prefix here
+UNPREFIXED_SHARD = "General"
+
+
+def resolve_sharding(shards=None, max_shard_size=None, shard_by="hash"):
+    if shard_by not in SHARD_MODES:
+        raise ValueError(f"shard_by must be one of {', '.join(SHARD_MODES)}")
+    for name, value in (("shards", shards), ("max_shard_size", max_shard_size)):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError(f"{name} must be a positive integer")
+    if shard_by == "prefix" and (shards or max_shard_size):
+        raise ValueError("shards and max_shard_size only apply to hash sharding")
+    if shard_by == "hash" and not (shards or max_shard_size):
+        raise ValueError("Hash sharding needs shards or max_shard_size")
+    return shards, max_shard_size, shard_by
+
+
+def shard_score(key, shard):
+    return int.from_bytes(hashlib.blake2b(f"{shard}\0{key}".encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def bound_groups(records):
+    # Attributes linked by min=/max= must live in one class; each group is keyed by its smallest id
+    parent = {record["id"]: record["id"] for record in records}
+
+    def find(aid):
+        while parent[aid] != aid:
+            parent[aid] = parent[parent[aid]]
+            aid = parent[aid]
+        return aid
+
+    for record in records:
+        for key in ("min", "max"):
+            bound = record[key]
+            if isinstance(bound, str) and bound in parent:
+                a, b = find(record["id"]), find(bound)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+    return {record["id"]: find(record["id"]) for record in records}
+
+
+def assign_shards(records, shards=None, max_shard_size=None, shard_by="hash"):
+    shards, max_shard_size, shard_by = resolve_sharding(shards, max_shard_size, shard_by)
+    groups = bound_groups(records)
+
+    if shard_by == "prefix":
+        assignment = {}
+        for record in records:
+            prefix, sep, _ = groups[record["id"]].partition("_")
+            assignment.setdefault(prefix if sep and prefix else UNPREFIXED_SHARD, []).append(record)
+        return {name: assignment[name] for name in sorted(assignment)}
+
+    sizes = Counter(groups.values())
+    if max_shard_size and max(sizes.values(), default=0) > max_shard_size:
+        raise ValueError(
+            f"{max(sizes.values())} attributes are linked by min=/max= and must share a shard, "
+            f"more than max_shard_size ({max_shard_size})"
+        )
+    shards = max(shards or 1, -(-len(records) // max_shard_size) if max_shard_size else 1)
+    while True:
+        names = [f"Shard{i}" for i in range(shards)]
+        # Rendezvous hashing: each group ranks the shards by a hash of its own key and the shard
+        # name, so adding one attribute changes one shard and growing N moves about 1/N of them
+        ranked = {
+            key: sorted(names, key=lambda name: shard_score(key, name), reverse=True) for key in sizes
+        }
+        chosen = {}
+        if not max_shard_size:
+            chosen = {key: ranking[0] for key, ranking in ranked.items()}
+        else:
+            # Hashing spreads groups unevenly, so max_shard_size is a cap rather than an average:
+            # groups take their first choice in order of affinity, and only the ones that find it
+            # full move on to their next choice
+            load = dict.fromkeys(names, 0)
+            order = sorted(sizes, key=lambda key: (-shard_score(key, ranked[key][0]), key))
+            for key in order:
+                for name in ranked[key]:
+                    if load[name] + sizes[key] <= max_shard_size:
+                        chosen[key] = name
+                        load[name] += sizes[key]
+                        break
+                else:
+                    break
+        if len(chosen) == len(sizes):
+            break
+        # Linked groups couldn't be packed into this many shards
+        shards += 1
+
+    assignment = {}
+    for record in records:
+        assignment.setdefault(chosen[groups[record["id"]]], []).append(record)
+    return {name: assignment[name] for name in names if name in assignment}
+
+
+def emit_shared_header(model):
+    # Only the accessor macros: nothing here depends on the attributes, so adding one doesn't
+    # rewrite this header and recompile every shard. It declares no reflected types either.
+    push_model = model["options"]["push_model"]
+    yield (
+        "#pragma once\n\n"
+        "#include \"CoreMinimal.h\"\n"
+        "#include \"AbilitySystemComponent.h\"\n"
+    )
+    if push_model:
+        yield "#include \"Net/Core/PushModel/PushModel.h\"\n"
+    yield "\n"
+    yield from iter_accessor_macros(push_model)
+
+
+def generate_sharded(attributes, replicated, api_macro, class_name, base_class, tag_prefix=None,
+                     shards=None, max_shard_size=None, shard_by="hash", use_cache=True, progress=None,
+                     stages=None, parallel=False, template_dir=None, output_dir=None, writer=None, profiler=None,
+                     **options):
+    with _phase(profiler, "generate", class_name=class_name):
+        return _generate_sharded(
+            attributes, replicated, api_macro, class_name, base_class, tag_prefix, shards, max_shard_size, shard_by,
+            use_cache, progress, stages, parallel, template_dir, output_dir, writer, profiler, options
+        )
+
+
+def _generate_sharded(attributes, replicated, api_macro, class_name, base_class, tag_prefix, shards, max_shard_size,
+                      shard_by, use_cache, progress, stages, parallel, template_dir, output_dir, writer, profiler,
+                      options):
+    options = resolve_options(options)
+    stages = resolve_stages(stages, tag_prefix)
+    model = build_model(attributes, replicated, api_macro, class_name, base_class, tag_prefix, options,
+                        profiler=profiler, sharded=True)
+    with _phase(profiler, "assign_shards"):
+        assignment = assign_shards(model["records"], shards, max_shard_size, shard_by)
+    output_dir = output_dir or ""
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    # Every shard is published in the same commit as the shared header it includes
+    own_writer = writer is None
+    if own_writer:
+        writer = GasAttributesCache.OutputWriter()
+    try:
+        result = _generate_shards(
+            model, assignment, api_macro, base_class, stages, use_cache, progress, parallel, template_dir,
+            output_dir, writer, profiler, options
+        )
+        if own_writer:
+            with _phase(profiler, "commit"):
+                writer.commit()
+    except BaseException:
+        if own_writer:
+            writer.discard()
+        raise
+    return result
+
+
+def _generate_shards(model, assignment, api_macro, base_class, stages, use_cache, progress, parallel, template_dir,
+                     output_dir, writer, profiler, options):
+    class_name = model["class_name"]
+    # The accessor header and the tags ini cover the whole set; each shard's header declares its own enum
+    shared_header = f"{class_name}Attributes.h"
+    shared_path = os.path.join(output_dir, shared_header)
+    chunks = emit_shared_header(model)
+    if profiler:
+        chunks = profiler.stream("emit:shared_header", chunks)
+    with _phase(profiler, "write", file=shared_path):
+        changed = {shared_path: GasAttributesCache.write_stream_if_changed(shared_path, chunks, writer)}
+    if "tags_ini" in stages:
+        changed.update(run_stages(
+            model, ("tags_ini",), templates=load_templates(template_dir, ("tags_ini",), output_dir),
+            output_dir=output_dir, writer=writer, profiler=profiler
+        ))
+    shard_stages = tuple(name for name in stages if name != "tags_ini")
+
+    result = {
+        "skipped": not any(changed.values()),
+        "written": [path for path, written in changed.items() if written],
+        "unchanged": [path for path, written in changed.items() if not written],
+        "removed": [],
+        "replication": model["replication"],
+        "shards": {},
+    }
+    # Shard class -> its file names, recorded in the set's cache entry
+    shard_files = {}
+    for done, (name, records) in enumerate(assignment.items()):
+        if progress:
+            progress(done, len(assignment))
+        shard_class = f"{class_name}_{name}"
+        result["shards"][shard_class] = [record["id"] for record in records]
+        if not shard_stages:
+            continue
+        shard = generate_code(
+            [record["line"] for record in records],
+            [record["line"] for record in records if record["id"] in model["replicated_set"]],
+            api_macro, shard_class, base_class, None, use_cache, None, shard_stages, parallel,
+            template_dir, shared_header, output_dir, writer, profiler, **options
+        )
+        result["skipped"] = result["skipped"] and shard["skipped"]
+        result["written"].extend(shard["written"])
+        result["unchanged"].extend(shard["unchanged"])
+        shard_files[shard_class] = [os.path.basename(path) for path in shard["written"] + shard["unchanged"]]
+
+    # Shards that no longer exist (an emptied prefix group, fewer shards) still refer to attributes
+    # the new set doesn't declare, so their files go in the same commit as the new ones
+    cache = GasAttributesCache.GenerationCache(os.path.join(output_dir, GasAttributesCache.CACHE_DIR))
+    for shard_class, filenames in cache.entry(sharded_entry(class_name)).get("shard_files", {}).items():
+        if shard_class in result["shards"]:
+            continue
+        for filename in filenames:
+            path = os.path.join(output_dir, filename)
+            if os.path.exists(path):
+                writer.remove(path)
+                result["removed"].append(path)
+    # Likewise the outputs of the set generated as one class, which declares the same names
+    for path in stale_layout_files(cache, class_name, output_dir, True, result["written"] + result["unchanged"]):
+        writer.remove(path)
+        result["removed"].append(path)
+    if result["removed"]:
+        result["skipped"] = False
+    with _phase(profiler, "cache_store"):
+        key = GasAttributesCache.inputs_key(class_name=class_name, shards=result["shards"])
+        cache.store(sharded_entry(class_name), key, list(changed), writer.sources(), shard_files=shard_files)
+    if progress:
+        progress(len(assignment), len(assignment))
+    return result
@@ -1,185 +1,17 @@
 import tkinter as tk
 from tkinter import messagebox
+from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
 import json
 import os
+import time
 
-def to_identifier(name):
-    return ''.join(c if c.isalnum() else '_' for c in name)
-
-def generate_code(attributes, replicated, api_macro, class_name, base_class):
-    def to_identifier_local(name):
-        return ''.join(c if c.isalnum() else '_' for c in name)
-
-    class_name_u = f"U{class_name}"
-    header_file = f"{class_name}.h"
-    cpp_file = f"{class_name}.cpp"
-
-    base_class_u = base_class if base_class.startswith('U') else f"U{base_class}"
-    include_name = base_class[1:] if base_class.startswith('U') else base_class
-
-    enum_values = [to_identifier_local(attr) for attr in attributes]
-
-    enum_code = "UENUM(BlueprintType)\nenum class AllAttributesEnum : uint8\n{\n"
-    for value in enum_values:
-        enum_code += f"    {value} UMETA(DisplayName = \"{value}\"),\n"
-    enum_code += "    None UMETA(Hidden)\n};\n\n"
-
-    static_func_decl = (
-        "    UFUNCTION(BlueprintPure, Category=\"Attributes\")\n"
-        "    static AllAttributesEnum AttributeToEnum(const FGameplayAttribute& Attribute);\n\n"
-    )
-
-    header = (
-        "#pragma once\n\n"
-        "#include \"CoreMinimal.h\"\n"
-        f"#include \"{include_name}.h\"\n"
-        "#include \"AbilitySystemComponent.h\"\n"
-        "#include \"GameplayEffectExtension.h\"\n"
-        f"#include \"{class_name}.generated.h\"\n\n"
-        f"{enum_code}"
-        "#define ATTRIBUTE_ACCESSORS(ClassName, PropertyName) \\\n"
-        "    GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName) \\\n"
-        "    GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName) \\\n"
-        "    GAMEPLAYATTRIBUTE_VALUE_SETTER(PropertyName) \\\n"
-        "    GAMEPLAYATTRIBUTE_VALUE_INITTER(PropertyName)\n\n"
-    )
-
-    # --- Delegate declarations (one per attribute) ---
-    for attr in attributes:
-        aid = to_identifier_local(attr)
-        header += (
-            "DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams("
-            f"FOn{aid}Changed, float, OldValue, float, NewValue);\n"
-        )
-    header += "\n"
-
-    header += (
-        "UCLASS()\n"
-        f"class {api_macro} {class_name_u} : public {base_class_u}\n"
-        "{\n"
-        "    GENERATED_BODY()\n\n"
-        "public:\n"
-        f"    {class_name_u}();\n\n"
-        f"{static_func_decl}"
-        "    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;\n\n"
-        "    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)\n"
-        "    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;\n\n"
-        "public:\n\n"
-    )
-
-    # --- Attributes + Accessors ---
-    for attr in attributes:
-        aid = to_identifier_local(attr)
-        if attr in replicated:
-            header += (
-                "    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_"
-                f"{aid}, Category = \"Attributes\")\n"
-                f"    FGameplayAttributeData {aid};\n"
-                f"    ATTRIBUTE_ACCESSORS({class_name_u}, {aid})\n\n"
-            )
-        else:
-            header += (
-                "    UPROPERTY(BlueprintReadOnly, Category = \"Attributes\")\n"
-                f"    FGameplayAttributeData {aid};\n"
-                f"    ATTRIBUTE_ACCESSORS({class_name_u}, {aid})\n\n"
-            )
-
-    # --- Events: delegate + BP event per attribute ---
-    header += "    // Per-attribute change events\n"
-    for attr in attributes:
-        aid = to_identifier_local(attr)
-        header += (
-            f"    UPROPERTY(BlueprintAssignable, Category=\"Attributes|Events\")\n"
-            f"    FOn{aid}Changed On{aid}Changed;\n\n"
-            f"    UFUNCTION(BlueprintImplementableEvent, Category=\"Attributes|Events\")\n"
-            f"    void BP_On{aid}Changed(float OldValue, float NewValue);\n\n"
-        )
-
-    # --- OnRep for replicated attributes ---
-    for attr in replicated:
-        aid = to_identifier_local(attr)
-        header += (
-            "    UFUNCTION()\n"
-            f"    void OnRep_{aid}(const FGameplayAttributeData& Old{aid});\n\n"
-        )
-
-    header += "};\n"
-
-    cpp = (
-        f"#include \"{header_file}\"\n"
-        "#include \"Net/UnrealNetwork.h\"\n"
-        "#include \"GameplayEffectExtension.h\"\n\n"
-        f"{class_name_u}::{class_name_u}()\n"
-        "{\n"
-        "}\n\n"
-        f"void {class_name_u}::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const\n"
-        "{\n"
-        "    Super::GetLifetimeReplicatedProps(OutLifetimeProps);\n"
-    )
-
-    for attr in replicated:
-        aid = to_identifier_local(attr)
-        cpp += (
-            f"    DOREPLIFETIME_CONDITION_NOTIFY({class_name_u}, {aid}, COND_None, REPNOTIFY_Always);\n"
-        )
-
-    cpp += "}\n\n"
-
-    # --- PostAttributeChange: fire per-attribute events on server/local changes ---
-    cpp += (
-        f"void {class_name_u}::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)\n"
-        "{\n"
-        "    Super::PostAttributeChange(Attribute, OldValue, NewValue);\n\n"
-        "    if (OldValue == NewValue)\n"
-        "    {\n"
-        "        return;\n"
-        "    }\n\n"
-    )
-
-    for attr in attributes:
-        aid = to_identifier_local(attr)
-        cpp += (
-            f"    if (Attribute == Get{aid}Attribute())\n"
-            "    {\n"
-            f"        On{aid}Changed.Broadcast(OldValue, NewValue);\n"
-            f"        BP_On{aid}Changed(OldValue, NewValue);\n"
-            "        return;\n"
-            "    }\n\n"
-        )
-
-    cpp += "}\n\n"
-
-    # --- OnRep: replicated attributes fire events on clients ---
-    for attr in replicated:
-        aid = to_identifier_local(attr)
-        cpp += (
-            f"void {class_name_u}::OnRep_{aid}(const FGameplayAttributeData& Old{aid})\n"
-            "{\n"
-            f"    GAMEPLAYATTRIBUTE_REPNOTIFY({class_name_u}, {aid}, Old{aid});\n"
-            f"    const float OldValue = Old{aid}.GetCurrentValue();\n"
-            f"    const float NewValue = {aid}.GetCurrentValue();\n"
-            "    if (OldValue != NewValue)\n"
-            "    {\n"
-            f"        On{aid}Changed.Broadcast(OldValue, NewValue);\n"
-            f"        BP_On{aid}Changed(OldValue, NewValue);\n"
-            "    }\n"
-            "}\n\n"
-        )
+import GasAttributesJobs
 
-    # --- AttributeToEnum implementation ---
-    cpp += f"AllAttributesEnum {class_name_u}::AttributeToEnum(const FGameplayAttribute& Attribute)\n"
-    cpp += "{\n"
-    cpp += "    const FString AttributeName = Attribute.GetName();\n"
-    for value in enum_values:
-        cpp += f"    if (AttributeName == TEXT(\"{value}\")) return AllAttributesEnum::{value};\n"
-    cpp += "    return AllAttributesEnum::None;\n"
-    cpp += "}\n"
-
-    with open(header_file, 'w', encoding='utf-8') as f:
-        f.write(header)
-    with open(cpp_file, 'w', encoding='utf-8') as f:
-        f.write(cpp)
+def __getattr__(name):
+    # generate_code and friends live in GasAttributesCore, imported on first use
+    import GasAttributesCore
+    return getattr(GasAttributesCore, name)
 
 
 class ToolTip:
@@ -209,14 +41,43 @@ class ToolTip:
             self.tip_window.destroy()
             self.tip_window = None
 
+# Settings keys the window reads into (or derives from) its fields
+SETTINGS_FIELDS = (
+    "replicated", "nonreplicated", "api_macro", "class_name", "base_class", "output_dir", "template_dir", "index",
+)
+
+
 class AttributeUI:
-    def __init__(self, root):
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, root, tags_ini=False):
         self.root = root
         self.root.title("AttributeSet Generator")
 
+        # GasAttributesGeneratorExtended.py is this same UI with the GameplayTags ini stage enabled
+        self.tags_ini = tags_ini
+        # Set by "template_dir" and "index" entries in a profile; there are no fields for them in the window
+        self.template_dir = None
+        self.index_file = None
+        # Keys of the loaded profile the window has no fields for (e.g. generator options from an
+        # imported manifest), kept when it is saved again
+        self.profile_extra = {}
+        # job id -> what the job's class declares, recorded in the index once it is generated
+        self.index_entries = {}
+
+        # Named configurations; the store is only opened when a profile is loaded, listed or saved
+        self.profiles_file = "profiles.db"
+        self.profiles = None
+        # Read when there is no profile store yet. Every save also exports the saved profile here,
+        # so GasAttributesWatch and GasAttributesBatch pick up the configuration being edited
         self.settings_file = "settings.json"
+        # Written after each generation while "Profile generation" is ticked
+        self.profile_file = "profile_trace.json"
+        self.runner = GasAttributesJobs.JobRunner()
         self.setup_ui()
-        self.load_settings()
+        # Filled in once the window is up
+        self.root.after_idle(self.load_settings)
+        self.root.after(self.POLL_INTERVAL_MS, self.poll_jobs)
 
     def setup_ui(self):
         tk.Label(self.root, text="Replicated Attributes (one per line):").grid(row=0, column=0, padx=5, pady=5)
@@ -224,6 +85,7 @@ class AttributeUI:
 
         self.replicated_input = ScrolledText(self.root, height=10, width=30)
         self.replicated_input.grid(row=1, column=0, padx=5, pady=5)
+        ToolTip(self.replicated_input, "Optional per-attribute settings, e.g.: Health cond=OwnerOnly notify=OnChanged")
 
         self.nonreplicated_input = ScrolledText(self.root, height=10, width=30)
         self.nonreplicated_input.grid(row=1, column=1, padx=5, pady=5)
@@ -243,13 +105,55 @@ class AttributeUI:
         self.base_entry.grid(row=4, column=1, sticky="w")
         ToolTip(self.base_entry, "Base class to inherit from (e.g., MyBaseSet)")
 
+        tk.Label(self.root, text="Output Folder:").grid(row=5, column=0, sticky="e")
+        self.output_entry = tk.Entry(self.root)
+        self.output_entry.grid(row=5, column=1, sticky="w")
+        ToolTip(self.output_entry, "Module folder the files are written to, e.g. Source/MyGame (empty: current folder)")
+
+        tk.Label(self.root, text="Profile:").grid(row=6, column=0, sticky="e")
+        self.profile_entry = ttk.Combobox(self.root, postcommand=self.list_profiles)
+        self.profile_entry.grid(row=6, column=1, sticky="w")
+        self.profile_entry.bind("<<ComboboxSelected>>", lambda event: self.load_profile(self.profile_entry.get()))
+        ToolTip(
+            self.profile_entry,
+            "Saved configuration to load or save as. Type a name prefix or an attribute name to filter the list"
+        )
+
+        row = 7
+        if self.tags_ini:
+            tk.Label(self.root, text="Tag Prefix:").grid(row=row, column=0, sticky="e")
+            self.tag_prefix_entry = tk.Entry(self.root)
+            self.tag_prefix_entry.grid(row=row, column=1, sticky="w")
+            ToolTip(
+                self.tag_prefix_entry,
+                'Prepended to each attribute tag. Example: Stat.Item. -> Stat.Item.Health'
+            )
+            row += 1
+
+        self.profile_var = tk.BooleanVar(value=False)
+        profile_check = tk.Checkbutton(self.root, text="Profile generation", variable=self.profile_var)
+        profile_check.grid(row=row, column=1, sticky="w")
+        ToolTip(profile_check, f"Time each generation phase and write a Chrome trace to {self.profile_file}")
+        row += 1
+
         self.generate_btn = tk.Button(self.root, text="Generate Files", command=self.generate_files)
-        self.generate_btn.grid(row=5, column=0, pady=10)
+        self.generate_btn.grid(row=row, column=0, pady=10)
+
+        self.save_btn = tk.Button(self.root, text="Save Profile", command=self.save_settings)
+        self.save_btn.grid(row=row, column=1, pady=10)
+
+        # Generation runs on a worker thread; several classes can be queued at once
+        self.progress = ttk.Progressbar(self.root, mode="determinate", maximum=100, length=200)
+        self.progress.grid(row=row + 1, column=0, padx=5, pady=5)
+
+        self.cancel_btn = tk.Button(self.root, text="Cancel", command=self.runner.cancel, state=tk.DISABLED)
+        self.cancel_btn.grid(row=row + 1, column=1, pady=5)
 
-        self.save_btn = tk.Button(self.root, text="Save Settings", command=self.save_settings)
-        self.save_btn.grid(row=5, column=1, pady=10)
+        self.status = tk.StringVar(value="Ready.")
+        tk.Label(self.root, textvariable=self.status, anchor="w").grid(row=row + 2, column=0, columnspan=2, sticky="we", padx=5)
 
     def generate_files(self):
+        start = time.perf_counter_ns()
         replicated = [line.strip() for line in self.replicated_input.get("1.0", tk.END).splitlines() if line.strip()]
         nonreplicated = [line.strip() for line in self.nonreplicated_input.get("1.0", tk.END).splitlines() if line.strip()]
         all_attrs = replicated + nonreplicated
@@ -261,39 +165,205 @@ class AttributeUI:
         api_macro = self.api_entry.get().strip()
         class_name = self.class_entry.get().strip()
         base = self.base_entry.get().strip()
+        tag_prefix = self.tag_prefix_entry.get().strip() if self.tags_ini else None
+        output_dir = self.output_entry.get().strip() or None
 
         if not class_name:
             messagebox.showerror("Error", "Please enter a class name.")
             return
+        if not base:
+            messagebox.showerror("Error", "Please enter a base class name.")
+            return
+        if any(not (c.isalnum() or c == "_") for c in class_name):
+            messagebox.showerror("Error", "Class name must be letters, digits, or underscore only.")
+            return
 
-        generate_code(all_attrs, replicated, api_macro, class_name, base)
-        messagebox.showinfo("Success", f"{class_name}.h and {class_name}.cpp generated.")
+        import GasAttributesCore
+
+        try:
+            # Fail fast on invalid lines before queueing the job
+            GasAttributesCore.build_model(all_attrs, replicated, api_macro, class_name, base, tag_prefix)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        index_entry = None
+        if self.index_file:
+            import GasAttributesIndex
+            try:
+                index = GasAttributesIndex.AttributeIndex(self.index_file)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
+                return
+            index_entry = GasAttributesIndex.describe(all_attrs, class_name, tag_prefix, output_dir=output_dir)
+            conflicts = index.preview({class_name: index_entry})
+            if conflicts:
+                details = "\n".join(GasAttributesIndex.format_conflict(*conflict) for conflict in conflicts[:10])
+                if not messagebox.askyesno("Naming conflicts", f"{details}\n\nGenerate anyway?"):
+                    return
+
+        profiler = None
+        if self.profile_var.get():
+            import GasAttributesTrace
+            profiler = GasAttributesTrace.Profiler()
+            # Reading and validating the text panes happened on this thread, before queueing
+            profiler.add("ui_parse", start, time.perf_counter_ns() - start, 0)
+
+        job = self.runner.submit(
+            class_name, GasAttributesCore.generate_code,
+            all_attrs, replicated, api_macro, class_name, base, tag_prefix,
+            template_dir=self.template_dir, output_dir=output_dir, profiler=profiler
+        )
+        if index_entry is not None:
+            self.index_entries[job.id] = index_entry
+
+    def poll_jobs(self):
+        for kind, job in self.runner.poll():
+            if kind == "progress" and job.total_steps:
+                self.progress["value"] = 100 * job.done_steps / job.total_steps
+            elif kind == "done":
+                if job.result["skipped"] or not job.result["written"]:
+                    self.status.set(f"{job.name} is unchanged; no files were written.")
+                else:
+                    self.status.set(f"{', '.join(job.result['written'])} generated.")
+                if job.id in self.index_entries:
+                    self.record_in_index(job.name, self.index_entries.pop(job.id))
+                profiler = job.kwargs.get("profiler")
+                if profiler:
+                    profiler.save(self.profile_file, "chrome")
+                    self.status.set(f"{self.status.get()} Profile written to {self.profile_file}.")
+            elif kind == "cancelled":
+                self.index_entries.pop(job.id, None)
+                self.status.set(f"{job.name} cancelled.")
+            elif kind == "failed":
+                self.index_entries.pop(job.id, None)
+                self.status.set(f"{job.name} failed.")
+                messagebox.showerror("Error", f"Failed to generate {job.name}: {job.error}")
+
+        active = self.runner.active()
+        self.cancel_btn.config(state=tk.NORMAL if active else tk.DISABLED)
+        if active:
+            running = [job for job in active if job.status == "running"]
+            current = running[0].name if running else active[0].name
+            queued = len(active) - 1
+            self.status.set(f"Generating {current}..." + (f" ({queued} queued)" if queued else ""))
+
+        self.root.after(self.POLL_INTERVAL_MS, self.poll_jobs)
+
+    def record_in_index(self, class_name, entry):
+        import GasAttributesIndex
+        # Reloaded, since the batch tools may have updated it while the window was open
+        index = GasAttributesIndex.AttributeIndex(self.index_file)
+        index.update(class_name, entry)
+        index.save()
+
+    def profile_store(self):
+        if self.profiles is None:
+            import GasAttributesProfiles
+            self.profiles = GasAttributesProfiles.ProfileStore(self.profiles_file)
+        return self.profiles
+
+    def list_profiles(self):
+        # Runs as the drop-down opens: at most a page of matches, never every stored profile
+        try:
+            self.profile_entry["values"] = self.profile_store().search(self.profile_entry.get().strip())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to list profiles: {e}")
 
     def save_settings(self):
-        settings = {
+        settings = dict(self.profile_extra)
+        settings.update({
             "replicated": self.replicated_input.get("1.0", tk.END),
             "nonreplicated": self.nonreplicated_input.get("1.0", tk.END),
             "api_macro": self.api_entry.get().strip(),
             "class_name": self.class_entry.get().strip(),
             "base_class": self.base_entry.get().strip()
-        }
-
-        with open(self.settings_file, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=4)
-        messagebox.showinfo("Saved", "Settings saved successfully.")
+        })
+        if self.output_entry.get().strip():
+            settings["output_dir"] = self.output_entry.get().strip()
+        if self.tags_ini:
+            settings["tag_prefix"] = self.tag_prefix_entry.get().strip()
+        if self.template_dir:
+            settings["template_dir"] = self.template_dir
+        if self.index_file:
+            settings["index"] = self.index_file
+
+        name = self.profile_entry.get().strip() or settings["class_name"] or "default"
+        try:
+            store = self.profile_store()
+            store.save(name, settings)
+            store.set_last_used(name)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save profile: {e}")
+            return
+        try:
+            import GasAttributesCache
+            # Left untouched when nothing changed, so a watcher doesn't regenerate for nothing
+            GasAttributesCache.write_stream_if_changed(self.settings_file, [json.dumps(settings, indent=4)])
+        except OSError as e:
+            messagebox.showerror("Error", f"Profile {name} saved, but {self.settings_file} couldn't be written: {e}")
+            return
+        self.profile_entry.set(name)
+        messagebox.showinfo("Saved", f"Profile {name} saved.")
 
     def load_settings(self):
+        # The last profile used, or a settings.json from before there was a profile store
+        if os.path.exists(self.profiles_file):
+            try:
+                name = self.profile_store().last_used()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open profiles: {e}")
+                return
+            if name:
+                self.load_profile(name)
+            return
         if not os.path.exists(self.settings_file):
             return
         try:
             with open(self.settings_file, 'r', encoding='utf-8') as f:
                 settings = json.load(f)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load settings: {e}")
+            return
+        self.apply_settings(settings)
+        self.profile_entry.set(settings.get("class_name", ""))
+
+    def load_profile(self, name):
+        try:
+            store = self.profile_store()
+            settings = store.get(name)
+            if settings is None:
+                return
+            store.set_last_used(name)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load profile {name}: {e}")
+            return
+        self.apply_settings(settings)
+        self.profile_entry.set(name)
+
+    def apply_settings(self, settings):
+        fields = SETTINGS_FIELDS + ("tag_prefix",) if self.tags_ini else SETTINGS_FIELDS
+        self.profile_extra = {key: value for key, value in settings.items() if key not in fields}
+        try:
+            # Clear existing UI values first (prevents duplicate inserts)
+            self.replicated_input.delete("1.0", tk.END)
+            self.nonreplicated_input.delete("1.0", tk.END)
+            self.api_entry.delete(0, tk.END)
+            self.class_entry.delete(0, tk.END)
+            self.base_entry.delete(0, tk.END)
+            self.output_entry.delete(0, tk.END)
 
             self.replicated_input.insert("1.0", settings.get("replicated", ""))
             self.nonreplicated_input.insert("1.0", settings.get("nonreplicated", ""))
             self.api_entry.insert(0, settings.get("api_macro", ""))
             self.class_entry.insert(0, settings.get("class_name", ""))
             self.base_entry.insert(0, settings.get("base_class", ""))
+            self.output_entry.insert(0, settings.get("output_dir", ""))
+            self.template_dir = settings.get("template_dir") or None
+            self.index_file = settings.get("index") or None
+            if self.tags_ini:
+                self.tag_prefix_entry.delete(0, tk.END)
+                self.tag_prefix_entry.insert(0, settings.get("tag_prefix", "Stat.Item."))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load settings: {e}")
 
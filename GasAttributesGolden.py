@@ -0,0 +1,255 @@
+import argparse
+import difflib
+import fnmatch
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import GasAttributesCore
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+MANIFEST = "manifest.json"
+
+# Timing regressions smaller than this are treated as noise whatever the ratio
+MIN_REGRESSION_SECONDS = 0.005
+
+SAMPLE = ["Health 100", "MaxHealth 100", "Mana 50", "MaxMana 50", "Damage 15", "VoicelinePitch 1.2", "HairLength 0.7"]
+SAMPLE_REPLICATED = SAMPLE[:4]
+
+
+def stats(count, prefix="Stat"):
+    return [f"{prefix}{i} {i % 100}" for i in range(count)]
+
+
+# --- Cases: (name, generator, args, keyword arguments). Huge cases keep digests only ---
+CASES = [
+    ("sample", "code", (SAMPLE, SAMPLE_REPLICATED, "MYGAME_API", "CharacterSet", "AttributeSet"), {}),
+    ("empty_replicated", "code", (SAMPLE, [], "MYGAME_API", "LocalSet", "AttributeSet"), {}),
+    ("all_replicated", "code", (SAMPLE, SAMPLE, "MYGAME_API", "NetSet", "AttributeSet"), {}),
+    ("single_attribute", "code", (["Health"], ["Health"], "", "TinySet", "UAttributeSet"), {}),
+    ("duplicates", "code", (SAMPLE + SAMPLE[:3], SAMPLE_REPLICATED + SAMPLE_REPLICATED, "MYGAME_API", "DupSet", "AttributeSet"), {}),
+    ("odd_characters", "code", (
+        ["Move Speed 600", "Crit.Chance 0.05", "Armor-Pen", "Fire Resist% 10", "_Hidden", "x 1e3"],
+        ["Move Speed 600", "Armor-Pen"], "MYGAME_API", "OddSet", "MyBaseSet"
+    ), {}),
+    ("settings", "code", (
+        ["Health 100 cond=OwnerOnly notify=OnChanged min=0 max=MaxHealth", "MaxHealth 100 cond=COND_InitialOnly",
+         "Mana 50 notify=REPNOTIFY_OnChanged min=0", "Shield max=MaxHealth", "Armor -5.5"],
+        ["Health 100 cond=OwnerOnly notify=OnChanged min=0 max=MaxHealth", "MaxHealth 100 cond=COND_InitialOnly",
+         "Mana 50 notify=REPNOTIFY_OnChanged min=0"], "MYGAME_API", "SettingsSet", "AttributeSet"
+    ), {}),
+    ("clamping_single", "code", (
+        ["Health 100 min=0 max=MaxHealth", "MaxHealth 100 min=1", "Stamina 50 min=-10.5 max=100 event=own"],
+        ["Health 100 min=0 max=MaxHealth", "MaxHealth 100 min=1"], "MYGAME_API", "ClampSet", "AttributeSet"
+    ), {"events": "single", "push_model": True}),
+    ("native_events", "code", (SAMPLE, SAMPLE_REPLICATED, "MYGAME_API", "NativeSet", "AttributeSet"),
+     {"native_delegates": True, "bp_events": "client", "stages": ("header", "cpp", "dispatch_benchmark")}),
+    ("single_native_flag", "code", (
+        SAMPLE[:-1] + ["HairLength 0.7 event=own"], SAMPLE_REPLICATED, "MYGAME_API", "FlagSet", "AttributeSet"
+    ), {"events": "single", "native_delegates": True, "bp_events": "flag",
+        "stages": ("header", "cpp", "dispatch_benchmark")}),
+    ("push_model", "code", (SAMPLE, SAMPLE_REPLICATED, "MYGAME_API", "PushSet", "AttributeSet"),
+     {"push_model": True, "rep_notify": "OnChanged"}),
+    ("chain_legacy", "code", (SAMPLE, SAMPLE_REPLICATED, "MYGAME_API", "ChainSet", "AttributeSet"),
+     {"dispatch": "chain", "legacy_enum_lookup": True}),
+    ("single_event", "code", (
+        SAMPLE[:-1] + ["HairLength 0.7 event=own"], SAMPLE_REPLICATED, "MYGAME_API", "EventSet", "AttributeSet"
+    ), {"events": "single"}),
+    ("tags", "code", (SAMPLE, SAMPLE_REPLICATED, "MYGAME_API", "TagSet", "AttributeSet", "Stat.Item"), {}),
+    ("tags_empty_prefix", "code", (SAMPLE, [], "MYGAME_API", "BareTagSet", "AttributeSet", ""), {}),
+    ("header_only", "code", (SAMPLE, SAMPLE_REPLICATED, "MYGAME_API", "HeaderSet", "AttributeSet"),
+     {"stages": ("header",)}),
+    ("sharded_prefix", "sharded", (
+        ["Combat_Damage 10", "Combat_Crit 0.1", "Move_Speed 600", "Move_Jump", "Health 100 max=MaxHealth", "MaxHealth 100"],
+        ["Combat_Damage 10", "Health 100 max=MaxHealth"], "MYGAME_API", "PrefixSet", "AttributeSet"
+    ), {"shard_by": "prefix"}),
+    # The largest set one class can hold, then a set only shards can hold, then one attribute too many
+    ("huge", "code", (stats(255), stats(255)[::2], "MYGAME_API", "HugeSet", "AttributeSet", "Stat."), {}),
+    ("huge_sharded", "sharded", (stats(5000), stats(5000)[::3], "MYGAME_API", "ShardedSet", "AttributeSet"),
+     {"shards": 32, "push_model": True}),
+    ("enum_overflow", "code", (stats(256), [], "MYGAME_API", "OverflowSet", "AttributeSet"), {}),
+]
+
+HUGE_CASES = ("huge", "huge_sharded")
+
+# Every case's time is recorded and checked relative to this one, measured in the same run
+REFERENCE_CASE = CASES[0]
+
+
+def time_case(case, repeat, workdir, files=None):
+    # The fastest of `repeat` cold generations; with files, the outputs of the last one are kept there
+    name, kind, args, kwargs = case
+    generate = GasAttributesCore.generate_sharded if kind == "sharded" else GasAttributesCore.generate_code
+    best = None
+    for attempt in range(repeat):
+        # A fresh directory per attempt, so every run writes every file
+        run_dir = os.path.join(workdir, f"{name}{attempt}")
+        os.mkdir(run_dir)
+        start = time.perf_counter()
+        try:
+            generate(*args, use_cache=False, output_dir=run_dir, **kwargs)
+        except ValueError as e:
+            # Inputs the generator must reject keep the error as their golden output
+            if files is not None:
+                files["error.txt"] = f"{e}\n".encode("utf-8")
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    if files is not None:
+        for entry in sorted(os.listdir(run_dir)):
+            path = os.path.join(run_dir, entry)
+            if os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    files[entry] = f.read()
+    return best
+
+
+def run_case(case, repeat):
+    # Each case also times the reference case in the same process, right after it, so its cost
+    # can be compared as a multiple of the reference whatever the machine's speed or load
+    files = {}
+    with tempfile.TemporaryDirectory(prefix="golden_") as workdir:
+        seconds = time_case(case, repeat, workdir, files)
+        reference_dir = os.path.join(workdir, "reference")
+        os.mkdir(reference_dir)
+        reference = time_case(REFERENCE_CASE, repeat, reference_dir)
+    return case[0], seconds, seconds / reference, files
+
+
+def run_cases(cases, workers, repeat):
+    # Spawned workers start with fresh hash seeds, so set/dict ordering leaks show up as diffs
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(run_case, case, repeat) for case in cases]
+        return [future.result() for future in futures]
+
+
+def digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(golden_dir):
+    try:
+        with open(os.path.join(golden_dir, MANIFEST), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except OSError:
+        return {}
+
+
+def show_diff(golden_dir, name, filename, data):
+    path = os.path.join(golden_dir, name, filename)
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        expected = f.read().splitlines(keepends=True)
+    actual = data.decode("utf-8").splitlines(keepends=True)
+    diff = list(difflib.unified_diff(expected, actual, f"golden/{name}/{filename}", "generated"))
+    sys.stdout.writelines(diff[:40])
+    if len(diff) > 40:
+        print(f"... {len(diff) - 40} more diff lines")
+
+
+def check(results, golden_dir, max_ratio, timing=True, strict_timing=False):
+    # Slow cases are reported as [slow] warnings; only with strict_timing do they fail
+    manifest = load_manifest(golden_dir)
+    failures = 0
+    for name, seconds, relative, files in results:
+        expected = manifest.get(name)
+        problems = []
+        differing = []
+        if expected is None:
+            problems.append("no golden output (run 'update')")
+        else:
+            actual = {filename: digest(data) for filename, data in files.items()}
+            for filename in sorted(set(expected["files"]) | set(actual)):
+                if filename not in actual:
+                    problems.append(f"{filename} no longer generated")
+                elif filename not in expected["files"]:
+                    problems.append(f"{filename} newly generated")
+                elif actual[filename] != expected["files"][filename]:
+                    problems.append(f"{filename} differs")
+                    differing.append(filename)
+        slow = None
+        baseline = expected.get("relative") if expected else None
+        if timing and baseline:
+            # What the recorded cost comes to on this machine, under this run's load
+            expected_seconds = seconds / relative * baseline
+            if relative > baseline * max_ratio and seconds - expected_seconds > MIN_REGRESSION_SECONDS:
+                slow = f"{relative / baseline:.2f}x slower relative to the {REFERENCE_CASE[0]} case than recorded"
+                if strict_timing:
+                    problems.append(slow)
+
+        baseline_text = f" ({relative:.2f}x {REFERENCE_CASE[0]}, golden {baseline:.2f}x)" if baseline else ""
+        status = "[fail]" if problems else "[slow]" if slow else "[ok]  "
+        print(f"{status} {name:<20} {seconds * 1000:9.2f} ms{baseline_text}")
+        if slow and not strict_timing:
+            print(f"       {slow}")
+        for problem in problems:
+            print(f"       {problem}")
+        for filename in differing:
+            show_diff(golden_dir, name, filename, files[filename])
+        failures += bool(problems)
+    return failures
+
+
+def update(results, golden_dir):
+    manifest = load_manifest(golden_dir)
+    for name, seconds, relative, files in results:
+        case_dir = os.path.join(golden_dir, name)
+        shutil.rmtree(case_dir, ignore_errors=True)
+        # Huge cases are checked by digest only, to keep the repository small
+        if name not in HUGE_CASES:
+            os.makedirs(case_dir)
+            for filename, data in files.items():
+                with open(os.path.join(case_dir, filename), 'wb') as f:
+                    f.write(data)
+        manifest[name] = {
+            "seconds": round(seconds, 6),
+            "relative": round(relative, 3),
+            "files": {filename: digest(data) for filename, data in files.items()},
+        }
+        print(f"[save] {name:<20} {seconds * 1000:9.2f} ms  {len(files)} files")
+    with open(os.path.join(golden_dir, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=4)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Golden-file regression check and benchmark for the generator.")
+    parser.add_argument("command", choices=("check", "update"), help="Compare against the golden files, or rewrite them")
+    parser.add_argument("cases", nargs="*", help="Case names or glob patterns (default: all)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--repeat", type=int, default=3, help="Generations per case; the fastest is recorded")
+    parser.add_argument("--max-ratio", type=float, default=2.0,
+                        help="Report a case that got this many times slower, relative to the reference case")
+    parser.add_argument("--no-timing", action="store_true", help="Only compare output")
+    parser.add_argument("--strict-timing", action="store_true", help="Fail on slow cases instead of warning")
+    parser.add_argument("--golden-dir", default=GOLDEN_DIR)
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if not args.cases or any(fnmatch.fnmatch(case[0], p) for p in args.cases)]
+    if not cases:
+        print("No matching cases")
+        return 1
+
+    start = time.perf_counter()
+    results = run_cases(cases, args.jobs, args.repeat)
+    wall = time.perf_counter() - start
+
+    if args.command == "update":
+        os.makedirs(args.golden_dir, exist_ok=True)
+        update(results, args.golden_dir)
+        return 0
+
+    failures = check(results, args.golden_dir, args.max_ratio, not args.no_timing, args.strict_timing)
+    print(f"{len(results) - failures}/{len(results)} cases passed in {wall:.2f} s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,424 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import GasAttributesCache
+
+# Bump whenever parsing changes, so cached results are parsed again
+CACHE_VERSION = 2
+
+CACHE_FILE = "header_scan.json"
+
+# Build output and editor data never hold hand-written AttributeSets
+SKIP_DIRS = {"Binaries", "Intermediate", "Saved", "DerivedDataCache", GasAttributesCache.CACHE_DIR}
+
+# Headers without this are skipped after a substring check, before any decoding or regex work
+MARKER = b"FGameplayAttributeData"
+
+# Misses below this are parsed in-process; starting workers costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+COMMENT = re.compile(r"//[^\n]*|/\*.*?\*/", re.S)
+# One level of nested parentheses covers meta=(...) inside UCLASS/UPROPERTY
+MACRO_ARGS = r"\(((?:[^()]|\([^()]*\))*)\)"
+CLASS = re.compile(
+    r"UCLASS\s*" + MACRO_ARGS + r"\s*class\s+(?:(\w+_API)\s+)?(U\w+)\s*(?:final\s*)?:\s*public\s+(\w+)\s*\{"
+)
+MEMBER = re.compile(r"(?:UPROPERTY\s*" + MACRO_ARGS + r"\s*)?\bFGameplayAttributeData\s+(\w+)\s*;")
+ACCESSORS = re.compile(r"\bATTRIBUTE_ACCESSORS\w*\s*\(\s*(\w+)\s*,\s*(\w+)\s*\)")
+NUMBER = r"([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)[fF]?"
+INIT = re.compile(r"\bInit(\w+)\s*\(\s*" + NUMBER + r"\s*\)")
+# Constructor initializer lists: ULyraHealthSet::ULyraHealthSet() : Health(100.0f), MaxHealth(100.0f)
+CONSTRUCTOR = re.compile(r"\b(U\w+)\s*::\s*\1\s*" + MACRO_ARGS + r"\s*:([^{;]*)\{")
+INITIALIZER = re.compile(r"(?:^|,)\s*(\w+)\s*\(\s*" + NUMBER + r"\s*\)")
+REPLIFETIME = re.compile(
+    r"\bDOREPLIFETIME_CONDITION_NOTIFY\s*\(\s*(\w+)\s*,\s*(\w+)\s*,\s*COND_(\w+)\s*,\s*REPNOTIFY_(\w+)\s*\)"
+)
+REPLIFETIME_PARAMS = re.compile(r"\bDOREPLIFETIME_WITH_PARAMS\w*\s*\(\s*(\w+)\s*,\s*(\w+)\s*,")
+# Ranges in the clamping table of a generated set; hand-written clamping isn't recognised
+RANGE = re.compile(
+    r"\[\s*static_cast<int32>\(\s*\w+::(\w+)\s*\)\s*\]\s*=\s*"
+    r"\{\s*([^,{}]+?)\s*,\s*([^,{}]+?)\s*,\s*([^,{}]+?)\s*,\s*([^,{}]+?)\s*\}"
+)
+BOUND_CONSTANT = re.compile(NUMBER + r"$")
+BOUND_ATTRIBUTE = re.compile(r"&\s*\w+::(\w+)$")
+PARAMS_SETTING = re.compile(r"\.(Condition|RepNotifyCondition)\s*=\s*(?:COND|REPNOTIFY)_(\w+)")
+# Traces a generated set's options leave behind (see GasAttributesCore.DEFAULT_OPTIONS)
+SHARED_EVENT = re.compile(r"\bF\w+\s+OnAttributeChanged\s*;")
+OWN_EVENT = re.compile(r"\bFOn(\w+)Changed\s+On\1Changed\s*;")
+NATIVE_EVENT = re.compile(r"\bOn\w+ChangedNative\s*;")
+CHAIN_DISPATCH = re.compile(r"\bif\s*\(\s*Attribute\s*==\s*Get\w+Attribute\(\)\s*\)")
+
+
+def class_body(text, start):
+    # Text between the brace at start and its match
+    depth = 0
+    for index in range(start, len(text)):
+        char = text[index]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:index]
+    return text[start + 1:]
+
+
+def format_number(value):
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+def range_bound(constant, attribute):
+    # A min=/max= value from one side of a clamping table entry, or None when unbounded
+    match = BOUND_ATTRIBUTE.match(attribute)
+    if match:
+        return match.group(1)
+    match = BOUND_CONSTANT.match(constant)
+    return format_number(float(match.group(1))) if match else None
+
+
+def parse_cpp(text):
+    # Defaults, replication settings and ranges per attribute, and the generator options of a
+    # generated set, from the set's .cpp. Defaults are keyed by (class, attribute): initializer
+    # lists only count in the set's own constructor, Init...() calls (keyed by None) anywhere.
+    text = COMMENT.sub("", text)
+    defaults = {}
+    for match in CONSTRUCTOR.finditer(text):
+        for name, value in INITIALIZER.findall(match.group(3)):
+            defaults[(match.group(1), name)] = float(value)
+    defaults.update(((None, name), float(value)) for name, value in INIT.findall(text))
+    replication = {}
+    for class_name_u, name, condition, notify in REPLIFETIME.findall(text):
+        replication[(class_name_u, name)] = (condition, notify)
+    # Push-model registrations set Params.Condition/RepNotifyCondition just before each one
+    settings = {}
+    position = 0
+    for match in REPLIFETIME_PARAMS.finditer(text):
+        for key, value in PARAMS_SETTING.findall(text, position, match.start()):
+            settings[key] = value
+        replication[(match.group(1), match.group(2))] = (
+            settings.get("Condition", "None"), settings.get("RepNotifyCondition", "Always")
+        )
+        position = match.end()
+    ranges = {}
+    for name, low, high, low_attribute, high_attribute in RANGE.findall(text):
+        ranges[name] = (range_bound(low, low_attribute), range_bound(high, high_attribute))
+    options = {}
+    if re.search(r"\bbIsPushBased\s*=\s*true\b", text):
+        options["push_model"] = True
+    if CHAIN_DISPATCH.search(text):
+        options["dispatch"] = "chain"
+    if re.search(r"#if\s+!UE_SERVER\b", text):
+        options["bp_events"] = "client"
+    return defaults, replication, ranges, options
+
+
+def generated_options(body, cpp_options):
+    # Options of a set this tool generated (it declares AttributeToEnum), so regenerating it
+    # gives the same files; hand-written sets keep the defaults. Returns (options, own events).
+    if not re.search(r"\bAttributeToEnum\s*\(", body):
+        return {}, set()
+    options = {name: value for name, value in cpp_options.items() if name != "bp_events"}
+    own = set(OWN_EVENT.findall(body))
+    if SHARED_EVENT.search(body):
+        options["events"] = "single"
+        own.discard("Attribute")
+    if NATIVE_EVENT.search(body):
+        options["native_delegates"] = True
+    if re.search(r"\bbFireBlueprintEvents\b", body):
+        options["bp_events"] = "flag"
+    elif not re.search(r"\bBP_On\w+Changed\s*\(", body):
+        options["bp_events"] = "none"
+    elif "bp_events" in cpp_options:
+        options["bp_events"] = cpp_options["bp_events"]
+    if re.search(r"\bAttributeToEnumByName\s*\(", body):
+        options["legacy_enum_lookup"] = True
+    return options, own
+
+
+def parse_header(text, cpp_text=None):
+    # Every AttributeSet class declared in the header, as generator input
+    text = COMMENT.sub("", text)
+    defaults, replication, ranges, cpp_options = parse_cpp(cpp_text) if cpp_text else ({}, {}, {}, {})
+    accessors = {}
+    for class_name_u, name in ACCESSORS.findall(text):
+        accessors.setdefault(class_name_u, []).append(name)
+
+    classes = []
+    for match in CLASS.finditer(text):
+        api_macro, class_name_u, base_class = match.group(2) or "", match.group(3), match.group(4)
+        body = class_body(text, match.end() - 1)
+        names = []
+        replicated = set()
+        for member in MEMBER.finditer(body):
+            specifiers, name = member.group(1) or "", member.group(2)
+            names.append(name)
+            if re.search(r"\bReplicated(Using)?\b", specifiers):
+                replicated.add(name)
+        # Members declared through a macro still have their accessors
+        names += [name for name in accessors.get(class_name_u, ()) if name not in names]
+        if not names:
+            continue
+        options, own = generated_options(body, cpp_options)
+
+        lines = {"replicated": [], "nonreplicated": []}
+        for name in dict.fromkeys(names):
+            parts = [name]
+            default = defaults.get((None, name), defaults.get((class_name_u, name)))
+            if default is not None:
+                parts.append(format_number(default))
+            if name in replicated:
+                condition, notify = replication.get((class_name_u, name), ("None", "Always"))
+                if condition != "None":
+                    parts.append(f"cond={condition}")
+                if notify != "Always":
+                    parts.append(f"notify={notify}")
+            low, high = ranges.get(name, (None, None))
+            if low is not None:
+                parts.append(f"min={low}")
+            if high is not None:
+                parts.append(f"max={high}")
+            if name in own and options.get("events") == "single":
+                parts.append("event=own")
+            lines["replicated" if name in replicated else "nonreplicated"].append(" ".join(parts))
+        classes.append({
+            "class_name": class_name_u[1:],
+            "base_class": base_class,
+            "api_macro": api_macro,
+            **lines,
+            **options,
+        })
+    return classes
+
+
+def sibling_cpp(path):
+    # Module layouts keep the .cpp next to the header or in the matching Private folder
+    stem = os.path.splitext(path)[0]
+    candidates = [stem + ".cpp"]
+    parts = stem.split(os.sep)
+    if "Public" in parts:
+        index = len(parts) - 1 - parts[::-1].index("Public")
+        candidates.append(os.sep.join(parts[:index] + ["Private"] + parts[index + 1:]) + ".cpp")
+    for candidate in candidates:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def file_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def read_set(path):
+    # (header bytes, .cpp path, .cpp bytes); the .cpp is only read for headers with attributes
+    with open(path, 'rb') as f:
+        data = f.read()
+    if MARKER not in data:
+        return data, None, b""
+    cpp = sibling_cpp(path)
+    if cpp is None:
+        return data, None, b""
+    with open(cpp, 'rb') as f:
+        return data, cpp, f.read()
+
+
+def content_hash(data, cpp_data):
+    return hashlib.sha1(data + b"\0" + cpp_data).hexdigest()
+
+
+def scan_file(path, cached=None):
+    # A cache entry for the header: stamps, content hash and the classes it declares. With a
+    # cached entry whose hash still matches (e.g. a touched file), the parse is skipped.
+    data, cpp, cpp_data = read_set(path)
+    digest = content_hash(data, cpp_data)
+    entry = {"stamp": file_stamp(path), "cpp": cpp, "cpp_stamp": file_stamp(cpp) if cpp else None, "hash": digest}
+    if cached and cached.get("hash") == digest:
+        entry["classes"] = cached["classes"]
+        return path, entry, False
+    classes = []
+    if MARKER in data:
+        classes = parse_header(data.decode("utf-8-sig", "replace"), cpp_data.decode("utf-8-sig", "replace"))
+    entry["classes"] = classes
+    return path, entry, MARKER in data
+
+
+def _scan_chunk(items):
+    return [scan_file(path, cached) for path, cached in items]
+
+
+def iter_headers(root):
+    # os.scandir reuses the directory entries' stat data where the platform provides it
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS and not entry.name.startswith("."):
+                    stack.append(entry.path)
+            elif entry.name.endswith(".h") and not entry.name.endswith(".generated.h"):
+                stat = entry.stat()
+                yield os.path.abspath(entry.path), [stat.st_mtime_ns, stat.st_size]
+
+
+def is_fresh(path, entry, stamp):
+    if entry is None or entry.get("stamp") != stamp:
+        return False
+    cpp = entry.get("cpp")
+    # A set's .cpp may have been added (or moved to Private) since the scan
+    if entry.get("classes") and sibling_cpp(path) != cpp:
+        return False
+    if cpp:
+        try:
+            return file_stamp(cpp) == entry["cpp_stamp"]
+        except OSError:
+            return False
+    return True
+
+
+def default_cache_path(root):
+    # Next to the scanned sources rather than in whatever directory the tool runs from
+    return os.path.join(os.path.abspath(root), GasAttributesCache.CACHE_DIR, CACHE_FILE)
+
+
+class HeaderScanCache:
+    # Scan results per header, keyed by absolute path and checked by mtime and size first,
+    # then by content hash, so only new or edited files are parsed again
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        if path:
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION:
+            self.entries = data.get("files", {})
+
+    def save(self):
+        if not self.path:
+            return False
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        data = {"version": CACHE_VERSION, "files": self.entries}
+        return GasAttributesCache.write_stream_if_changed(self.path, [json.dumps(data, separators=(",", ":"))])
+
+
+def scan_tree(roots, cache=None, workers=None):
+    # Returns ({header: [classes]}, stats). Files whose stamps match the cache aren't opened;
+    # the rest are read, and parsed only if their content changed, across a process pool.
+    # Without a cache every header is parsed and nothing is persisted.
+    cache = cache or HeaderScanCache()
+    start = time.perf_counter()
+    seen = {}
+    stale = []
+    for root in roots:
+        for path, stamp in iter_headers(root):
+            entry = cache.entries.get(path)
+            seen[path] = entry
+            if not is_fresh(path, entry, stamp):
+                stale.append((path, entry))
+
+    parsed = 0
+    if len(stale) < PARALLEL_THRESHOLD or workers == 1:
+        results = _scan_chunk(stale)
+    else:
+        workers = workers or os.cpu_count() or 1
+        # A few chunks per worker keeps the pool busy without a task per file
+        size = max(16, -(-len(stale) // (workers * 4)))
+        chunks = [stale[index:index + size] for index in range(0, len(stale), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [result for chunk in pool.map(_scan_chunk, chunks) for result in chunk]
+    for path, entry, was_parsed in results:
+        seen[path] = entry
+        parsed += was_parsed
+
+    # Headers that were deleted drop out of the cache
+    cache.entries = seen
+    stats = {
+        "headers": len(seen),
+        "read": len(stale),
+        "parsed": parsed,
+        "seconds": time.perf_counter() - start,
+    }
+    return {path: entry["classes"] for path, entry in seen.items() if entry["classes"]}, stats
+
+
+def manifest_entries(found, manifest_dir=None, keep_location=False):
+    # Batch manifest entries, one per class, in path order
+    entries = []
+    for path in sorted(found):
+        for entry in found[path]:
+            entry = dict(entry)
+            if keep_location:
+                directory = os.path.dirname(path)
+                entry["output_dir"] = os.path.relpath(directory, manifest_dir) if manifest_dir else directory
+            entries.append(entry)
+    return entries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Scan a Source tree for existing AttributeSet headers and write them out as generator input."
+    )
+    parser.add_argument("roots", nargs="+", help="Directories to scan, e.g. Source/")
+    parser.add_argument("-o", "--output", help="Batch manifest to write (default: print to stdout)")
+    parser.add_argument("--profiles", help="Also save each class as a profile in this store, e.g. profiles.db")
+    parser.add_argument("--keep-location", action="store_true",
+                        help="Give each entry the header's directory as output_dir, so regenerating replaces it")
+    parser.add_argument("--cache", help=f"Scan cache file (default: {GasAttributesCache.CACHE_DIR}/{CACHE_FILE} in the first root)")
+    parser.add_argument("--no-cache", action="store_true", help="Read and parse every header")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    cache = HeaderScanCache(None if args.no_cache else args.cache or default_cache_path(args.roots[0]))
+    found, stats = scan_tree([os.path.abspath(root) for root in args.roots], cache, args.jobs)
+    cache.save()
+
+    manifest_dir = os.path.dirname(os.path.abspath(args.output)) if args.output else os.getcwd()
+    entries = manifest_entries(found, manifest_dir, args.keep_location)
+    attributes = sum(len(entry["replicated"]) + len(entry["nonreplicated"]) for entry in entries)
+    # The summary goes to stderr, so the manifest can be piped when printed
+    print(
+        f"Scanned {stats['headers']} headers in {stats['seconds']:.2f} s ({stats['read']} read, "
+        f"{stats['parsed']} parsed): {len(entries)} classes, {attributes} attributes",
+        file=sys.stderr,
+    )
+
+    text = json.dumps(entries, indent=4) + "\n"
+    if args.output:
+        GasAttributesCache.write_stream_if_changed(args.output, [text])
+    else:
+        sys.stdout.write(text)
+
+    if args.profiles:
+        import GasAttributesProfiles
+        store = GasAttributesProfiles.ProfileStore(args.profiles)
+        try:
+            for entry in entries:
+                store.save(entry["class_name"], entry)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+        finally:
+            store.close()
+        print(f"{len(entries)} profiles saved to {args.profiles}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+import argparse
+import csv
+import json
+import mmap
+import os
+import sys
+import time
+
+import GasAttributesBatch
+
+# Column names are matched case-insensitively; the first one present wins
+COLUMNS = {
+    "name": ("Attribute", "Name", "RowName"),
+    "default": ("Default", "DefaultValue", "BaseValue"),
+    "replicated": ("Replicated",),
+    "condition": ("Condition", "Cond"),
+    "notify": ("Notify", "RepNotify"),
+    "min": ("Min",),
+    "max": ("Max",),
+    "event": ("Event",),
+}
+
+TRUE_VALUES = ("1", "true", "yes", "y", "x")
+
+JSON_CHUNK_SIZE = 1 << 20
+
+
+# --- Streaming readers: rows are yielded one at a time, files are never loaded whole ---
+def iter_mapped_lines(path):
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first = True
+            for raw in iter(mm.readline, b""):
+                line = raw.decode("utf-8")
+                if first:
+                    line = line.lstrip("\ufeff")
+                    first = False
+                yield line
+
+
+def iter_csv_rows(path):
+    # csv.reader pulls further lines itself when a quoted field spans several
+    return csv.DictReader(iter_mapped_lines(path))
+
+
+def iter_jsonl_rows(path):
+    for line in iter_mapped_lines(path):
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_json_array_rows(path):
+    # Decodes one object at a time out of a top-level JSON array (e.g. a DataTable export)
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        while True:
+            chunk = f.read(JSON_CHUNK_SIZE)
+            buffer += chunk
+            pos = 0
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if not started and pos < len(buffer):
+                    if buffer[pos] != "[":
+                        raise ValueError(f"{path}: expected a JSON array of rows")
+                    started = True
+                    pos += 1
+                    continue
+                if pos < len(buffer) and buffer[pos] == "]":
+                    return
+                try:
+                    row, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Incomplete object: wait for the next chunk
+                    if not chunk:
+                        raise
+                    break
+                yield row
+                pos = end
+            buffer = buffer[pos:]
+            if not chunk:
+                return
+
+
+def iter_rows(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return iter_csv_rows(path)
+    if ext in (".jsonl", ".ndjson"):
+        return iter_jsonl_rows(path)
+    if ext == ".json":
+        return iter_json_array_rows(path)
+    raise ValueError(f"{path}: unsupported source type '{ext}' (expected .csv, .json or .jsonl)")
+
+
+# --- Rows -> attribute lines, grouped into AttributeSets ---
+def resolve_columns(row, group_by):
+    lowered = {key.lower(): key for key in row if key}
+    columns = {}
+    for field, candidates in COLUMNS.items():
+        for candidate in candidates:
+            if candidate.lower() in lowered:
+                columns[field] = lowered[candidate.lower()]
+                break
+    if group_by.lower() not in lowered:
+        raise ValueError(f"Source has no '{group_by}' column")
+    if "name" not in columns:
+        raise ValueError(f"Source has no attribute name column ({', '.join(COLUMNS['name'])})")
+    columns["group"] = lowered[group_by.lower()]
+    return columns
+
+
+def row_to_line(row, columns):
+    def cell(field):
+        key = columns.get(field)
+        value = row.get(key) if key else None
+        return str(value).strip() if value is not None else ""
+
+    # A row without a name would turn its default into the name, e.g. " 100"
+    if not cell("name"):
+        return None, False
+    parts = [cell("name")]
+    if cell("default"):
+        parts.append(cell("default"))
+    for field, key in (("condition", "cond"), ("notify", "notify"), ("min", "min"), ("max", "max"), ("event", "event")):
+        if cell(field):
+            parts.append(f"{key}={cell(field)}")
+
+    replicated = cell("replicated").lower() in TRUE_VALUES if "replicated" in columns else True
+    return " ".join(parts), replicated
+
+
+def group_rows(rows, group_by):
+    # Returns (groups, row count, errors); blank rows are skipped silently, rows missing a name reported
+    groups = {}
+    columns = None
+    count = 0
+    errors = []
+    for row in rows:
+        if columns is None:
+            columns = resolve_columns(row, group_by)
+        count += 1
+        group = str(row.get(columns["group"]) or "").strip()
+        line, replicated = row_to_line(row, columns)
+        if line is None and any(str(value).strip() for value in row.values() if value is not None):
+            errors.append(f"row {count}: no attribute name")
+        if not group or not line:
+            continue
+        entry = groups.setdefault(group, {"class_name": group, "replicated": [], "nonreplicated": []})
+        entry["replicated" if replicated else "nonreplicated"].append(line)
+    return groups, count, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate AttributeSets from a CSV/JSON attribute source.")
+    parser.add_argument("source", help=".csv, .json (array of rows) or .jsonl file")
+    parser.add_argument("--group-by", default="AttributeSet", help="Column naming the AttributeSet each row belongs to")
+    parser.add_argument("--api-macro", default="", help="API macro for every generated class")
+    parser.add_argument("--base-class", default="AttributeSet", help="Base class for every generated class")
+    parser.add_argument("--tag-prefix", help="Also generate a GameplayTags ini with this prefix")
+    parser.add_argument("-o", "--output-dir", default=".", help="Directory the generated files are written to")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Ignore the generation cache and regenerate every class")
+    parser.add_argument("--template-dir", help="Directory of .tmpl files overriding the built-in output")
+    parser.add_argument("--merge-tags", metavar="INI",
+                        help="Merge the tags into this ini instead of writing one _GameplayTags.ini per set")
+    GasAttributesBatch.add_index_arguments(parser)
+    GasAttributesBatch.add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    profiler = GasAttributesBatch.make_profiler(args)
+
+    start = time.perf_counter()
+    if profiler:
+        with profiler.phase("read_rows", source=args.source):
+            groups, count, errors = group_rows(iter_rows(args.source), args.group_by)
+    else:
+        groups, count, errors = group_rows(iter_rows(args.source), args.group_by)
+    seconds = time.perf_counter() - start
+    rate = count / seconds if seconds > 0 else 0.0
+    print(f"Read {count} rows into {len(groups)} AttributeSets in {seconds:.3f} s ({rate:,.0f} rows/s)")
+
+    defaults = {"api_macro": args.api_macro, "base_class": args.base_class}
+    if args.tag_prefix is not None:
+        defaults["tag_prefix"] = args.tag_prefix
+    if args.template_dir:
+        defaults["template_dir"] = os.path.abspath(args.template_dir)
+    defaults["output_dir"] = args.output_dir
+
+    jobs = []
+    for entry in groups.values():
+        try:
+            jobs.append(GasAttributesBatch.normalize_entry(entry, defaults))
+        except ValueError as e:
+            errors.append(str(e))
+    for error in errors:
+        print(f"[skip] {error}", file=sys.stderr)
+
+    try:
+        results, total = GasAttributesBatch.run_batch(
+            jobs, workers=args.jobs, use_cache=not args.force, profiler=profiler, merge_tags=args.merge_tags,
+            index=GasAttributesBatch.make_index(args), fail_on_conflict=args.fail_on_conflict
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    summary = GasAttributesBatch.summarize(results, total)
+    print(f"Generated {summary['classes']} classes ({summary['attributes']} attributes) in {total:.3f} s")
+    GasAttributesBatch.save_profile(profiler, args)
+
+    return 1 if errors or summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+import argparse
+import json
+import os
+import sys
+
+import GasAttributesCache
+import GasAttributesCore
+
+INDEX_VERSION = 1
+
+# Names a generated set declares; two sets declaring the same one won't compile (or, for tags,
+# register the same tag twice). Attributes are indexed for lookups only.
+CONFLICT_KINDS = ("classes", "enums", "delegates", "tags")
+KINDS = ("attributes",) + CONFLICT_KINDS
+# Every unsharded set declares AllAttributesEnum (and, with events="single", FOnAttributeChanged),
+# so these only clash between sets generated into the same output directory
+SCOPED_KINDS = ("enums", "delegates")
+
+
+def name_key(kind, name):
+    # Tags are FNames and compare case-insensitively; C++ names don't
+    return name.lower() if kind == "tags" else name
+
+
+def output_scope(entry):
+    return os.path.normcase(os.path.abspath(entry.get("output_dir") or "."))
+
+
+def describe(attributes, class_name, tag_prefix=None, options=None, sharding=None, output_dir=None, stages=None):
+    # Every name the set would declare, without generating it
+    options = GasAttributesCore.resolve_options(options)
+    model = GasAttributesCore.build_model(
+        attributes, [], "", class_name, "AttributeSet", tag_prefix, options, sharded=bool(sharding)
+    )
+    if sharding:
+        assignment = GasAttributesCore.assign_shards(model["records"], *GasAttributesCore.resolve_sharding(**sharding))
+        # Every shard declares its own enum and events="single" delegate type
+        names = [GasAttributesCore.enum_names(f"{class_name}_{name}", True) for name in assignment]
+        classes = [f"U{class_name}_{name}" for name in assignment]
+    else:
+        names = [GasAttributesCore.enum_names(class_name)]
+        classes = [model["class_name_u"]]
+    if stages and "dispatch_benchmark" in stages:
+        classes += [f"A{name[1:]}DispatchBenchmark" for name in classes]
+    delegates = [f"FOn{aid}Changed" for aid in model["event_ids"]]
+    if options["events"] == "single":
+        delegates += [event_type for _, event_type in names]
+    if options["native_delegates"]:
+        delegates += [f"{name}Native" for name in delegates]
+    prefix = GasAttributesCore.tag_root(tag_prefix)
+    return {
+        "output_dir": os.path.abspath(output_dir or "."),
+        "classes": classes,
+        "enums": [enum_name for enum_name, _ in names],
+        "delegates": delegates,
+        "attributes": model["ids"],
+        "tags": [f"{prefix}{aid}" for aid in model["ids"]] if tag_prefix is not None else [],
+    }
+
+
+def describe_job(job):
+    # A normalized GasAttributesBatch job
+    return describe(
+        job["attributes"], job["class_name"], job.get("tag_prefix"), job.get("options"),
+        job.get("sharding"), job.get("output_dir"), job.get("stages")
+    )
+
+
+class AttributeIndex:
+    # Every generated set with the names it declares, persisted as JSON. Reverse maps from each
+    # name to the sets declaring it make ownership lookups and conflict checks O(1) per name.
+    def __init__(self, path=None):
+        self.path = path
+        self.sets = {}
+        self.owners = {kind: {} for kind in KINDS}
+        if path:
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"{self.path}: unsupported index version {data.get('version')}")
+        for set_name, entry in data.get("sets", {}).items():
+            self.update(set_name, entry)
+
+    def save(self):
+        data = {"version": INDEX_VERSION, "sets": dict(sorted(self.sets.items()))}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        return GasAttributesCache.write_stream_if_changed(self.path, [json.dumps(data, indent=1), "\n"])
+
+    def update(self, set_name, entry):
+        # Replaces whatever the set declared before
+        self.remove(set_name)
+        self.sets[set_name] = entry
+        for kind in KINDS:
+            owners = self.owners[kind]
+            for name in entry.get(kind, ()):
+                owners.setdefault(name_key(kind, name), set()).add(set_name)
+
+    def remove(self, set_name):
+        entry = self.sets.pop(set_name, None)
+        if entry is None:
+            return
+        for kind in KINDS:
+            owners = self.owners[kind]
+            for name in entry.get(kind, ()):
+                key = name_key(kind, name)
+                owners[key].discard(set_name)
+                if not owners[key]:
+                    del owners[key]
+
+    def lookup(self, name, kind="attributes"):
+        return sorted(self.owners[kind].get(name_key(kind, name), ()))
+
+    def find(self, name):
+        # {kind: sets} for every kind declaring the name, e.g. an attribute and its delegate
+        return {kind: self.lookup(name, kind) for kind in KINDS if self.lookup(name, kind)}
+
+    def conflicts(self):
+        # (kind, name, sets) for every name declared by more than one set
+        return self.preview({})
+
+    def preview(self, entries):
+        # The conflicts the index would have once these {set_name: entry} replace their old
+        # entries, without changing it. Only the names in entries are looked at.
+        batch = AttributeIndex()
+        for set_name, entry in entries.items():
+            batch.update(set_name, entry)
+        sets = entries or self.sets
+        found = []
+        reported = set()
+        for kind in CONFLICT_KINDS:
+            for set_name in sorted(sets):
+                scope = output_scope(sets[set_name]) if kind in SCOPED_KINDS else None
+                for name in sets[set_name].get(kind, ()):
+                    key = name_key(kind, name)
+                    if (kind, key, scope) in reported:
+                        continue
+                    owners = batch.owners[kind].get(key, set()) | self.owners[kind].get(key, set()).difference(entries)
+                    if scope is not None:
+                        owners = {
+                            owner for owner in owners
+                            if output_scope(batch.sets.get(owner) or self.sets[owner]) == scope
+                        }
+                    if len(owners) > 1:
+                        reported.add((kind, key, scope))
+                        found.append((kind, name, sorted(owners)))
+        return found
+
+
+def format_conflict(kind, name, sets):
+    return f"{kind[:-1]} {name} is declared by {', '.join(sets)}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the project-wide index of generated AttributeSets.")
+    parser.add_argument("index", help="Index file written by the batch, import or watch tools with --index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    lookup = sub.add_parser("lookup", help="Which sets declare an attribute, class, enum, delegate or tag")
+    lookup.add_argument("names", nargs="+")
+    sub.add_parser("conflicts", help="Names declared by more than one set")
+    sub.add_parser("sets", help="Every indexed set")
+    args = parser.parse_args(argv)
+
+    index = AttributeIndex(args.index)
+    if args.command == "lookup":
+        missing = 0
+        for name in args.names:
+            found = index.find(name)
+            if not found:
+                missing += 1
+                print(f"{name}: not found")
+            for kind, sets in found.items():
+                print(f"{name}: {kind[:-1]} of {', '.join(sets)}")
+        return 1 if missing else 0
+    if args.command == "conflicts":
+        found = index.conflicts()
+        for conflict in found:
+            print(format_conflict(*conflict))
+        return 1 if found else 0
+    for set_name, entry in sorted(index.sets.items()):
+        print(f"{set_name:<40} {len(entry['attributes']):>6} attrs  {', '.join(entry['classes'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
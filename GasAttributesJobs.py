@@ -0,0 +1,111 @@
+import itertools
+import queue
+import threading
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class GenerationJob:
+    def __init__(self, job_id, name, func, args, kwargs):
+        self.id = job_id
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.status = "queued"
+        self.done_steps = 0
+        self.total_steps = 0
+        self.result = None
+        self.error = None
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+
+class JobRunner:
+    # Runs generation callables off the caller's thread. Progress and results come back as
+    # (kind, job) events from poll(), so a UI can pick them up from its own event loop.
+    def __init__(self, workers=1):
+        self._pending = queue.Queue()
+        self._events = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._jobs = []
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, name, func, *args, **kwargs):
+        # func must accept a progress=callback(done, total) keyword
+        job = GenerationJob(next(self._ids), name, func, args, kwargs)
+        with self._lock:
+            self._jobs.append(job)
+        self._pending.put(job)
+        self._events.put(("queued", job))
+        return job
+
+    def cancel(self, job=None):
+        with self._lock:
+            targets = [job] if job is not None else list(self._jobs)
+        for target in targets:
+            target.cancel()
+
+    def active(self):
+        with self._lock:
+            return list(self._jobs)
+
+    def poll(self):
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                return events
+
+    def shutdown(self):
+        self.cancel()
+        for _ in self._threads:
+            self._pending.put(None)
+
+    def _work(self):
+        while True:
+            job = self._pending.get()
+            if job is None:
+                return
+            self._run(job)
+
+    def _run(self, job):
+        if job.cancelled:
+            self._finish(job, "cancelled")
+            return
+
+        def progress(done, total):
+            if job.cancelled:
+                raise JobCancelled()
+            job.done_steps, job.total_steps = done, total
+            self._events.put(("progress", job))
+
+        job.status = "running"
+        self._events.put(("started", job))
+        try:
+            job.result = job.func(*job.args, progress=progress, **job.kwargs)
+        except JobCancelled:
+            self._finish(job, "cancelled")
+        except Exception as e:
+            job.error = e
+            self._finish(job, "failed")
+        else:
+            self._finish(job, "done")
+
+    def _finish(self, job, status):
+        job.status = status
+        with self._lock:
+            self._jobs.remove(job)
+        self._events.put((status, job))
@@ -0,0 +1,243 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+PROFILES_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    settings TEXT NOT NULL,
+    saved REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    profile TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT,
+    line TEXT NOT NULL,
+    replicated INTEGER NOT NULL,
+    PRIMARY KEY (profile, position)
+);
+CREATE INDEX IF NOT EXISTS attributes_by_id ON attributes (id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Settings keys holding attribute pane text; everything else is kept as the profile's JSON
+ATTRIBUTE_KEYS = ("replicated", "nonreplicated")
+
+# Most names a search returns, enough for a drop-down
+SEARCH_LIMIT = 200
+
+
+def attribute_rows(settings):
+    # (line, id, replicated) per attribute line; lines that don't parse are kept without an id
+    import GasAttributesCore
+    rows = []
+    for key in ATTRIBUTE_KEYS:
+        value = settings.get(key) or []
+        for line in value.splitlines() if isinstance(value, str) else value:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                aid = GasAttributesCore.parse_attribute_line(line)["id"]
+            except ValueError:
+                aid = None
+            rows.append((line, aid, key == "replicated"))
+    return rows
+
+
+class ProfileStore:
+    # Named generator configurations (the same keys as settings.json or a manifest entry) in one
+    # SQLite file. Profiles are read one at a time by primary key, and attributes are indexed by
+    # id, so neither opening the store nor loading a profile depends on how many are stored.
+    def __init__(self, path):
+        self.path = path
+        self._db = None
+
+    @property
+    def db(self):
+        # Opened on first use, so creating a store costs nothing
+        if self._db is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            version = self._db.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, PROFILES_VERSION):
+                self._db.close()
+                self._db = None
+                raise ValueError(f"{self.path}: unsupported profile store version {version}")
+            if version == 0:
+                with self._db:
+                    self._db.executescript(SCHEMA)
+                    self._db.execute(f"PRAGMA user_version = {PROFILES_VERSION}")
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def exists(self):
+        return self._db is not None or os.path.exists(self.path)
+
+    def save(self, name, settings):
+        settings = dict(settings)
+        rows = attribute_rows(settings)
+        for key in ATTRIBUTE_KEYS:
+            settings.pop(key, None)
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO profiles (name, settings, saved) VALUES (?, ?, ?)",
+                (name, json.dumps(settings, sort_keys=True), time.time()),
+            )
+            self.db.execute("DELETE FROM attributes WHERE profile = ?", (name,))
+            self.db.executemany(
+                "INSERT INTO attributes (profile, position, id, line, replicated) VALUES (?, ?, ?, ?, ?)",
+                [(name, position, aid, line, replicated) for position, (line, aid, replicated) in enumerate(rows)],
+            )
+
+    def get(self, name):
+        # The profile as a settings.json-style dict, or None
+        row = self.db.execute("SELECT settings FROM profiles WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        settings = json.loads(row[0])
+        panes = {key: [] for key in ATTRIBUTE_KEYS}
+        for line, replicated in self.db.execute(
+            "SELECT line, replicated FROM attributes WHERE profile = ? ORDER BY position", (name,)
+        ):
+            panes["replicated" if replicated else "nonreplicated"].append(line)
+        for key, lines in panes.items():
+            settings[key] = "".join(f"{line}\n" for line in lines)
+        return settings
+
+    def delete(self, name):
+        with self.db:
+            self.db.execute("DELETE FROM attributes WHERE profile = ?", (name,))
+            return self.db.execute("DELETE FROM profiles WHERE name = ?", (name,)).rowcount > 0
+
+    def names(self, prefix="", limit=None):
+        # A range scan over the primary key, in name order
+        query = "SELECT name FROM profiles WHERE name >= ? AND name < ? ORDER BY name"
+        args = [prefix, prefix + "\U0010ffff"]
+        if limit:
+            query += " LIMIT ?"
+            args.append(limit)
+        return [name for name, in self.db.execute(query, args)]
+
+    def with_attribute(self, attribute):
+        # Profiles declaring the attribute, through the id index
+        return [name for name, in self.db.execute(
+            "SELECT DISTINCT profile FROM attributes WHERE id = ? ORDER BY profile", (attribute,)
+        )]
+
+    def search(self, text, limit=SEARCH_LIMIT):
+        # Profiles whose name starts with text, then profiles declaring an attribute named text
+        found = self.names(text, limit)
+        if text:
+            listed = set(found)
+            found += [name for name in self.with_attribute(text) if name not in listed]
+        return found[:limit]
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def last_used(self):
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'last'").fetchone()
+        return row[0] if row else None
+
+    def set_last_used(self, name):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last', ?)", (name,))
+
+
+def profile_name(settings, fallback="default"):
+    return (settings.get("class_name") or "").strip() or fallback
+
+
+def import_file(store, path):
+    # A settings.json becomes one profile; a manifest one profile per class, named after it
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, list):
+        defaults, entries = {}, data
+    elif "class_name" in data:
+        defaults, entries = {}, [data]
+    else:
+        defaults, entries = data.get("defaults", {}), data.get("classes", [])
+    names = []
+    for entry in entries:
+        settings = dict(defaults, **entry)
+        name = profile_name(settings)
+        store.save(name, settings)
+        names.append(name)
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the named generator profiles saved by the GUI.")
+    parser.add_argument("store", help="Profile store, e.g. profiles.db")
+    sub = parser.add_subparsers(dest="command", required=True)
+    listing = sub.add_parser("list", help="Profile names, optionally only those starting with a prefix")
+    listing.add_argument("prefix", nargs="?", default="")
+    find = sub.add_parser("find", help="Profiles declaring an attribute")
+    find.add_argument("attributes", nargs="+")
+    importing = sub.add_parser("import", help="Save settings.json files or manifests as profiles")
+    importing.add_argument("files", nargs="+")
+    export = sub.add_parser("export", help="Print profiles as a batch manifest for GasAttributesBatch.py")
+    export.add_argument("names", nargs="+")
+    delete = sub.add_parser("delete", help="Remove profiles")
+    delete.add_argument("names", nargs="+")
+    args = parser.parse_args(argv)
+
+    store = ProfileStore(args.store)
+    if args.command != "import" and not store.exists():
+        print(f"{args.store}: no such profile store")
+        return 1
+    try:
+        if args.command == "list":
+            for name in store.names(args.prefix):
+                print(name)
+        elif args.command == "find":
+            missing = 0
+            for attribute in args.attributes:
+                names = store.with_attribute(attribute)
+                missing += not names
+                print(f"{attribute}: {', '.join(names) if names else 'not found'}")
+            return 1 if missing else 0
+        elif args.command == "import":
+            for path in args.files:
+                names = import_file(store, path)
+                print(f"{path}: {len(names)} profiles saved")
+        elif args.command == "export":
+            entries = []
+            for name in args.names:
+                settings = store.get(name)
+                if settings is None:
+                    print(f"{name}: no such profile", file=sys.stderr)
+                    return 1
+                entries.append(settings)
+            json.dump(entries, sys.stdout, indent=4)
+            print()
+        else:
+            missing = [name for name in args.names if not store.delete(name)]
+            for name in missing:
+                print(f"{name}: no such profile")
+            return 1 if missing else 0
+    except ValueError as e:
+        print(e)
+        return 1
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import re
+
+import GasAttributesCache
+import GasAttributesCore
+
+# DefaultGameplayTags.ini keeps its tag list here; Config/Tags/*.ini files use GameplayTagsList
+SETTINGS_SECTION = "[/Script/GameplayTags.GameplayTagsSettings]"
+
+SECTION_LINE = re.compile(r"\s*\[[^\]]*\]\s*$")
+TAG_LINE = re.compile(r'\s*\+GameplayTagList\s*=\s*\(\s*Tag\s*=\s*"?([^",)]*)"?')
+
+
+def tag_key(tag):
+    # Tags are FNames, so "Stat.Health" and "stat.health" are the same tag
+    return tag.lower()
+
+
+def attribute_tags(attributes, tag_prefix):
+    # The tags the tags_ini stage would write for these attribute lines or records
+    prefix = GasAttributesCore.tag_root(tag_prefix)
+    return [f"{prefix}{record['id']}" for record in GasAttributesCore.as_records(attributes)]
+
+
+def tag_line(tag, dev_comment):
+    return f'+GameplayTagList=(Tag="{tag}",DevComment="{dev_comment}")'
+
+
+def read_tags_ini(text):
+    # One pass over the file. Tag entries of the first section that has any are pulled out
+    # (duplicates dropped) and a None placeholder marks where the sorted list goes back in.
+    lines = text.splitlines()
+    out = []
+    entries = {}
+    duplicates = 0
+    section = None
+    target = None
+    settings_end = None
+    for line in lines:
+        # Cheap prefix checks first; the regexes only run on section and tag lines
+        start = line.lstrip()[:1]
+        if start == "[" and SECTION_LINE.match(line):
+            section = line.strip()
+            out.append(line)
+            continue
+        match = TAG_LINE.match(line) if start == "+" else None
+        tag = match.group(1).strip() if match else None
+        if tag and (target is None or section == target):
+            if target is None:
+                target = section
+                out.append(None)
+            key = tag_key(tag)
+            if key in entries:
+                duplicates += 1
+            else:
+                entries[key] = line
+            continue
+        out.append(line)
+        if section == SETTINGS_SECTION and line.strip():
+            settings_end = len(out)
+
+    if target is None:
+        # No tags yet: append them to the settings section, or start one
+        if settings_end is not None:
+            out.insert(settings_end, None)
+        else:
+            if out and out[-1].strip():
+                out.append("")
+            out.extend([SETTINGS_SECTION, "ImportTagsFromConfig=True", None])
+    return out, entries, duplicates
+
+
+def merge_gameplay_tags(path, tags, dev_comment=GasAttributesCore.TAG_DEV_COMMENT, writer=None):
+    # Adds the tags that aren't in the ini yet and keeps its tag list sorted. Existing entries
+    # keep their own DevComment, and nothing is removed except duplicates, which are compared
+    # case-insensitively like the FNames the tags become.
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        raw = b""
+    bom = raw.startswith(b"\xef\xbb\xbf")
+    text = raw.decode("utf-8-sig")
+    newline = "\r\n" if "\r\n" in text else "\n"
+
+    out, entries, duplicates = read_tags_ini(text)
+    added = 0
+    for tag in tags:
+        key = tag_key(tag)
+        if key not in entries:
+            entries[key] = tag_line(tag, dev_comment)
+            added += 1
+    # An already sorted list with a few new tags is close to linear for Timsort
+    block = [entries[key] for key in sorted(entries)]
+
+    def chunks():
+        if bom:
+            yield "\ufeff"
+        for line in out:
+            if line is None:
+                if block:
+                    yield newline.join(block) + newline
+            else:
+                yield line + newline
+
+    written = GasAttributesCache.write_stream_if_changed(path, chunks(), writer)
+    return {"path": path, "added": added, "duplicates": duplicates, "tags": len(entries), "written": written}
@@ -0,0 +1,198 @@
+import builtins
+import hashlib
+import marshal
+import os
+import re
+import sys
+import types
+
+import GasAttributesCache
+
+# Bump whenever compile_template changes the code it produces, so stale compiled templates are ignored
+TEMPLATE_ENGINE_VERSION = "1"
+
+TEMPLATE_CACHE_DIR = os.path.join(GasAttributesCache.CACHE_DIR, "templates")
+
+# Which template file in a template directory overrides which output stage
+TEMPLATE_FILES = {
+    "header": "AttributeSet.h.tmpl",
+    "cpp": "AttributeSet.cpp.tmpl",
+    "tags_ini": "GameplayTags.ini.tmpl",
+}
+
+# Statement lines hold exactly one {% ... %} (or a {# ... #} comment) and produce no output themselves
+STATEMENT_LINE = re.compile(r"\s*\{%\s*(.*?)\s*%\}\s*$")
+COMMENT_LINE = re.compile(r"\s*\{#.*#\}\s*$")
+EXPRESSION = re.compile(r"\{\{\s*(.*?)\s*\}\}")
+
+
+class Template:
+    def __init__(self, name, code, digest):
+        self.name = name
+        self.code = code
+        self.digest = digest
+
+    def iter_render(self, context):
+        # The compiled body reads names from its globals, so the context dict is used as-is
+        namespace = dict(context)
+        namespace["__builtins__"] = builtins
+        return types.FunctionType(self.code, namespace)()
+
+    def render(self, context):
+        return "".join(self.iter_render(context))
+
+
+# --- Compilation: the template becomes the body of one Python generator function ---
+def _translate(text, name):
+    source = ["def render():", "    if False:", "        yield ''"]
+    # Generated source line -> template line, for error messages
+    origins = [0, 0, 0]
+    blocks = []
+    pending = []
+    pending_line = 0
+
+    def emit(code, lineno):
+        source.append("    " * (len(blocks) + 1) + code)
+        origins.append(lineno)
+
+    def flush():
+        # Consecutive text lines are yielded as one concatenated fragment
+        if not pending:
+            return
+        parts = []
+        for kind, value in pending:
+            if kind == "text":
+                if parts and parts[-1][0] == "text":
+                    parts[-1] = ("text", parts[-1][1] + value)
+                else:
+                    parts.append(("text", value))
+            else:
+                parts.append((kind, value))
+        emit("yield " + _join_source(parts), pending_line)
+        pending.clear()
+
+    for lineno, line in enumerate(text.splitlines(keepends=True), 1):
+        if COMMENT_LINE.match(line):
+            continue
+        statement = STATEMENT_LINE.match(line)
+        if not statement:
+            if not pending:
+                pending_line = lineno
+            pos = 0
+            for match in EXPRESSION.finditer(line):
+                pending.append(("text", line[pos:match.start()]))
+                pending.append(("expr", f"({match.group(1)})"))
+                pos = match.end()
+            pending.append(("text", line[pos:]))
+            if "{%" in line:
+                raise ValueError(f"{name}:{lineno}: {{% ... %}} must be on a line of its own")
+            continue
+
+        flush()
+        keyword, _, rest = statement.group(1).partition(" ")
+        if keyword in ("for", "if"):
+            emit(f"{keyword} {rest}:", lineno)
+            blocks.append((keyword, lineno))
+            emit("pass", lineno)
+        elif keyword in ("elif", "else"):
+            if not blocks or blocks[-1][0] != "if":
+                raise ValueError(f"{name}:{lineno}: '{keyword}' without a matching 'if'")
+            blocks.pop()
+            emit(f"{keyword} {rest}:" if keyword == "elif" else "else:", lineno)
+            blocks.append(("if", lineno))
+            emit("pass", lineno)
+        elif keyword in ("endfor", "endif"):
+            if not blocks or blocks[-1][0] != keyword[3:]:
+                raise ValueError(f"{name}:{lineno}: unexpected '{keyword}'")
+            blocks.pop()
+        elif keyword == "set":
+            emit(rest, lineno)
+        else:
+            raise ValueError(f"{name}:{lineno}: unknown statement '{keyword}'")
+
+    flush()
+    if blocks:
+        keyword, lineno = blocks[-1]
+        raise ValueError(f"{name}:{lineno}: '{keyword}' is never closed")
+    return "\n".join(source) + "\n", origins
+
+
+def _join_source(parts):
+    # An f-string formats the whole fragment in one step; expressions that cannot sit inside
+    # one (quotes of both kinds, backslashes) fall back to concatenation
+    expressions = "".join(value for kind, value in parts if kind == "expr")
+    texts = "".join(value for kind, value in parts if kind == "text")
+    quote = next((q for q in ('"', "'") if q not in expressions), None)
+    if quote is None or "\\" in expressions or any(c < " " and c not in "\t\n\r" for c in texts):
+        return " + ".join(repr(value) if kind == "text" else f"str({value})" for kind, value in parts)
+
+    body = []
+    for kind, value in parts:
+        if kind == "text":
+            value = value.replace("\\", "\\\\").replace(quote, "\\" + quote)
+            value = value.replace("\n", "\\n").replace("\r", "\\r").replace("{", "{{").replace("}", "}}")
+        else:
+            value = "{" + value + "}"
+        body.append(value)
+    return "f" + quote + "".join(body) + quote
+
+
+def compile_template(text, name="<template>"):
+    source, origins = _translate(text, name)
+    try:
+        module = compile(source, name, "exec")
+    except SyntaxError as e:
+        lineno = origins[e.lineno - 1] if e.lineno and e.lineno <= len(origins) else "?"
+        raise ValueError(f"{name}:{lineno}: invalid expression ({e.msg})") from None
+    return next(const for const in module.co_consts if isinstance(const, types.CodeType))
+
+
+# --- Loading: compiled code is cached on disk by template hash, and in memory per process ---
+def template_digest(text):
+    # marshal output is interpreter specific, so the interpreter is part of the key
+    payload = f"{TEMPLATE_ENGINE_VERSION}\0{sys.implementation.cache_tag}\0{text}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_compiled(text, name, cache_dir=TEMPLATE_CACHE_DIR):
+    digest = template_digest(text)
+    path = os.path.join(cache_dir, f"{digest}.code")
+    try:
+        with open(path, 'rb') as f:
+            return Template(name, marshal.load(f), digest)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    code = compile_template(text, name)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Batch workers may compile the same template at once; each writes its own file, the last rename wins
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(code, f)
+    os.replace(tmp_path, path)
+    return Template(name, code, digest)
+
+
+_loaded = {}
+
+
+def load_template(path, cache_dir=TEMPLATE_CACHE_DIR):
+    st = os.stat(path)
+    stamp = (path, st.st_size, st.st_mtime_ns)
+    template = _loaded.get(stamp)
+    if template is None:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        template = _loaded[stamp] = load_compiled(text, path, cache_dir)
+    return template
+
+
+def load_stage_templates(template_dir, stages, cache_dir=TEMPLATE_CACHE_DIR):
+    # Stages without a template file in the directory keep the built-in emitter
+    templates = {}
+    for stage in stages:
+        filename = TEMPLATE_FILES.get(stage)
+        path = os.path.join(template_dir, filename) if filename else None
+        if path and os.path.isfile(path):
+            templates[stage] = load_template(path, cache_dir)
+    return templates
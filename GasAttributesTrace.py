@@ -0,0 +1,143 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Phases are reported in this order; anything else follows alphabetically
+PHASE_ORDER = (
+    "read_rows", "ui_parse", "generate", "cache_check", "parse", "model", "assign_shards",
+    "emit:header", "emit:cpp", "emit:tags_ini", "emit:shared_header", "write", "cache_store", "merge_tags", "commit",
+)
+
+
+class Profiler:
+    # Records the phases of one or more generation runs. Every event holds its name, start and
+    # duration in nanoseconds, the process and thread it ran on, and the net change in
+    # allocated memory blocks while it ran (blocks still allocated at the end minus those at
+    # the start, not a count of allocations). Emission events also count the bytes produced.
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def add(self, name, start, duration, net_blocks, **args):
+        event = {
+            "name": name,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "start_ns": start,
+            "duration_ns": duration,
+            "net_blocks": net_blocks,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def extend(self, events):
+        # Events recorded by another profiler, e.g. one in a batch worker process
+        with self._lock:
+            self.events.extend(events)
+
+    @contextmanager
+    def phase(self, name, **args):
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.add(name, start, end - start, sys.getallocatedblocks() - blocks, **args)
+
+    def stream(self, name, chunks):
+        # Only the time spent producing chunks counts, so a file's emission shows up nested
+        # inside its "write" phase and the remainder of that phase is the file I/O
+        busy = size = count = net_blocks = 0
+        start = None
+        iterator = iter(chunks)
+        while True:
+            before = sys.getallocatedblocks()
+            tick = time.perf_counter_ns()
+            if start is None:
+                start = tick
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                break
+            finally:
+                busy += time.perf_counter_ns() - tick
+                net_blocks += sys.getallocatedblocks() - before
+            size += len(chunk)
+            count += 1
+            yield chunk
+        self.add(name, start, busy, net_blocks, bytes=size, chunks=count)
+
+    # --- Reports ---
+    def summary(self):
+        # Per phase name: calls, total and self time (minus phases nested inside it), bytes, net blocks
+        self_ns = self_times(self.events)
+        rows = {}
+        for event, own in zip(self.events, self_ns):
+            row = rows.setdefault(event["name"], {
+                "phase": event["name"], "calls": 0, "total_ms": 0.0, "self_ms": 0.0, "bytes": 0, "net_blocks": 0,
+            })
+            row["calls"] += 1
+            row["total_ms"] += event["duration_ns"] / 1e6
+            row["self_ms"] += own / 1e6
+            row["bytes"] += event.get("args", {}).get("bytes", 0)
+            row["net_blocks"] += event["net_blocks"]
+        order = {name: index for index, name in enumerate(PHASE_ORDER)}
+        return sorted(rows.values(), key=lambda row: (order.get(row["phase"], len(order)), row["phase"]))
+
+    def format_summary(self):
+        lines = [f"{'phase':<20} {'calls':>6} {'total ms':>10} {'self ms':>10} {'bytes':>12} {'net blocks':>10}"]
+        for row in self.summary():
+            lines.append(
+                f"{row['phase']:<20} {row['calls']:>6} {row['total_ms']:>10.2f} {row['self_ms']:>10.2f} "
+                f"{row['bytes']:>12} {row['net_blocks']:>10}"
+            )
+        return lines
+
+    def chrome_trace(self):
+        # Trace Event Format, for chrome://tracing or https://ui.perfetto.dev
+        origin = min((event["start_ns"] for event in self.events), default=0)
+        trace = []
+        for event in sorted(self.events, key=lambda event: (event["start_ns"], -event["duration_ns"])):
+            trace.append({
+                "name": event["name"],
+                "ph": "X",
+                "ts": (event["start_ns"] - origin) / 1000,
+                "dur": event["duration_ns"] / 1000,
+                "pid": event["pid"],
+                "tid": event["tid"],
+                "args": dict(event.get("args", {}), net_blocks=event["net_blocks"]),
+            })
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def save(self, path, format="json"):
+        if format == "chrome":
+            data = self.chrome_trace()
+        else:
+            data = {"summary": self.summary(), "events": self.events}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+
+
+def self_times(events):
+    # Phases on one thread nest; a phase's self time excludes the phases directly inside it
+    own = [event["duration_ns"] for event in events]
+    threads = {}
+    for index, event in enumerate(events):
+        threads.setdefault((event["pid"], event["tid"]), []).append(index)
+    for indices in threads.values():
+        indices.sort(key=lambda i: (events[i]["start_ns"], -events[i]["duration_ns"]))
+        stack = []
+        for i in indices:
+            start = events[i]["start_ns"]
+            while stack and events[stack[-1]]["start_ns"] + events[stack[-1]]["duration_ns"] <= start:
+                stack.pop()
+            if stack:
+                own[stack[-1]] -= events[i]["duration_ns"]
+            stack.append(i)
+    return own
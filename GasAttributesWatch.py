@@ -0,0 +1,219 @@
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+import GasAttributesBatch
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+EVENT_HEADER = struct.Struct("iIII")
+
+# Fewer changed classes than this are regenerated inline; a process pool costs more to start
+PARALLEL_THRESHOLD = 8
+
+
+class InotifyWatcher:
+    def __init__(self, paths):
+        libc_name = ctypes.util.find_library("c")
+        libc = ctypes.CDLL(libc_name or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        # Editors often save by writing a temp file and renaming it, so watch the directories
+        self.watched = {}
+        directories = {}
+        for path in paths:
+            directories.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+        for directory, names in directories.items():
+            mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_MODIFY
+            wd = libc.inotify_add_watch(self.fd, directory.encode(), mask)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+            self.watched[wd] = (directory, names)
+
+    def wait(self, timeout):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode()
+            offset += length
+            directory, names = self.watched.get(wd, (None, ()))
+            if name in names:
+                changed.add(os.path.join(directory, name))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    def __init__(self, paths, interval=0.25):
+        self.interval = interval
+        self.stamps = {path: self._stamp(path) for path in paths}
+
+    def _stamp(self, path):
+        try:
+            st = os.stat(path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def wait(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            # Only the watched files are stat'ed; definitions are not re-read unless they changed
+            changed = set()
+            for path, stamp in self.stamps.items():
+                current = self._stamp(path)
+                if current != stamp:
+                    self.stamps[path] = current
+                    changed.add(path)
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        pass
+
+
+def make_watcher(paths, poll=False):
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths)
+
+
+class DefinitionWatch:
+    def __init__(self, paths, workers=None, report=print, defaults=None, merge_tags=None, index=None,
+                 fail_on_conflict=False):
+        self.paths = paths
+        self.workers = workers
+        self.report = report
+        self.defaults = defaults
+        self.merge_tags = merge_tags
+        # Kept across refreshes, so each regeneration is checked against every class seen so far
+        self.index = index
+        self.fail_on_conflict = fail_on_conflict
+        # path -> {class_name: normalized job}, used to find exactly which classes changed
+        self.jobs = {}
+
+    def load(self, path):
+        try:
+            jobs, errors = GasAttributesBatch.load_manifest(path, self.defaults)
+        except (OSError, ValueError) as e:
+            # Typically a save caught half-way; the next event will retry
+            self.report(f"[watch] {os.path.basename(path)}: {e}")
+            return None
+        for error in errors:
+            self.report(f"[watch] {os.path.basename(path)}: {error}")
+        return {job["class_name"]: job for job in jobs}
+
+    def refresh(self, changed_paths):
+        changed = []
+        loaded = {}
+        for path in sorted(changed_paths):
+            jobs = self.load(path)
+            if jobs is None:
+                continue
+            previous = self.jobs.get(path, {})
+            changed.extend(job for name, job in jobs.items() if previous.get(name) != job)
+            loaded[path] = jobs
+
+        if not changed:
+            self.jobs.update(loaded)
+            return []
+        workers = 1 if len(changed) < PARALLEL_THRESHOLD else self.workers
+        try:
+            results, total = GasAttributesBatch.run_batch(
+                changed, workers=workers, report=self.report, merge_tags=self.merge_tags, index=self.index,
+                fail_on_conflict=self.fail_on_conflict
+            )
+        except ValueError as e:
+            # Nothing was written, so the job maps stay as they were and the next refresh retries
+            self.report(f"[watch] {e}")
+            return []
+        # Only what was generated is recorded; a class that failed still counts as changed next time
+        failed = {result["class_name"] for result in results if result["error"] is not None}
+        for path, jobs in loaded.items():
+            previous = self.jobs.get(path, {})
+            self.jobs[path] = {
+                name: previous[name] if name in failed else job
+                for name, job in jobs.items() if name not in failed or name in previous
+            }
+        self.report(f"[watch] regenerated {len(results)} classes in {total * 1000:.1f} ms")
+        return results
+
+    def run(self, debounce=0.05, poll=False):
+        self.refresh(self.paths)
+        watcher = make_watcher(self.paths, poll)
+        self.report(f"[watch] watching {len(self.paths)} files with {type(watcher).__name__}")
+        try:
+            while True:
+                changed = watcher.wait(3600)
+                if not changed:
+                    continue
+                # Debounce: keep collecting until the burst of writes goes quiet
+                while True:
+                    more = watcher.wait(debounce)
+                    if not more:
+                        break
+                    changed |= more
+                self.refresh(changed)
+        finally:
+            watcher.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate AttributeSets whenever their definition files change.")
+    parser.add_argument("definitions", nargs="+", help="settings.json or batch manifest files to watch")
+    parser.add_argument("-o", "--output-dir", default=".", help="Directory the generated files are written to")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes for large regenerations")
+    parser.add_argument("--debounce", type=float, default=0.05, help="Seconds of quiet before regenerating")
+    parser.add_argument("--poll", action="store_true", help="Poll file stamps instead of using inotify")
+    parser.add_argument("--merge-tags", metavar="INI",
+                        help="Merge the tags into this ini instead of writing one _GameplayTags.ini per class")
+    GasAttributesBatch.add_index_arguments(parser)
+    args = parser.parse_args(argv)
+
+    paths = [os.path.abspath(path) for path in args.definitions]
+    defaults = {"output_dir": os.path.abspath(args.output_dir)}
+
+    try:
+        merge_tags = os.path.abspath(args.merge_tags) if args.merge_tags else None
+        DefinitionWatch(
+            paths, workers=args.jobs, defaults=defaults, merge_tags=merge_tags,
+            index=GasAttributesBatch.make_index(args), fail_on_conflict=args.fail_on_conflict
+        ).run(debounce=args.debounce, poll=args.poll)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
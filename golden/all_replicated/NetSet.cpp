@@ -0,0 +1,174 @@
+#include "NetSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UNetSet::UNetSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitMana(50.0f);
+    InitMaxMana(50.0f);
+    InitDamage(15.0f);
+    InitVoicelinePitch(1.2f);
+    InitHairLength(0.7f);
+}
+
+void UNetSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNetSet, Health, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNetSet, MaxHealth, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNetSet, Mana, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNetSet, MaxMana, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNetSet, Damage, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNetSet, VoicelinePitch, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNetSet, HairLength, COND_None, REPNOTIFY_Always);
+}
+
+void UNetSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    switch (AttributeToEnum(Attribute))
+    {
+    case AllAttributesEnum::Health:
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxHealth:
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Mana:
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxMana:
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Damage:
+        OnDamageChanged.Broadcast(OldValue, NewValue);
+        BP_OnDamageChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::VoicelinePitch:
+        OnVoicelinePitchChanged.Broadcast(OldValue, NewValue);
+        BP_OnVoicelinePitchChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::HairLength:
+        OnHairLengthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHairLengthChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+void UNetSet::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNetSet, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+    }
+}
+
+void UNetSet::OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNetSet, MaxHealth, OldMaxHealth);
+    const float OldValue = OldMaxHealth.GetCurrentValue();
+    const float NewValue = MaxHealth.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+    }
+}
+
+void UNetSet::OnRep_Mana(const FGameplayAttributeData& OldMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNetSet, Mana, OldMana);
+    const float OldValue = OldMana.GetCurrentValue();
+    const float NewValue = Mana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+    }
+}
+
+void UNetSet::OnRep_MaxMana(const FGameplayAttributeData& OldMaxMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNetSet, MaxMana, OldMaxMana);
+    const float OldValue = OldMaxMana.GetCurrentValue();
+    const float NewValue = MaxMana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+    }
+}
+
+void UNetSet::OnRep_Damage(const FGameplayAttributeData& OldDamage)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNetSet, Damage, OldDamage);
+    const float OldValue = OldDamage.GetCurrentValue();
+    const float NewValue = Damage.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnDamageChanged.Broadcast(OldValue, NewValue);
+        BP_OnDamageChanged(OldValue, NewValue);
+    }
+}
+
+void UNetSet::OnRep_VoicelinePitch(const FGameplayAttributeData& OldVoicelinePitch)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNetSet, VoicelinePitch, OldVoicelinePitch);
+    const float OldValue = OldVoicelinePitch.GetCurrentValue();
+    const float NewValue = VoicelinePitch.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnVoicelinePitchChanged.Broadcast(OldValue, NewValue);
+        BP_OnVoicelinePitchChanged(OldValue, NewValue);
+    }
+}
+
+void UNetSet::OnRep_HairLength(const FGameplayAttributeData& OldHairLength)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNetSet, HairLength, OldHairLength);
+    const float OldValue = OldHairLength.GetCurrentValue();
+    const float NewValue = HairLength.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnHairLengthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHairLengthChanged(OldValue, NewValue);
+    }
+}
+
+AllAttributesEnum UNetSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(7);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetManaAttribute().GetUProperty(), AllAttributesEnum::Mana);
+        Map.Add(GetMaxManaAttribute().GetUProperty(), AllAttributesEnum::MaxMana);
+        Map.Add(GetDamageAttribute().GetUProperty(), AllAttributesEnum::Damage);
+        Map.Add(GetVoicelinePitchAttribute().GetUProperty(), AllAttributesEnum::VoicelinePitch);
+        Map.Add(GetHairLengthAttribute().GetUProperty(), AllAttributesEnum::HairLength);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
@@ -0,0 +1,164 @@
+#include "ChainSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UChainSet::UChainSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitMana(50.0f);
+    InitMaxMana(50.0f);
+    InitDamage(15.0f);
+    InitVoicelinePitch(1.2f);
+    InitHairLength(0.7f);
+}
+
+void UChainSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UChainSet, Health, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UChainSet, MaxHealth, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UChainSet, Mana, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UChainSet, MaxMana, COND_None, REPNOTIFY_Always);
+}
+
+void UChainSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    if (Attribute == GetHealthAttribute())
+    {
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+        return;
+    }
+
+    if (Attribute == GetMaxHealthAttribute())
+    {
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+        return;
+    }
+
+    if (Attribute == GetManaAttribute())
+    {
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+        return;
+    }
+
+    if (Attribute == GetMaxManaAttribute())
+    {
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+        return;
+    }
+
+    if (Attribute == GetDamageAttribute())
+    {
+        OnDamageChanged.Broadcast(OldValue, NewValue);
+        BP_OnDamageChanged(OldValue, NewValue);
+        return;
+    }
+
+    if (Attribute == GetVoicelinePitchAttribute())
+    {
+        OnVoicelinePitchChanged.Broadcast(OldValue, NewValue);
+        BP_OnVoicelinePitchChanged(OldValue, NewValue);
+        return;
+    }
+
+    if (Attribute == GetHairLengthAttribute())
+    {
+        OnHairLengthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHairLengthChanged(OldValue, NewValue);
+        return;
+    }
+
+}
+
+void UChainSet::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UChainSet, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+    }
+}
+
+void UChainSet::OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UChainSet, MaxHealth, OldMaxHealth);
+    const float OldValue = OldMaxHealth.GetCurrentValue();
+    const float NewValue = MaxHealth.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+    }
+}
+
+void UChainSet::OnRep_Mana(const FGameplayAttributeData& OldMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UChainSet, Mana, OldMana);
+    const float OldValue = OldMana.GetCurrentValue();
+    const float NewValue = Mana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+    }
+}
+
+void UChainSet::OnRep_MaxMana(const FGameplayAttributeData& OldMaxMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UChainSet, MaxMana, OldMaxMana);
+    const float OldValue = OldMaxMana.GetCurrentValue();
+    const float NewValue = MaxMana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+    }
+}
+
+AllAttributesEnum UChainSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(7);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetManaAttribute().GetUProperty(), AllAttributesEnum::Mana);
+        Map.Add(GetMaxManaAttribute().GetUProperty(), AllAttributesEnum::MaxMana);
+        Map.Add(GetDamageAttribute().GetUProperty(), AllAttributesEnum::Damage);
+        Map.Add(GetVoicelinePitchAttribute().GetUProperty(), AllAttributesEnum::VoicelinePitch);
+        Map.Add(GetHairLengthAttribute().GetUProperty(), AllAttributesEnum::HairLength);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
+
+AllAttributesEnum UChainSet::AttributeToEnumByName(const FGameplayAttribute& Attribute)
+{
+    const FString AttributeName = Attribute.GetName();
+    if (AttributeName == TEXT("Health")) return AllAttributesEnum::Health;
+    if (AttributeName == TEXT("MaxHealth")) return AllAttributesEnum::MaxHealth;
+    if (AttributeName == TEXT("Mana")) return AllAttributesEnum::Mana;
+    if (AttributeName == TEXT("MaxMana")) return AllAttributesEnum::MaxMana;
+    if (AttributeName == TEXT("Damage")) return AllAttributesEnum::Damage;
+    if (AttributeName == TEXT("VoicelinePitch")) return AllAttributesEnum::VoicelinePitch;
+    if (AttributeName == TEXT("HairLength")) return AllAttributesEnum::HairLength;
+    return AllAttributesEnum::None;
+}
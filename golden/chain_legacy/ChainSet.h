@@ -0,0 +1,141 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "AttributeSet.h"
+#include "AbilitySystemComponent.h"
+#include "GameplayEffectExtension.h"
+#include "ChainSet.generated.h"
+
+UENUM(BlueprintType)
+enum class AllAttributesEnum : uint8
+{
+    Health UMETA(DisplayName = "Health"),
+    MaxHealth UMETA(DisplayName = "MaxHealth"),
+    Mana UMETA(DisplayName = "Mana"),
+    MaxMana UMETA(DisplayName = "MaxMana"),
+    Damage UMETA(DisplayName = "Damage"),
+    VoicelinePitch UMETA(DisplayName = "VoicelinePitch"),
+    HairLength UMETA(DisplayName = "HairLength"),
+    None UMETA(Hidden)
+};
+
+#define ATTRIBUTE_ACCESSORS(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_SETTER(PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_INITTER(PropertyName)
+
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnHealthChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnMaxHealthChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnManaChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnMaxManaChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnDamageChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnVoicelinePitchChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnHairLengthChanged, float, OldValue, float, NewValue);
+
+// Replication estimate: 4 attributes, ~36 bytes initial, ~36 bytes per full update
+UCLASS()
+class MYGAME_API UChainSet : public UAttributeSet
+{
+    GENERATED_BODY()
+
+public:
+    UChainSet();
+
+    UFUNCTION(BlueprintPure, Category="Attributes")
+    static AllAttributesEnum AttributeToEnum(const FGameplayAttribute& Attribute);
+
+    // Previous string-comparing lookup, kept to benchmark against AttributeToEnum
+    static AllAttributesEnum AttributeToEnumByName(const FGameplayAttribute& Attribute);
+
+    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;
+
+    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)
+    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
+
+public:
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_Health, Category = "Attributes")
+    FGameplayAttributeData Health;
+    ATTRIBUTE_ACCESSORS(UChainSet, Health)
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_MaxHealth, Category = "Attributes")
+    FGameplayAttributeData MaxHealth;
+    ATTRIBUTE_ACCESSORS(UChainSet, MaxHealth)
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_Mana, Category = "Attributes")
+    FGameplayAttributeData Mana;
+    ATTRIBUTE_ACCESSORS(UChainSet, Mana)
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_MaxMana, Category = "Attributes")
+    FGameplayAttributeData MaxMana;
+    ATTRIBUTE_ACCESSORS(UChainSet, MaxMana)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Damage;
+    ATTRIBUTE_ACCESSORS(UChainSet, Damage)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData VoicelinePitch;
+    ATTRIBUTE_ACCESSORS(UChainSet, VoicelinePitch)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData HairLength;
+    ATTRIBUTE_ACCESSORS(UChainSet, HairLength)
+
+    // Per-attribute change events
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnHealthChanged OnHealthChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnHealthChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnMaxHealthChanged OnMaxHealthChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnMaxHealthChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnManaChanged OnManaChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnManaChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnMaxManaChanged OnMaxManaChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnMaxManaChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnDamageChanged OnDamageChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnDamageChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnVoicelinePitchChanged OnVoicelinePitchChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnVoicelinePitchChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnHairLengthChanged OnHairLengthChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnHairLengthChanged(float OldValue, float NewValue);
+
+    UFUNCTION()
+    void OnRep_Health(const FGameplayAttributeData& OldHealth);
+
+    UFUNCTION()
+    void OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth);
+
+    UFUNCTION()
+    void OnRep_Mana(const FGameplayAttributeData& OldMana);
+
+    UFUNCTION()
+    void OnRep_MaxMana(const FGameplayAttributeData& OldMaxMana);
+
+};
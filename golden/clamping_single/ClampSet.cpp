@@ -0,0 +1,193 @@
+#include "ClampSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UClampSet::UClampSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitStamina(50.0f);
+}
+
+void UClampSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+
+    FDoRepLifetimeParams Params;
+    Params.bIsPushBased = true;
+
+    Params.Condition = COND_None;
+    Params.RepNotifyCondition = REPNOTIFY_Always;
+    DOREPLIFETIME_WITH_PARAMS_FAST(UClampSet, Health, Params);
+
+    Params.Condition = COND_None;
+    Params.RepNotifyCondition = REPNOTIFY_Always;
+    DOREPLIFETIME_WITH_PARAMS_FAST(UClampSet, MaxHealth, Params);
+}
+
+void UClampSet::PostAttributeBaseChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) const
+{
+    Super::PostAttributeBaseChange(Attribute, OldValue, NewValue);
+    if (OldValue != NewValue)
+    {
+        MarkAttributeDirty(Attribute);
+    }
+}
+
+void UClampSet::MarkAttributeDirty(const FGameplayAttribute& Attribute) const
+{
+    switch (AttributeToEnum(Attribute))
+    {
+    case AllAttributesEnum::Health:
+        MARK_PROPERTY_DIRTY_FROM_NAME(UClampSet, Health, this);
+        break;
+    case AllAttributesEnum::MaxHealth:
+        MARK_PROPERTY_DIRTY_FROM_NAME(UClampSet, MaxHealth, this);
+        break;
+    default:
+        break;
+    }
+}
+
+void UClampSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    MarkAttributeDirty(Attribute);
+
+    const AllAttributesEnum Changed = AttributeToEnum(Attribute);
+    if (Changed == AllAttributesEnum::None)
+    {
+        return;
+    }
+
+    ReclampDependents(Changed);
+
+    OnAttributeChanged.Broadcast(Changed, OldValue, NewValue);
+    BP_OnAttributeChanged(Changed, OldValue, NewValue);
+
+    switch (Changed)
+    {
+    case AllAttributesEnum::Stamina:
+        OnStaminaChanged.Broadcast(OldValue, NewValue);
+        BP_OnStaminaChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+void UClampSet::PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue)
+{
+    Super::PreAttributeChange(Attribute, NewValue);
+    ClampAttribute(AttributeToEnum(Attribute), NewValue);
+}
+
+void UClampSet::PostGameplayEffectExecute(const FGameplayEffectModCallbackData& Data)
+{
+    Super::PostGameplayEffectExecute(Data);
+
+    const FGameplayAttribute& Attribute = Data.EvaluatedData.Attribute;
+    const float OldValue = Data.Target.GetNumericAttributeBase(Attribute);
+    float NewValue = OldValue;
+    ClampAttribute(AttributeToEnum(Attribute), NewValue);
+    if (NewValue != OldValue)
+    {
+        Data.Target.SetNumericAttributeBase(Attribute, NewValue);
+    }
+}
+
+void UClampSet::ClampAttribute(AllAttributesEnum Attribute, float& NewValue) const
+{
+    struct FRange
+    {
+        float Min = TNumericLimits<float>::Lowest();
+        float Max = TNumericLimits<float>::Max();
+        FGameplayAttributeData UClampSet::* MinAttribute = nullptr;
+        FGameplayAttributeData UClampSet::* MaxAttribute = nullptr;
+    };
+
+    // One slot per AllAttributesEnum value, built once; unbounded slots clamp to the float limits
+    static const TArray<FRange> Ranges = []()
+    {
+        TArray<FRange> Table;
+        Table.SetNum(static_cast<int32>(AllAttributesEnum::None));
+        Table[static_cast<int32>(AllAttributesEnum::Health)] = { 0.0f, TNumericLimits<float>::Max(), nullptr, &UClampSet::MaxHealth };
+        Table[static_cast<int32>(AllAttributesEnum::MaxHealth)] = { 1.0f, TNumericLimits<float>::Max(), nullptr, nullptr };
+        Table[static_cast<int32>(AllAttributesEnum::Stamina)] = { -10.5f, 100.0f, nullptr, nullptr };
+        return Table;
+    }();
+
+    const int32 Index = static_cast<int32>(Attribute);
+    if (!Ranges.IsValidIndex(Index))
+    {
+        return;
+    }
+    const FRange& Range = Ranges[Index];
+    const float Min = Range.MinAttribute ? (this->*Range.MinAttribute).GetCurrentValue() : Range.Min;
+    const float Max = Range.MaxAttribute ? (this->*Range.MaxAttribute).GetCurrentValue() : Range.Max;
+    NewValue = FMath::Clamp(NewValue, Min, Max);
+}
+
+void UClampSet::ReclampDependents(AllAttributesEnum Bound)
+{
+    float Value = 0.f;
+    switch (Bound)
+    {
+    case AllAttributesEnum::MaxHealth:
+        Value = GetHealth();
+        ClampAttribute(AllAttributesEnum::Health, Value);
+        if (Value != GetHealth())
+        {
+            SetHealth(Value);
+        }
+        break;
+    default:
+        break;
+    }
+}
+
+void UClampSet::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UClampSet, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnAttributeChanged.Broadcast(AllAttributesEnum::Health, OldValue, NewValue);
+        BP_OnAttributeChanged(AllAttributesEnum::Health, OldValue, NewValue);
+    }
+}
+
+void UClampSet::OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UClampSet, MaxHealth, OldMaxHealth);
+    const float OldValue = OldMaxHealth.GetCurrentValue();
+    const float NewValue = MaxHealth.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnAttributeChanged.Broadcast(AllAttributesEnum::MaxHealth, OldValue, NewValue);
+        BP_OnAttributeChanged(AllAttributesEnum::MaxHealth, OldValue, NewValue);
+    }
+}
+
+AllAttributesEnum UClampSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(3);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetStaminaAttribute().GetUProperty(), AllAttributesEnum::Stamina);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
@@ -0,0 +1,114 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "AttributeSet.h"
+#include "AbilitySystemComponent.h"
+#include "GameplayEffectExtension.h"
+#include "Net/Core/PushModel/PushModel.h"
+#include "ClampSet.generated.h"
+
+UENUM(BlueprintType)
+enum class AllAttributesEnum : uint8
+{
+    Health UMETA(DisplayName = "Health"),
+    MaxHealth UMETA(DisplayName = "MaxHealth"),
+    Stamina UMETA(DisplayName = "Stamina"),
+    None UMETA(Hidden)
+};
+
+#define ATTRIBUTE_ACCESSORS(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_SETTER(PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_INITTER(PropertyName)
+
+#define ATTRIBUTE_ACCESSORS_PUSH(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName) \
+    FORCEINLINE void Set##PropertyName(float NewVal) \
+    { \
+        UAbilitySystemComponent* AbilityComp = GetOwningAbilitySystemComponent(); \
+        if (ensure(AbilityComp)) \
+        { \
+            AbilityComp->SetNumericAttributeBase(Get##PropertyName##Attribute(), NewVal); \
+        } \
+        MARK_PROPERTY_DIRTY_FROM_NAME(ClassName, PropertyName, this); \
+    } \
+    FORCEINLINE void Init##PropertyName(float NewVal) \
+    { \
+        PropertyName.SetBaseValue(NewVal); \
+        PropertyName.SetCurrentValue(NewVal); \
+        MARK_PROPERTY_DIRTY_FROM_NAME(ClassName, PropertyName, this); \
+    }
+
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_ThreeParams(FOnAttributeChanged, AllAttributesEnum, Attribute, float, OldValue, float, NewValue);
+
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnStaminaChanged, float, OldValue, float, NewValue);
+
+// Replication estimate: 2 attributes, ~18 bytes initial, ~18 bytes per full update
+UCLASS()
+class MYGAME_API UClampSet : public UAttributeSet
+{
+    GENERATED_BODY()
+
+public:
+    UClampSet();
+
+    UFUNCTION(BlueprintPure, Category="Attributes")
+    static AllAttributesEnum AttributeToEnum(const FGameplayAttribute& Attribute);
+
+    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;
+
+    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)
+    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
+
+    // Clamp to the ranges declared with min=/max=
+    virtual void PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue) override;
+    virtual void PostGameplayEffectExecute(const FGameplayEffectModCallbackData& Data) override;
+
+    // Looks the range up in a table indexed by AllAttributesEnum, so clamping is O(1)
+    void ClampAttribute(AllAttributesEnum Attribute, float& NewValue) const;
+
+    // Re-clamps the attributes bounded by Bound after it changed, e.g. Health when MaxHealth drops
+    void ReclampDependents(AllAttributesEnum Bound);
+
+    virtual void PostAttributeBaseChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) const override;
+
+    // Marks a replicated attribute dirty for the push-model replication system
+    void MarkAttributeDirty(const FGameplayAttribute& Attribute) const;
+
+public:
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_Health, Category = "Attributes")
+    FGameplayAttributeData Health;
+    ATTRIBUTE_ACCESSORS_PUSH(UClampSet, Health)
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_MaxHealth, Category = "Attributes")
+    FGameplayAttributeData MaxHealth;
+    ATTRIBUTE_ACCESSORS_PUSH(UClampSet, MaxHealth)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Stamina;
+    ATTRIBUTE_ACCESSORS(UClampSet, Stamina)
+
+    // Change events for every attribute, identified by AllAttributesEnum
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnAttributeChanged OnAttributeChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnAttributeChanged(AllAttributesEnum Attribute, float OldValue, float NewValue);
+
+    // Per-attribute change events
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnStaminaChanged OnStaminaChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnStaminaChanged(float OldValue, float NewValue);
+
+    UFUNCTION()
+    void OnRep_Health(const FGameplayAttributeData& OldHealth);
+
+    UFUNCTION()
+    void OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth);
+
+};
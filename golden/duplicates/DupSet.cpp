@@ -0,0 +1,135 @@
+#include "DupSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UDupSet::UDupSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitMana(50.0f);
+    InitMaxMana(50.0f);
+    InitDamage(15.0f);
+    InitVoicelinePitch(1.2f);
+    InitHairLength(0.7f);
+}
+
+void UDupSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UDupSet, Health, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UDupSet, MaxHealth, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UDupSet, Mana, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UDupSet, MaxMana, COND_None, REPNOTIFY_Always);
+}
+
+void UDupSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    switch (AttributeToEnum(Attribute))
+    {
+    case AllAttributesEnum::Health:
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxHealth:
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Mana:
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxMana:
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Damage:
+        OnDamageChanged.Broadcast(OldValue, NewValue);
+        BP_OnDamageChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::VoicelinePitch:
+        OnVoicelinePitchChanged.Broadcast(OldValue, NewValue);
+        BP_OnVoicelinePitchChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::HairLength:
+        OnHairLengthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHairLengthChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+void UDupSet::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UDupSet, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+    }
+}
+
+void UDupSet::OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UDupSet, MaxHealth, OldMaxHealth);
+    const float OldValue = OldMaxHealth.GetCurrentValue();
+    const float NewValue = MaxHealth.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+    }
+}
+
+void UDupSet::OnRep_Mana(const FGameplayAttributeData& OldMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UDupSet, Mana, OldMana);
+    const float OldValue = OldMana.GetCurrentValue();
+    const float NewValue = Mana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+    }
+}
+
+void UDupSet::OnRep_MaxMana(const FGameplayAttributeData& OldMaxMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UDupSet, MaxMana, OldMaxMana);
+    const float OldValue = OldMaxMana.GetCurrentValue();
+    const float NewValue = MaxMana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+    }
+}
+
+AllAttributesEnum UDupSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(7);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetManaAttribute().GetUProperty(), AllAttributesEnum::Mana);
+        Map.Add(GetMaxManaAttribute().GetUProperty(), AllAttributesEnum::MaxMana);
+        Map.Add(GetDamageAttribute().GetUProperty(), AllAttributesEnum::Damage);
+        Map.Add(GetVoicelinePitchAttribute().GetUProperty(), AllAttributesEnum::VoicelinePitch);
+        Map.Add(GetHairLengthAttribute().GetUProperty(), AllAttributesEnum::HairLength);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
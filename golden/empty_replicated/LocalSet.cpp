@@ -0,0 +1,83 @@
+#include "LocalSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+ULocalSet::ULocalSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitMana(50.0f);
+    InitMaxMana(50.0f);
+    InitDamage(15.0f);
+    InitVoicelinePitch(1.2f);
+    InitHairLength(0.7f);
+}
+
+void ULocalSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+}
+
+void ULocalSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    switch (AttributeToEnum(Attribute))
+    {
+    case AllAttributesEnum::Health:
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxHealth:
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Mana:
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxMana:
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Damage:
+        OnDamageChanged.Broadcast(OldValue, NewValue);
+        BP_OnDamageChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::VoicelinePitch:
+        OnVoicelinePitchChanged.Broadcast(OldValue, NewValue);
+        BP_OnVoicelinePitchChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::HairLength:
+        OnHairLengthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHairLengthChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+AllAttributesEnum ULocalSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(7);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetManaAttribute().GetUProperty(), AllAttributesEnum::Mana);
+        Map.Add(GetMaxManaAttribute().GetUProperty(), AllAttributesEnum::MaxMana);
+        Map.Add(GetDamageAttribute().GetUProperty(), AllAttributesEnum::Damage);
+        Map.Add(GetVoicelinePitchAttribute().GetUProperty(), AllAttributesEnum::VoicelinePitch);
+        Map.Add(GetHairLengthAttribute().GetUProperty(), AllAttributesEnum::HairLength);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
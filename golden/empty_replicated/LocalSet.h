@@ -0,0 +1,125 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "AttributeSet.h"
+#include "AbilitySystemComponent.h"
+#include "GameplayEffectExtension.h"
+#include "LocalSet.generated.h"
+
+UENUM(BlueprintType)
+enum class AllAttributesEnum : uint8
+{
+    Health UMETA(DisplayName = "Health"),
+    MaxHealth UMETA(DisplayName = "MaxHealth"),
+    Mana UMETA(DisplayName = "Mana"),
+    MaxMana UMETA(DisplayName = "MaxMana"),
+    Damage UMETA(DisplayName = "Damage"),
+    VoicelinePitch UMETA(DisplayName = "VoicelinePitch"),
+    HairLength UMETA(DisplayName = "HairLength"),
+    None UMETA(Hidden)
+};
+
+#define ATTRIBUTE_ACCESSORS(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_SETTER(PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_INITTER(PropertyName)
+
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnHealthChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnMaxHealthChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnManaChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnMaxManaChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnDamageChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnVoicelinePitchChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnHairLengthChanged, float, OldValue, float, NewValue);
+
+UCLASS()
+class MYGAME_API ULocalSet : public UAttributeSet
+{
+    GENERATED_BODY()
+
+public:
+    ULocalSet();
+
+    UFUNCTION(BlueprintPure, Category="Attributes")
+    static AllAttributesEnum AttributeToEnum(const FGameplayAttribute& Attribute);
+
+    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;
+
+    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)
+    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
+
+public:
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Health;
+    ATTRIBUTE_ACCESSORS(ULocalSet, Health)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData MaxHealth;
+    ATTRIBUTE_ACCESSORS(ULocalSet, MaxHealth)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Mana;
+    ATTRIBUTE_ACCESSORS(ULocalSet, Mana)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData MaxMana;
+    ATTRIBUTE_ACCESSORS(ULocalSet, MaxMana)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Damage;
+    ATTRIBUTE_ACCESSORS(ULocalSet, Damage)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData VoicelinePitch;
+    ATTRIBUTE_ACCESSORS(ULocalSet, VoicelinePitch)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData HairLength;
+    ATTRIBUTE_ACCESSORS(ULocalSet, HairLength)
+
+    // Per-attribute change events
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnHealthChanged OnHealthChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnHealthChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnMaxHealthChanged OnMaxHealthChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnMaxHealthChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnManaChanged OnManaChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnManaChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnMaxManaChanged OnMaxManaChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnMaxManaChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnDamageChanged OnDamageChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnDamageChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnVoicelinePitchChanged OnVoicelinePitchChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnVoicelinePitchChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnHairLengthChanged OnHairLengthChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnHairLengthChanged(float OldValue, float NewValue);
+
+};
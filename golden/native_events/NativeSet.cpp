@@ -0,0 +1,168 @@
+#include "NativeSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UNativeSet::UNativeSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitMana(50.0f);
+    InitMaxMana(50.0f);
+    InitDamage(15.0f);
+    InitVoicelinePitch(1.2f);
+    InitHairLength(0.7f);
+}
+
+void UNativeSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNativeSet, Health, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNativeSet, MaxHealth, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNativeSet, Mana, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UNativeSet, MaxMana, COND_None, REPNOTIFY_Always);
+}
+
+void UNativeSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    switch (AttributeToEnum(Attribute))
+    {
+    case AllAttributesEnum::Health:
+        OnHealthChangedNative.Broadcast(OldValue, NewValue);
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnHealthChanged(OldValue, NewValue);
+#endif
+        break;
+    case AllAttributesEnum::MaxHealth:
+        OnMaxHealthChangedNative.Broadcast(OldValue, NewValue);
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+#endif
+        break;
+    case AllAttributesEnum::Mana:
+        OnManaChangedNative.Broadcast(OldValue, NewValue);
+        OnManaChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnManaChanged(OldValue, NewValue);
+#endif
+        break;
+    case AllAttributesEnum::MaxMana:
+        OnMaxManaChangedNative.Broadcast(OldValue, NewValue);
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnMaxManaChanged(OldValue, NewValue);
+#endif
+        break;
+    case AllAttributesEnum::Damage:
+        OnDamageChangedNative.Broadcast(OldValue, NewValue);
+        OnDamageChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnDamageChanged(OldValue, NewValue);
+#endif
+        break;
+    case AllAttributesEnum::VoicelinePitch:
+        OnVoicelinePitchChangedNative.Broadcast(OldValue, NewValue);
+        OnVoicelinePitchChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnVoicelinePitchChanged(OldValue, NewValue);
+#endif
+        break;
+    case AllAttributesEnum::HairLength:
+        OnHairLengthChangedNative.Broadcast(OldValue, NewValue);
+        OnHairLengthChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnHairLengthChanged(OldValue, NewValue);
+#endif
+        break;
+    default:
+        break;
+    }
+}
+
+void UNativeSet::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNativeSet, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnHealthChangedNative.Broadcast(OldValue, NewValue);
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnHealthChanged(OldValue, NewValue);
+#endif
+    }
+}
+
+void UNativeSet::OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNativeSet, MaxHealth, OldMaxHealth);
+    const float OldValue = OldMaxHealth.GetCurrentValue();
+    const float NewValue = MaxHealth.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxHealthChangedNative.Broadcast(OldValue, NewValue);
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+#endif
+    }
+}
+
+void UNativeSet::OnRep_Mana(const FGameplayAttributeData& OldMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNativeSet, Mana, OldMana);
+    const float OldValue = OldMana.GetCurrentValue();
+    const float NewValue = Mana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnManaChangedNative.Broadcast(OldValue, NewValue);
+        OnManaChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnManaChanged(OldValue, NewValue);
+#endif
+    }
+}
+
+void UNativeSet::OnRep_MaxMana(const FGameplayAttributeData& OldMaxMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UNativeSet, MaxMana, OldMaxMana);
+    const float OldValue = OldMaxMana.GetCurrentValue();
+    const float NewValue = MaxMana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxManaChangedNative.Broadcast(OldValue, NewValue);
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+#if !UE_SERVER
+        BP_OnMaxManaChanged(OldValue, NewValue);
+#endif
+    }
+}
+
+AllAttributesEnum UNativeSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(7);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetManaAttribute().GetUProperty(), AllAttributesEnum::Mana);
+        Map.Add(GetMaxManaAttribute().GetUProperty(), AllAttributesEnum::MaxMana);
+        Map.Add(GetDamageAttribute().GetUProperty(), AllAttributesEnum::Damage);
+        Map.Add(GetVoicelinePitchAttribute().GetUProperty(), AllAttributesEnum::VoicelinePitch);
+        Map.Add(GetHairLengthAttribute().GetUProperty(), AllAttributesEnum::HairLength);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
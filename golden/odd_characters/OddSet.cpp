@@ -0,0 +1,101 @@
+#include "OddSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UOddSet::UOddSet()
+{
+    InitMove_Speed(600.0f);
+    InitCrit_Chance(0.05f);
+    InitFire_Resist_(10.0f);
+    Initx(1000.0f);
+}
+
+void UOddSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UOddSet, Move_Speed, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UOddSet, Armor_Pen, COND_None, REPNOTIFY_Always);
+}
+
+void UOddSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    switch (AttributeToEnum(Attribute))
+    {
+    case AllAttributesEnum::Move_Speed:
+        OnMove_SpeedChanged.Broadcast(OldValue, NewValue);
+        BP_OnMove_SpeedChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Crit_Chance:
+        OnCrit_ChanceChanged.Broadcast(OldValue, NewValue);
+        BP_OnCrit_ChanceChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Armor_Pen:
+        OnArmor_PenChanged.Broadcast(OldValue, NewValue);
+        BP_OnArmor_PenChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Fire_Resist_:
+        OnFire_Resist_Changed.Broadcast(OldValue, NewValue);
+        BP_OnFire_Resist_Changed(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::_Hidden:
+        On_HiddenChanged.Broadcast(OldValue, NewValue);
+        BP_On_HiddenChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::x:
+        OnxChanged.Broadcast(OldValue, NewValue);
+        BP_OnxChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+void UOddSet::OnRep_Move_Speed(const FGameplayAttributeData& OldMove_Speed)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UOddSet, Move_Speed, OldMove_Speed);
+    const float OldValue = OldMove_Speed.GetCurrentValue();
+    const float NewValue = Move_Speed.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMove_SpeedChanged.Broadcast(OldValue, NewValue);
+        BP_OnMove_SpeedChanged(OldValue, NewValue);
+    }
+}
+
+void UOddSet::OnRep_Armor_Pen(const FGameplayAttributeData& OldArmor_Pen)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UOddSet, Armor_Pen, OldArmor_Pen);
+    const float OldValue = OldArmor_Pen.GetCurrentValue();
+    const float NewValue = Armor_Pen.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnArmor_PenChanged.Broadcast(OldValue, NewValue);
+        BP_OnArmor_PenChanged(OldValue, NewValue);
+    }
+}
+
+AllAttributesEnum UOddSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(6);
+        Map.Add(GetMove_SpeedAttribute().GetUProperty(), AllAttributesEnum::Move_Speed);
+        Map.Add(GetCrit_ChanceAttribute().GetUProperty(), AllAttributesEnum::Crit_Chance);
+        Map.Add(GetArmor_PenAttribute().GetUProperty(), AllAttributesEnum::Armor_Pen);
+        Map.Add(GetFire_Resist_Attribute().GetUProperty(), AllAttributesEnum::Fire_Resist_);
+        Map.Add(Get_HiddenAttribute().GetUProperty(), AllAttributesEnum::_Hidden);
+        Map.Add(GetxAttribute().GetUProperty(), AllAttributesEnum::x);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
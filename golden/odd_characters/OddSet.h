@@ -0,0 +1,120 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "MyBaseSet.h"
+#include "AbilitySystemComponent.h"
+#include "GameplayEffectExtension.h"
+#include "OddSet.generated.h"
+
+UENUM(BlueprintType)
+enum class AllAttributesEnum : uint8
+{
+    Move_Speed UMETA(DisplayName = "Move_Speed"),
+    Crit_Chance UMETA(DisplayName = "Crit_Chance"),
+    Armor_Pen UMETA(DisplayName = "Armor_Pen"),
+    Fire_Resist_ UMETA(DisplayName = "Fire_Resist_"),
+    _Hidden UMETA(DisplayName = "_Hidden"),
+    x UMETA(DisplayName = "x"),
+    None UMETA(Hidden)
+};
+
+#define ATTRIBUTE_ACCESSORS(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_SETTER(PropertyName) \
+    GAMEPLAYATTRIBUTE_VALUE_INITTER(PropertyName)
+
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnMove_SpeedChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnCrit_ChanceChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnArmor_PenChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnFire_Resist_Changed, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOn_HiddenChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnxChanged, float, OldValue, float, NewValue);
+
+// Replication estimate: 2 attributes, ~18 bytes initial, ~18 bytes per full update
+UCLASS()
+class MYGAME_API UOddSet : public UMyBaseSet
+{
+    GENERATED_BODY()
+
+public:
+    UOddSet();
+
+    UFUNCTION(BlueprintPure, Category="Attributes")
+    static AllAttributesEnum AttributeToEnum(const FGameplayAttribute& Attribute);
+
+    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;
+
+    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)
+    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
+
+public:
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_Move_Speed, Category = "Attributes")
+    FGameplayAttributeData Move_Speed;
+    ATTRIBUTE_ACCESSORS(UOddSet, Move_Speed)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Crit_Chance;
+    ATTRIBUTE_ACCESSORS(UOddSet, Crit_Chance)
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_Armor_Pen, Category = "Attributes")
+    FGameplayAttributeData Armor_Pen;
+    ATTRIBUTE_ACCESSORS(UOddSet, Armor_Pen)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Fire_Resist_;
+    ATTRIBUTE_ACCESSORS(UOddSet, Fire_Resist_)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData _Hidden;
+    ATTRIBUTE_ACCESSORS(UOddSet, _Hidden)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData x;
+    ATTRIBUTE_ACCESSORS(UOddSet, x)
+
+    // Per-attribute change events
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnMove_SpeedChanged OnMove_SpeedChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnMove_SpeedChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnCrit_ChanceChanged OnCrit_ChanceChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnCrit_ChanceChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnArmor_PenChanged OnArmor_PenChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnArmor_PenChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnFire_Resist_Changed OnFire_Resist_Changed;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnFire_Resist_Changed(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOn_HiddenChanged On_HiddenChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_On_HiddenChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnxChanged OnxChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnxChanged(float OldValue, float NewValue);
+
+    UFUNCTION()
+    void OnRep_Move_Speed(const FGameplayAttributeData& OldMove_Speed);
+
+    UFUNCTION()
+    void OnRep_Armor_Pen(const FGameplayAttributeData& OldArmor_Pen);
+
+};
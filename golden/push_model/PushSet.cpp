@@ -0,0 +1,182 @@
+#include "PushSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UPushSet::UPushSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitMana(50.0f);
+    InitMaxMana(50.0f);
+    InitDamage(15.0f);
+    InitVoicelinePitch(1.2f);
+    InitHairLength(0.7f);
+}
+
+void UPushSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+
+    FDoRepLifetimeParams Params;
+    Params.bIsPushBased = true;
+
+    Params.Condition = COND_None;
+    Params.RepNotifyCondition = REPNOTIFY_OnChanged;
+    DOREPLIFETIME_WITH_PARAMS_FAST(UPushSet, Health, Params);
+
+    Params.Condition = COND_None;
+    Params.RepNotifyCondition = REPNOTIFY_OnChanged;
+    DOREPLIFETIME_WITH_PARAMS_FAST(UPushSet, MaxHealth, Params);
+
+    Params.Condition = COND_None;
+    Params.RepNotifyCondition = REPNOTIFY_OnChanged;
+    DOREPLIFETIME_WITH_PARAMS_FAST(UPushSet, Mana, Params);
+
+    Params.Condition = COND_None;
+    Params.RepNotifyCondition = REPNOTIFY_OnChanged;
+    DOREPLIFETIME_WITH_PARAMS_FAST(UPushSet, MaxMana, Params);
+}
+
+void UPushSet::PostAttributeBaseChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) const
+{
+    Super::PostAttributeBaseChange(Attribute, OldValue, NewValue);
+    if (OldValue != NewValue)
+    {
+        MarkAttributeDirty(Attribute);
+    }
+}
+
+void UPushSet::MarkAttributeDirty(const FGameplayAttribute& Attribute) const
+{
+    switch (AttributeToEnum(Attribute))
+    {
+    case AllAttributesEnum::Health:
+        MARK_PROPERTY_DIRTY_FROM_NAME(UPushSet, Health, this);
+        break;
+    case AllAttributesEnum::MaxHealth:
+        MARK_PROPERTY_DIRTY_FROM_NAME(UPushSet, MaxHealth, this);
+        break;
+    case AllAttributesEnum::Mana:
+        MARK_PROPERTY_DIRTY_FROM_NAME(UPushSet, Mana, this);
+        break;
+    case AllAttributesEnum::MaxMana:
+        MARK_PROPERTY_DIRTY_FROM_NAME(UPushSet, MaxMana, this);
+        break;
+    default:
+        break;
+    }
+}
+
+void UPushSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    MarkAttributeDirty(Attribute);
+
+    switch (AttributeToEnum(Attribute))
+    {
+    case AllAttributesEnum::Health:
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxHealth:
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Mana:
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxMana:
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Damage:
+        OnDamageChanged.Broadcast(OldValue, NewValue);
+        BP_OnDamageChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::VoicelinePitch:
+        OnVoicelinePitchChanged.Broadcast(OldValue, NewValue);
+        BP_OnVoicelinePitchChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::HairLength:
+        OnHairLengthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHairLengthChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+void UPushSet::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UPushSet, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+    }
+}
+
+void UPushSet::OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UPushSet, MaxHealth, OldMaxHealth);
+    const float OldValue = OldMaxHealth.GetCurrentValue();
+    const float NewValue = MaxHealth.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+    }
+}
+
+void UPushSet::OnRep_Mana(const FGameplayAttributeData& OldMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UPushSet, Mana, OldMana);
+    const float OldValue = OldMana.GetCurrentValue();
+    const float NewValue = Mana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+    }
+}
+
+void UPushSet::OnRep_MaxMana(const FGameplayAttributeData& OldMaxMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UPushSet, MaxMana, OldMaxMana);
+    const float OldValue = OldMaxMana.GetCurrentValue();
+    const float NewValue = MaxMana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxManaChanged(OldValue, NewValue);
+    }
+}
+
+AllAttributesEnum UPushSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(7);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetManaAttribute().GetUProperty(), AllAttributesEnum::Mana);
+        Map.Add(GetMaxManaAttribute().GetUProperty(), AllAttributesEnum::MaxMana);
+        Map.Add(GetDamageAttribute().GetUProperty(), AllAttributesEnum::Damage);
+        Map.Add(GetVoicelinePitchAttribute().GetUProperty(), AllAttributesEnum::VoicelinePitch);
+        Map.Add(GetHairLengthAttribute().GetUProperty(), AllAttributesEnum::HairLength);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
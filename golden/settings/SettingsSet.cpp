@@ -0,0 +1,188 @@
+#include "SettingsSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+USettingsSet::USettingsSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitMana(50.0f);
+    InitArmor(-5.5f);
+}
+
+void USettingsSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(USettingsSet, Health, COND_OwnerOnly, REPNOTIFY_OnChanged);
+    DOREPLIFETIME_CONDITION_NOTIFY(USettingsSet, MaxHealth, COND_InitialOnly, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(USettingsSet, Mana, COND_None, REPNOTIFY_OnChanged);
+}
+
+void USettingsSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    const AllAttributesEnum Changed = AttributeToEnum(Attribute);
+    ReclampDependents(Changed);
+
+    switch (Changed)
+    {
+    case AllAttributesEnum::Health:
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::MaxHealth:
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Mana:
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Shield:
+        OnShieldChanged.Broadcast(OldValue, NewValue);
+        BP_OnShieldChanged(OldValue, NewValue);
+        break;
+    case AllAttributesEnum::Armor:
+        OnArmorChanged.Broadcast(OldValue, NewValue);
+        BP_OnArmorChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+void USettingsSet::PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue)
+{
+    Super::PreAttributeChange(Attribute, NewValue);
+    ClampAttribute(AttributeToEnum(Attribute), NewValue);
+}
+
+void USettingsSet::PostGameplayEffectExecute(const FGameplayEffectModCallbackData& Data)
+{
+    Super::PostGameplayEffectExecute(Data);
+
+    const FGameplayAttribute& Attribute = Data.EvaluatedData.Attribute;
+    const float OldValue = Data.Target.GetNumericAttributeBase(Attribute);
+    float NewValue = OldValue;
+    ClampAttribute(AttributeToEnum(Attribute), NewValue);
+    if (NewValue != OldValue)
+    {
+        Data.Target.SetNumericAttributeBase(Attribute, NewValue);
+    }
+}
+
+void USettingsSet::ClampAttribute(AllAttributesEnum Attribute, float& NewValue) const
+{
+    struct FRange
+    {
+        float Min = TNumericLimits<float>::Lowest();
+        float Max = TNumericLimits<float>::Max();
+        FGameplayAttributeData USettingsSet::* MinAttribute = nullptr;
+        FGameplayAttributeData USettingsSet::* MaxAttribute = nullptr;
+    };
+
+    // One slot per AllAttributesEnum value, built once; unbounded slots clamp to the float limits
+    static const TArray<FRange> Ranges = []()
+    {
+        TArray<FRange> Table;
+        Table.SetNum(static_cast<int32>(AllAttributesEnum::None));
+        Table[static_cast<int32>(AllAttributesEnum::Health)] = { 0.0f, TNumericLimits<float>::Max(), nullptr, &USettingsSet::MaxHealth };
+        Table[static_cast<int32>(AllAttributesEnum::Mana)] = { 0.0f, TNumericLimits<float>::Max(), nullptr, nullptr };
+        Table[static_cast<int32>(AllAttributesEnum::Shield)] = { TNumericLimits<float>::Lowest(), TNumericLimits<float>::Max(), nullptr, &USettingsSet::MaxHealth };
+        return Table;
+    }();
+
+    const int32 Index = static_cast<int32>(Attribute);
+    if (!Ranges.IsValidIndex(Index))
+    {
+        return;
+    }
+    const FRange& Range = Ranges[Index];
+    const float Min = Range.MinAttribute ? (this->*Range.MinAttribute).GetCurrentValue() : Range.Min;
+    const float Max = Range.MaxAttribute ? (this->*Range.MaxAttribute).GetCurrentValue() : Range.Max;
+    NewValue = FMath::Clamp(NewValue, Min, Max);
+}
+
+void USettingsSet::ReclampDependents(AllAttributesEnum Bound)
+{
+    float Value = 0.f;
+    switch (Bound)
+    {
+    case AllAttributesEnum::MaxHealth:
+        Value = GetHealth();
+        ClampAttribute(AllAttributesEnum::Health, Value);
+        if (Value != GetHealth())
+        {
+            SetHealth(Value);
+        }
+        Value = GetShield();
+        ClampAttribute(AllAttributesEnum::Shield, Value);
+        if (Value != GetShield())
+        {
+            SetShield(Value);
+        }
+        break;
+    default:
+        break;
+    }
+}
+
+void USettingsSet::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(USettingsSet, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+    }
+}
+
+void USettingsSet::OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(USettingsSet, MaxHealth, OldMaxHealth);
+    const float OldValue = OldMaxHealth.GetCurrentValue();
+    const float NewValue = MaxHealth.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+    }
+}
+
+void USettingsSet::OnRep_Mana(const FGameplayAttributeData& OldMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(USettingsSet, Mana, OldMana);
+    const float OldValue = OldMana.GetCurrentValue();
+    const float NewValue = Mana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnManaChanged.Broadcast(OldValue, NewValue);
+        BP_OnManaChanged(OldValue, NewValue);
+    }
+}
+
+AllAttributesEnum USettingsSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(5);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetManaAttribute().GetUProperty(), AllAttributesEnum::Mana);
+        Map.Add(GetShieldAttribute().GetUProperty(), AllAttributesEnum::Shield);
+        Map.Add(GetArmorAttribute().GetUProperty(), AllAttributesEnum::Armor);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
@@ -0,0 +1,66 @@
+#include "PrefixSet_Combat.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UPrefixSet_Combat::UPrefixSet_Combat()
+{
+    InitCombat_Damage(10.0f);
+    InitCombat_Crit(0.1f);
+}
+
+void UPrefixSet_Combat::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UPrefixSet_Combat, Combat_Damage, COND_None, REPNOTIFY_Always);
+}
+
+void UPrefixSet_Combat::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    switch (AttributeToEnum(Attribute))
+    {
+    case EPrefixSet_CombatAttribute::Combat_Damage:
+        OnCombat_DamageChanged.Broadcast(OldValue, NewValue);
+        BP_OnCombat_DamageChanged(OldValue, NewValue);
+        break;
+    case EPrefixSet_CombatAttribute::Combat_Crit:
+        OnCombat_CritChanged.Broadcast(OldValue, NewValue);
+        BP_OnCombat_CritChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+void UPrefixSet_Combat::OnRep_Combat_Damage(const FGameplayAttributeData& OldCombat_Damage)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UPrefixSet_Combat, Combat_Damage, OldCombat_Damage);
+    const float OldValue = OldCombat_Damage.GetCurrentValue();
+    const float NewValue = Combat_Damage.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnCombat_DamageChanged.Broadcast(OldValue, NewValue);
+        BP_OnCombat_DamageChanged(OldValue, NewValue);
+    }
+}
+
+EPrefixSet_CombatAttribute UPrefixSet_Combat::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, EPrefixSet_CombatAttribute> Lookup = []()
+    {
+        TMap<const FProperty*, EPrefixSet_CombatAttribute> Map;
+        Map.Reserve(2);
+        Map.Add(GetCombat_DamageAttribute().GetUProperty(), EPrefixSet_CombatAttribute::Combat_Damage);
+        Map.Add(GetCombat_CritAttribute().GetUProperty(), EPrefixSet_CombatAttribute::Combat_Crit);
+        return Map;
+    }();
+
+    const EPrefixSet_CombatAttribute* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : EPrefixSet_CombatAttribute::None;
+}
@@ -0,0 +1,64 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "AttributeSet.h"
+#include "AbilitySystemComponent.h"
+#include "GameplayEffectExtension.h"
+#include "PrefixSetAttributes.h"
+#include "PrefixSet_Combat.generated.h"
+
+UENUM(BlueprintType)
+enum class EPrefixSet_CombatAttribute : uint8
+{
+    Combat_Damage UMETA(DisplayName = "Combat_Damage"),
+    Combat_Crit UMETA(DisplayName = "Combat_Crit"),
+    None UMETA(Hidden)
+};
+
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnCombat_DamageChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnCombat_CritChanged, float, OldValue, float, NewValue);
+
+// Replication estimate: 1 attributes, ~9 bytes initial, ~9 bytes per full update
+UCLASS()
+class MYGAME_API UPrefixSet_Combat : public UAttributeSet
+{
+    GENERATED_BODY()
+
+public:
+    UPrefixSet_Combat();
+
+    UFUNCTION(BlueprintPure, Category="Attributes")
+    static EPrefixSet_CombatAttribute AttributeToEnum(const FGameplayAttribute& Attribute);
+
+    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;
+
+    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)
+    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
+
+public:
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_Combat_Damage, Category = "Attributes")
+    FGameplayAttributeData Combat_Damage;
+    ATTRIBUTE_ACCESSORS(UPrefixSet_Combat, Combat_Damage)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Combat_Crit;
+    ATTRIBUTE_ACCESSORS(UPrefixSet_Combat, Combat_Crit)
+
+    // Per-attribute change events
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnCombat_DamageChanged OnCombat_DamageChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnCombat_DamageChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnCombat_CritChanged OnCombat_CritChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnCombat_CritChanged(float OldValue, float NewValue);
+
+    UFUNCTION()
+    void OnRep_Combat_Damage(const FGameplayAttributeData& OldCombat_Damage);
+
+};
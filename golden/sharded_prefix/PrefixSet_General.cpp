@@ -0,0 +1,137 @@
+#include "PrefixSet_General.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UPrefixSet_General::UPrefixSet_General()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+}
+
+void UPrefixSet_General::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UPrefixSet_General, Health, COND_None, REPNOTIFY_Always);
+}
+
+void UPrefixSet_General::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    const EPrefixSet_GeneralAttribute Changed = AttributeToEnum(Attribute);
+    ReclampDependents(Changed);
+
+    switch (Changed)
+    {
+    case EPrefixSet_GeneralAttribute::Health:
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+        break;
+    case EPrefixSet_GeneralAttribute::MaxHealth:
+        OnMaxHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnMaxHealthChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+void UPrefixSet_General::PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue)
+{
+    Super::PreAttributeChange(Attribute, NewValue);
+    ClampAttribute(AttributeToEnum(Attribute), NewValue);
+}
+
+void UPrefixSet_General::PostGameplayEffectExecute(const FGameplayEffectModCallbackData& Data)
+{
+    Super::PostGameplayEffectExecute(Data);
+
+    const FGameplayAttribute& Attribute = Data.EvaluatedData.Attribute;
+    const float OldValue = Data.Target.GetNumericAttributeBase(Attribute);
+    float NewValue = OldValue;
+    ClampAttribute(AttributeToEnum(Attribute), NewValue);
+    if (NewValue != OldValue)
+    {
+        Data.Target.SetNumericAttributeBase(Attribute, NewValue);
+    }
+}
+
+void UPrefixSet_General::ClampAttribute(EPrefixSet_GeneralAttribute Attribute, float& NewValue) const
+{
+    struct FRange
+    {
+        float Min = TNumericLimits<float>::Lowest();
+        float Max = TNumericLimits<float>::Max();
+        FGameplayAttributeData UPrefixSet_General::* MinAttribute = nullptr;
+        FGameplayAttributeData UPrefixSet_General::* MaxAttribute = nullptr;
+    };
+
+    // One slot per EPrefixSet_GeneralAttribute value, built once; unbounded slots clamp to the float limits
+    static const TArray<FRange> Ranges = []()
+    {
+        TArray<FRange> Table;
+        Table.SetNum(static_cast<int32>(EPrefixSet_GeneralAttribute::None));
+        Table[static_cast<int32>(EPrefixSet_GeneralAttribute::Health)] = { TNumericLimits<float>::Lowest(), TNumericLimits<float>::Max(), nullptr, &UPrefixSet_General::MaxHealth };
+        return Table;
+    }();
+
+    const int32 Index = static_cast<int32>(Attribute);
+    if (!Ranges.IsValidIndex(Index))
+    {
+        return;
+    }
+    const FRange& Range = Ranges[Index];
+    const float Min = Range.MinAttribute ? (this->*Range.MinAttribute).GetCurrentValue() : Range.Min;
+    const float Max = Range.MaxAttribute ? (this->*Range.MaxAttribute).GetCurrentValue() : Range.Max;
+    NewValue = FMath::Clamp(NewValue, Min, Max);
+}
+
+void UPrefixSet_General::ReclampDependents(EPrefixSet_GeneralAttribute Bound)
+{
+    float Value = 0.f;
+    switch (Bound)
+    {
+    case EPrefixSet_GeneralAttribute::MaxHealth:
+        Value = GetHealth();
+        ClampAttribute(EPrefixSet_GeneralAttribute::Health, Value);
+        if (Value != GetHealth())
+        {
+            SetHealth(Value);
+        }
+        break;
+    default:
+        break;
+    }
+}
+
+void UPrefixSet_General::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UPrefixSet_General, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnHealthChanged.Broadcast(OldValue, NewValue);
+        BP_OnHealthChanged(OldValue, NewValue);
+    }
+}
+
+EPrefixSet_GeneralAttribute UPrefixSet_General::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, EPrefixSet_GeneralAttribute> Lookup = []()
+    {
+        TMap<const FProperty*, EPrefixSet_GeneralAttribute> Map;
+        Map.Reserve(2);
+        Map.Add(GetHealthAttribute().GetUProperty(), EPrefixSet_GeneralAttribute::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), EPrefixSet_GeneralAttribute::MaxHealth);
+        return Map;
+    }();
+
+    const EPrefixSet_GeneralAttribute* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : EPrefixSet_GeneralAttribute::None;
+}
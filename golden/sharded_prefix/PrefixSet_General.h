@@ -0,0 +1,74 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "AttributeSet.h"
+#include "AbilitySystemComponent.h"
+#include "GameplayEffectExtension.h"
+#include "PrefixSetAttributes.h"
+#include "PrefixSet_General.generated.h"
+
+UENUM(BlueprintType)
+enum class EPrefixSet_GeneralAttribute : uint8
+{
+    Health UMETA(DisplayName = "Health"),
+    MaxHealth UMETA(DisplayName = "MaxHealth"),
+    None UMETA(Hidden)
+};
+
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnHealthChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnMaxHealthChanged, float, OldValue, float, NewValue);
+
+// Replication estimate: 1 attributes, ~9 bytes initial, ~9 bytes per full update
+UCLASS()
+class MYGAME_API UPrefixSet_General : public UAttributeSet
+{
+    GENERATED_BODY()
+
+public:
+    UPrefixSet_General();
+
+    UFUNCTION(BlueprintPure, Category="Attributes")
+    static EPrefixSet_GeneralAttribute AttributeToEnum(const FGameplayAttribute& Attribute);
+
+    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;
+
+    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)
+    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
+
+    // Clamp to the ranges declared with min=/max=
+    virtual void PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue) override;
+    virtual void PostGameplayEffectExecute(const FGameplayEffectModCallbackData& Data) override;
+
+    // Looks the range up in a table indexed by EPrefixSet_GeneralAttribute, so clamping is O(1)
+    void ClampAttribute(EPrefixSet_GeneralAttribute Attribute, float& NewValue) const;
+
+    // Re-clamps the attributes bounded by Bound after it changed, e.g. Health when MaxHealth drops
+    void ReclampDependents(EPrefixSet_GeneralAttribute Bound);
+
+public:
+
+    UPROPERTY(BlueprintReadOnly, ReplicatedUsing = OnRep_Health, Category = "Attributes")
+    FGameplayAttributeData Health;
+    ATTRIBUTE_ACCESSORS(UPrefixSet_General, Health)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData MaxHealth;
+    ATTRIBUTE_ACCESSORS(UPrefixSet_General, MaxHealth)
+
+    // Per-attribute change events
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnHealthChanged OnHealthChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnHealthChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnMaxHealthChanged OnMaxHealthChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnMaxHealthChanged(float OldValue, float NewValue);
+
+    UFUNCTION()
+    void OnRep_Health(const FGameplayAttributeData& OldHealth);
+
+};
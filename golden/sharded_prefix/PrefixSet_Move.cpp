@@ -0,0 +1,52 @@
+#include "PrefixSet_Move.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UPrefixSet_Move::UPrefixSet_Move()
+{
+    InitMove_Speed(600.0f);
+}
+
+void UPrefixSet_Move::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+}
+
+void UPrefixSet_Move::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    switch (AttributeToEnum(Attribute))
+    {
+    case EPrefixSet_MoveAttribute::Move_Speed:
+        OnMove_SpeedChanged.Broadcast(OldValue, NewValue);
+        BP_OnMove_SpeedChanged(OldValue, NewValue);
+        break;
+    case EPrefixSet_MoveAttribute::Move_Jump:
+        OnMove_JumpChanged.Broadcast(OldValue, NewValue);
+        BP_OnMove_JumpChanged(OldValue, NewValue);
+        break;
+    default:
+        break;
+    }
+}
+
+EPrefixSet_MoveAttribute UPrefixSet_Move::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, EPrefixSet_MoveAttribute> Lookup = []()
+    {
+        TMap<const FProperty*, EPrefixSet_MoveAttribute> Map;
+        Map.Reserve(2);
+        Map.Add(GetMove_SpeedAttribute().GetUProperty(), EPrefixSet_MoveAttribute::Move_Speed);
+        Map.Add(GetMove_JumpAttribute().GetUProperty(), EPrefixSet_MoveAttribute::Move_Jump);
+        return Map;
+    }();
+
+    const EPrefixSet_MoveAttribute* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : EPrefixSet_MoveAttribute::None;
+}
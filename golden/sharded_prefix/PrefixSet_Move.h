@@ -0,0 +1,60 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "AttributeSet.h"
+#include "AbilitySystemComponent.h"
+#include "GameplayEffectExtension.h"
+#include "PrefixSetAttributes.h"
+#include "PrefixSet_Move.generated.h"
+
+UENUM(BlueprintType)
+enum class EPrefixSet_MoveAttribute : uint8
+{
+    Move_Speed UMETA(DisplayName = "Move_Speed"),
+    Move_Jump UMETA(DisplayName = "Move_Jump"),
+    None UMETA(Hidden)
+};
+
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnMove_SpeedChanged, float, OldValue, float, NewValue);
+DECLARE_DYNAMIC_MULTICAST_DELEGATE_TwoParams(FOnMove_JumpChanged, float, OldValue, float, NewValue);
+
+UCLASS()
+class MYGAME_API UPrefixSet_Move : public UAttributeSet
+{
+    GENERATED_BODY()
+
+public:
+    UPrefixSet_Move();
+
+    UFUNCTION(BlueprintPure, Category="Attributes")
+    static EPrefixSet_MoveAttribute AttributeToEnum(const FGameplayAttribute& Attribute);
+
+    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;
+
+    // Fires on server and locally-authoritative changes (GameplayEffects, SetBaseValue, etc.)
+    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
+
+public:
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Move_Speed;
+    ATTRIBUTE_ACCESSORS(UPrefixSet_Move, Move_Speed)
+
+    UPROPERTY(BlueprintReadOnly, Category = "Attributes")
+    FGameplayAttributeData Move_Jump;
+    ATTRIBUTE_ACCESSORS(UPrefixSet_Move, Move_Jump)
+
+    // Per-attribute change events
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnMove_SpeedChanged OnMove_SpeedChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnMove_SpeedChanged(float OldValue, float NewValue);
+
+    UPROPERTY(BlueprintAssignable, Category="Attributes|Events")
+    FOnMove_JumpChanged OnMove_JumpChanged;
+
+    UFUNCTION(BlueprintImplementableEvent, Category="Attributes|Events")
+    void BP_OnMove_JumpChanged(float OldValue, float NewValue);
+
+};
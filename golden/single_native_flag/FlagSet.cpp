@@ -0,0 +1,144 @@
+#include "FlagSet.h"
+#include "Net/UnrealNetwork.h"
+#include "GameplayEffectExtension.h"
+
+UFlagSet::UFlagSet()
+{
+    InitHealth(100.0f);
+    InitMaxHealth(100.0f);
+    InitMana(50.0f);
+    InitMaxMana(50.0f);
+    InitDamage(15.0f);
+    InitVoicelinePitch(1.2f);
+    InitHairLength(0.7f);
+}
+
+void UFlagSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UFlagSet, Health, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UFlagSet, MaxHealth, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UFlagSet, Mana, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME_CONDITION_NOTIFY(UFlagSet, MaxMana, COND_None, REPNOTIFY_Always);
+}
+
+void UFlagSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+
+    if (OldValue == NewValue)
+    {
+        return;
+    }
+
+    const AllAttributesEnum Changed = AttributeToEnum(Attribute);
+    if (Changed == AllAttributesEnum::None)
+    {
+        return;
+    }
+
+    OnAttributeChangedNative.Broadcast(Changed, OldValue, NewValue);
+    OnAttributeChanged.Broadcast(Changed, OldValue, NewValue);
+    if (bFireBlueprintEvents)
+    {
+        BP_OnAttributeChanged(Changed, OldValue, NewValue);
+    }
+
+    switch (Changed)
+    {
+    case AllAttributesEnum::HairLength:
+        OnHairLengthChangedNative.Broadcast(OldValue, NewValue);
+        OnHairLengthChanged.Broadcast(OldValue, NewValue);
+        if (bFireBlueprintEvents)
+        {
+            BP_OnHairLengthChanged(OldValue, NewValue);
+        }
+        break;
+    default:
+        break;
+    }
+}
+
+void UFlagSet::OnRep_Health(const FGameplayAttributeData& OldHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UFlagSet, Health, OldHealth);
+    const float OldValue = OldHealth.GetCurrentValue();
+    const float NewValue = Health.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnAttributeChangedNative.Broadcast(AllAttributesEnum::Health, OldValue, NewValue);
+        OnAttributeChanged.Broadcast(AllAttributesEnum::Health, OldValue, NewValue);
+        if (bFireBlueprintEvents)
+        {
+            BP_OnAttributeChanged(AllAttributesEnum::Health, OldValue, NewValue);
+        }
+    }
+}
+
+void UFlagSet::OnRep_MaxHealth(const FGameplayAttributeData& OldMaxHealth)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UFlagSet, MaxHealth, OldMaxHealth);
+    const float OldValue = OldMaxHealth.GetCurrentValue();
+    const float NewValue = MaxHealth.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnAttributeChangedNative.Broadcast(AllAttributesEnum::MaxHealth, OldValue, NewValue);
+        OnAttributeChanged.Broadcast(AllAttributesEnum::MaxHealth, OldValue, NewValue);
+        if (bFireBlueprintEvents)
+        {
+            BP_OnAttributeChanged(AllAttributesEnum::MaxHealth, OldValue, NewValue);
+        }
+    }
+}
+
+void UFlagSet::OnRep_Mana(const FGameplayAttributeData& OldMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UFlagSet, Mana, OldMana);
+    const float OldValue = OldMana.GetCurrentValue();
+    const float NewValue = Mana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnAttributeChangedNative.Broadcast(AllAttributesEnum::Mana, OldValue, NewValue);
+        OnAttributeChanged.Broadcast(AllAttributesEnum::Mana, OldValue, NewValue);
+        if (bFireBlueprintEvents)
+        {
+            BP_OnAttributeChanged(AllAttributesEnum::Mana, OldValue, NewValue);
+        }
+    }
+}
+
+void UFlagSet::OnRep_MaxMana(const FGameplayAttributeData& OldMaxMana)
+{
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UFlagSet, MaxMana, OldMaxMana);
+    const float OldValue = OldMaxMana.GetCurrentValue();
+    const float NewValue = MaxMana.GetCurrentValue();
+    if (OldValue != NewValue)
+    {
+        OnAttributeChangedNative.Broadcast(AllAttributesEnum::MaxMana, OldValue, NewValue);
+        OnAttributeChanged.Broadcast(AllAttributesEnum::MaxMana, OldValue, NewValue);
+        if (bFireBlueprintEvents)
+        {
+            BP_OnAttributeChanged(AllAttributesEnum::MaxMana, OldValue, NewValue);
+        }
+    }
+}
+
+AllAttributesEnum UFlagSet::AttributeToEnum(const FGameplayAttribute& Attribute)
+{
+    static const TMap<const FProperty*, AllAttributesEnum> Lookup = []()
+    {
+        TMap<const FProperty*, AllAttributesEnum> Map;
+        Map.Reserve(7);
+        Map.Add(GetHealthAttribute().GetUProperty(), AllAttributesEnum::Health);
+        Map.Add(GetMaxHealthAttribute().GetUProperty(), AllAttributesEnum::MaxHealth);
+        Map.Add(GetManaAttribute().GetUProperty(), AllAttributesEnum::Mana);
+        Map.Add(GetMaxManaAttribute().GetUProperty(), AllAttributesEnum::MaxMana);
+        Map.Add(GetDamageAttribute().GetUProperty(), AllAttributesEnum::Damage);
+        Map.Add(GetVoicelinePitchAttribute().GetUProperty(), AllAttributesEnum::VoicelinePitch);
+        Map.Add(GetHairLengthAttribute().GetUProperty(), AllAttributesEnum::HairLength);
+        return Map;
+    }();
+
+    const AllAttributesEnum* Found = Lookup.Find(Attribute.GetUProperty());
+    return Found ? *Found : AllAttributesEnum::None;
+}
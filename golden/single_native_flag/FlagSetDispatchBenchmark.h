@@ -0,0 +1,63 @@
+#pragma once
+
+#include "CoreMinimal.h"
+#include "GameFramework/Actor.h"
+#include "HAL/PlatformTime.h"
+#include "FlagSet.h"
+#include "FlagSetDispatchBenchmark.generated.h"
+
+// Times one attribute change through each dispatch path of UFlagSet and logs the cost per change.
+// Place it in a level and compare a client or editor run with a dedicated server build.
+UCLASS()
+class MYGAME_API AFlagSetDispatchBenchmark : public AActor
+{
+    GENERATED_BODY()
+
+public:
+    UPROPERTY(EditAnywhere, Category="Benchmark")
+    int32 Iterations = 100000;
+
+    virtual void BeginPlay() override
+    {
+        Super::BeginPlay();
+
+        Set = NewObject<UFlagSet>(this);
+        Set->OnAttributeChanged.AddDynamic(this, &AFlagSetDispatchBenchmark::OnDynamicChanged);
+        Set->OnAttributeChangedNative.AddUObject(this, &AFlagSetDispatchBenchmark::OnNativeChanged);
+
+        Measure(TEXT("PostAttributeChange"), [this](float Value) { Set->PostAttributeChange(UFlagSet::GetHealthAttribute(), Value, Value + 1.f); });
+        Measure(TEXT("Dynamic delegate"), [this](float Value) { Set->OnAttributeChanged.Broadcast(AllAttributesEnum::Health, Value, Value + 1.f); });
+        Measure(TEXT("Native delegate"), [this](float Value) { Set->OnAttributeChangedNative.Broadcast(AllAttributesEnum::Health, Value, Value + 1.f); });
+        Measure(TEXT("Blueprint event"), [this](float Value) { Set->BP_OnAttributeChanged(AllAttributesEnum::Health, Value, Value + 1.f); });
+        UE_LOG(LogTemp, Display, TEXT("%s: %d listener calls"), *GetName(), Calls);
+    }
+
+    UFUNCTION()
+    void OnDynamicChanged(AllAttributesEnum Attribute, float OldValue, float NewValue)
+    {
+        ++Calls;
+    }
+
+private:
+    void OnNativeChanged(AllAttributesEnum Attribute, float OldValue, float NewValue)
+    {
+        ++Calls;
+    }
+
+    template <typename FunctionType>
+    void Measure(const TCHAR* Name, FunctionType&& Change)
+    {
+        const double Start = FPlatformTime::Seconds();
+        for (int32 Index = 0; Index < Iterations; ++Index)
+        {
+            Change(static_cast<float>(Index));
+        }
+        const double Nanoseconds = (FPlatformTime::Seconds() - Start) * 1e9 / FMath::Max(Iterations, 1);
+        UE_LOG(LogTemp, Display, TEXT("%s: %-20s %8.1f ns per change"), *GetName(), Name, Nanoseconds);
+    }
+
+    UPROPERTY(Transient)
+    UFlagSet* Set = nullptr;
+
+    int32 Calls = 0;
+};